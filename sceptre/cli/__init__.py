@@ -33,6 +33,10 @@ from sceptre.cli.template import (
     fetch_remote_template_command,
 )
 from sceptre.cli.update import update_command
+from sceptre.connection_manager import ConnectionManager
+from sceptre.output_cache import StackOutputCache
+from sceptre.output_snapshot import DEFAULT_SNAPSHOT_TTL, StackOutputSnapshot
+from sceptre.resolver_stats import ResolverStats
 
 
 @click.group()
@@ -68,6 +72,60 @@ from sceptre.cli.update import update_command
     default=False,
     help="Merge variables from successive --vars and var files",
 )
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    help="The maximum number of stacks to act on at the same time.",
+)
+@click.option(
+    "--max-concurrency-per-region",
+    type=click.IntRange(min=1),
+    help="The maximum number of stacks to act on at the same time in one account and region.",
+)
+@click.option(
+    "--max-concurrency-per-role",
+    type=click.IntRange(min=1),
+    help="The maximum number of stacks to act on at the same time with one sceptre_role or profile.",
+)
+@click.option(
+    "--cache-credentials",
+    is_flag=True,
+    envvar="SCEPTRE_CACHE_CREDENTIALS",
+    help="Keep assumed sceptre_role credentials on disk, to reuse them in later runs.",
+)
+@click.option(
+    "--outputs-snapshot",
+    is_flag=True,
+    envvar="SCEPTRE_OUTPUTS_SNAPSHOT",
+    help="Keep stack outputs on disk, and resolve outputs from them in later runs.",
+)
+@click.option(
+    "--outputs-snapshot-ttl",
+    type=click.IntRange(min=0),
+    default=DEFAULT_SNAPSHOT_TTL,
+    show_default=True,
+    envvar="SCEPTRE_OUTPUTS_SNAPSHOT_TTL",
+    help="How long, in seconds, outputs kept by --outputs-snapshot are used for.",
+)
+@click.option(
+    "--duration-history",
+    type=click.Path(dir_okay=False),
+    envvar="SCEPTRE_DURATION_HISTORY",
+    help="The file to keep how long each stack took in. Defaults to "
+    ".sceptre/stack_durations.json in the project directory.",
+)
+@click.option(
+    "--no-duration-history",
+    is_flag=True,
+    envvar="SCEPTRE_NO_DURATION_HISTORY",
+    help="Do not read or record how long each stack took.",
+)
+@click.option(
+    "--resolver-report",
+    type=click.Path(dir_okay=False),
+    envvar="SCEPTRE_RESOLVER_REPORT",
+    help="Write the number of calls and time taken of each resolver on each stack to a JSON file.",
+)
 @click.pass_context
 @catch_exceptions
 def cli(
@@ -80,17 +138,42 @@ def cli(
     var_file,
     ignore_dependencies,
     merge_vars,
+    max_concurrency,
+    max_concurrency_per_region,
+    max_concurrency_per_role,
+    cache_credentials,
+    outputs_snapshot,
+    outputs_snapshot_ttl,
+    duration_history,
+    no_duration_history,
+    resolver_report,
 ):
     """
     Sceptre is a tool to manage your cloud native infrastructure deployments.
     """
     colorama.init()
+    if cache_credentials:
+        ConnectionManager.enable_credential_cache()
+    project_path = directory if directory else os.getcwd()
+    if outputs_snapshot:
+        StackOutputCache.enable_snapshot(
+            StackOutputSnapshot.for_project(project_path, outputs_snapshot_ttl)
+        )
+    if resolver_report:
+        ResolverStats.enable_report(resolver_report)
     ctx.obj = {
         "user_variables": setup_vars(var_file, var, merge_vars, debug, no_colour),
         "output_format": output,
         "no_colour": no_colour,
         "ignore_dependencies": ignore_dependencies,
-        "project_path": directory if directory else os.getcwd(),
+        "project_path": project_path,
+        "options": {
+            "max_concurrency": max_concurrency,
+            "max_concurrency_per_region": max_concurrency_per_region,
+            "max_concurrency_per_role": max_concurrency_per_role,
+            "duration_history": duration_history,
+            "no_duration_history": no_duration_history,
+        },
     }
 
 
@@ -8,9 +8,9 @@ acyclic graph of a Stack's dependencies.
 """
 
 import logging
-from typing import List
+from array import array
+from typing import Dict, Iterable, List
 
-import networkx as nx
 from sceptre.exceptions import CircularDependenciesError
 from sceptre.stack import Stack
 
@@ -20,6 +20,10 @@ class StackGraph(object):
     A Directed Acyclic Graph representing the relationship between a Stack
     and its dependencies. Responsible for initalising the graph based on a set
     of Stacks.
+
+    Each Stack in the graph is given an integer ID, and the edges are held as
+    arrays of IDs: the Stacks each Stack depends on, and the Stacks that depend
+    on it. An edge goes from a dependency to the Stack that depends on it.
     """
 
     def __init__(self, stacks):
@@ -30,25 +34,49 @@ class StackGraph(object):
         :type stacks: set
         """
         self.logger = logging.getLogger(__name__)
-        self.graph = nx.DiGraph()
+        self._ids: Dict[Stack, int] = {}
+        self._stacks: List[Stack] = []
+        self._dependencies: List[array] = []
+        self._dependents: List[array] = []
         self._generate_graph(stacks)
 
     def __repr__(self):
-        return str(nx.convert.to_dict_of_lists(self.graph))
+        return str(
+            {
+                stack: [self._stacks[dependent] for dependent in self._dependents[id_]]
+                for stack, id_ in self._ids.items()
+            }
+        )
 
     def __iter__(self):
-        return self.graph.__iter__()
+        return iter(list(self._ids))
+
+    def __len__(self):
+        return len(self._ids)
 
     def filtered(self, source_stacks, reverse=False):
-        graph = (nx.reverse if reverse else nx.DiGraph)(self.graph)
+        """
+        Returns a StackGraph of the source Stacks and every Stack they depend on, or every Stack
+        that depends on them if ``reverse`` is True. The Stacks are found with a single traversal
+        from all the source Stacks at once.
+        """
+        dependencies = self._dependents if reverse else self._dependencies
 
-        relevant = set(source_stacks)
-        for stack in source_stacks:
-            relevant |= nx.algorithms.dag.ancestors(graph, stack)
-        graph.remove_nodes_from({stack for stack in graph if stack not in relevant})
+        relevant = {self._ids[stack] for stack in source_stacks}
+        to_visit = list(relevant)
+        while to_visit:
+            for dependency in dependencies[to_visit.pop()]:
+                if dependency not in relevant:
+                    relevant.add(dependency)
+                    to_visit.append(dependency)
 
         filtered = StackGraph(set())
-        filtered.graph = graph
+        for stack, id_ in self._ids.items():
+            if id_ in relevant:
+                filtered._add_stack(stack)
+        for id_ in relevant:
+            for dependency in dependencies[id_]:
+                filtered._add_edge(self._stacks[dependency], self._stacks[id_])
 
         return filtered
 
@@ -58,7 +86,14 @@ class StackGraph(object):
         StackGraph. The number of incoming edge also represents the number
         of Stacks that depend on the given Stack.
         """
-        return self.graph.in_degree(stack)
+        return len(self._dependencies[self._ids[stack]])
+
+    def dependents(self, stack):
+        """
+        Returns the Stacks that have an incoming edge from a given Stack in the
+        StackGraph, which are the Stacks it is a dependency of.
+        """
+        return [self._stacks[id_] for id_ in self._dependents[self._ids[stack]]]
 
     def remove_stack(self, stack):
         """
@@ -66,7 +101,29 @@ class StackGraph(object):
         all adjecent edges that represent a 'depends on' relationship with
         other Stacks.
         """
-        return self.graph.remove_node(stack)
+        id_ = self._ids.pop(stack)
+        for dependency in self._dependencies[id_]:
+            self._dependents[dependency].remove(id_)
+        for dependent in self._dependents[id_]:
+            if dependent != id_:
+                self._dependencies[dependent].remove(id_)
+        self._dependencies[id_] = array("l")
+        self._dependents[id_] = array("l")
+
+    def to_networkx(self):
+        """
+        Returns the StackGraph as a ``networkx.DiGraph``, for exporting or
+        visualising it. networkx is only imported when this is called.
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self._ids)
+        for stack in self._ids:
+            graph.add_edges_from(
+                (stack, dependent) for dependent in self.dependents(stack)
+            )
+        return graph
 
     def _generate_graph(self, stacks):
         """
@@ -74,11 +131,12 @@ class StackGraph(object):
 
         :param stacks: A set of Stacks
         :type stacks: set
+        :raises: sceptre.exceptions.CircularDependenciesError
         """
 
         for stack in stacks:
             self._generate_edges(stack, stack.dependencies)
-        self.graph.remove_edges_from(nx.selfloop_edges(self.graph))
+        self._check_for_cycles()
 
     def _generate_edges(self, stack: Stack, dependencies: List[Stack]):
         """
@@ -91,17 +149,119 @@ class StackGraph(object):
         :param dependencies: a collection of dependency paths
         """
         self.logger.debug(f"Generate dependencies for stack {stack}")
+        self._add_stack(stack)
         for dependency in set(dependencies):
-            self.graph.add_edge(dependency, stack)
-            try:
-                cycle = nx.find_cycle(self.graph, orientation="original")
-                cycle_str = ", ".join([f"{edge[0]} -> {edge[1]}" for edge in cycle])
-                raise CircularDependenciesError(
-                    f"Dependency cycle detected: {cycle_str}"
-                )
-            except nx.NetworkXNoCycle:
-                pass  # No cycle, continue
+            self._add_edge(dependency, stack)
             self.logger.debug(f"  Added dependency: {dependency}")
 
-        if not dependencies:
-            self.graph.add_node(stack)
+    def _add_stack(self, stack: Stack) -> int:
+        """
+        Adds a Stack to the graph, if it isn't in it already.
+
+        :returns: The ID of the Stack.
+        """
+        id_ = self._ids.get(stack)
+        if id_ is None:
+            id_ = self._ids[stack] = len(self._stacks)
+            self._stacks.append(stack)
+            self._dependencies.append(array("l"))
+            self._dependents.append(array("l"))
+        return id_
+
+    def _add_edge(self, dependency: Stack, stack: Stack):
+        """
+        Adds an edge from a dependency to the Stack that depends on it.
+        """
+        dependency_id = self._add_stack(dependency)
+        stack_id = self._add_stack(stack)
+        self._dependencies[stack_id].append(dependency_id)
+        self._dependents[dependency_id].append(stack_id)
+
+    def _check_for_cycles(self):
+        """
+        Checks the whole graph for dependency cycles at once. Every group of Stacks that depend
+        on each other is a strongly connected component of the graph, and one cycle through each
+        of them is reported.
+
+        :raises: sceptre.exceptions.CircularDependenciesError
+        """
+        cycles = []
+        for component in self._strongly_connected_components():
+            if (
+                len(component) == 1
+                and component[0] not in self._dependents[component[0]]
+            ):
+                continue
+            path = self._find_cycle(set(component))
+            cycles.append(" -> ".join(str(self._stacks[id_]) for id_ in path))
+
+        if cycles:
+            raise CircularDependenciesError(
+                "Dependency cycle detected: {0}".format("; ".join(sorted(cycles)))
+            )
+
+    def _strongly_connected_components(self) -> Iterable[List[int]]:
+        """
+        Yields the IDs of the Stacks in each strongly connected component of the graph, using an
+        iterative version of Tarjan's algorithm.
+        """
+        indices = [-1] * len(self._stacks)
+        lowlinks = [0] * len(self._stacks)
+        on_stack = [False] * len(self._stacks)
+        stack = []
+        counter = 0
+
+        for root in self._ids.values():
+            if indices[root] >= 0:
+                continue
+            indices[root] = lowlinks[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(self._dependents[root]))]
+
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if indices[child] < 0:
+                        indices[child] = lowlinks[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = True
+                        work.append((child, iter(self._dependents[child])))
+                        break
+                    if on_stack[child]:
+                        lowlinks[node] = min(lowlinks[node], indices[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlinks[parent] = min(lowlinks[parent], lowlinks[node])
+                    if lowlinks[node] == indices[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        yield component
+
+    def _find_cycle(self, component: set) -> List[int]:
+        """
+        Returns the IDs of the Stacks on a cycle through a strongly connected component, starting
+        and ending with the same Stack. Every Stack in the component has an edge to another Stack
+        in it, so following those edges must come back to a Stack already visited.
+        """
+        path = []
+        positions = {}
+        id_ = min(component)
+        while id_ not in positions:
+            positions[id_] = len(path)
+            path.append(id_)
+            id_ = next(
+                dependent
+                for dependent in self._dependents[id_]
+                if dependent in component
+            )
+        return path[positions[id_] :] + [id_]
@@ -156,6 +156,12 @@ class ConfigReader(object):
 
         self.templating_vars = {"var": self.context.user_variables}
 
+        # Jinja environments are shared by every config file in a directory that is rendered
+        # with the same j2_environment config, and each config file is only compiled once, however
+        # many Stacks inherit it.
+        self._j2_environments = {}
+        self._j2_templates = {}
+
     @staticmethod
     def _iterate_entry_points(group):
         """
@@ -468,22 +474,12 @@ class ConfigReader(object):
         if not path.isfile(path.join(abs_directory_path, basename)):
             return
 
-        default_j2_environment_config = {
-            "autoescape": select_autoescape(
-                disabled_extensions=("yaml",),
-                default=True,
-            ),
-            "loader": FileSystemLoader(abs_directory_path),
-            "undefined": StrictUndefined,
-        }
-        j2_environment_config = strategies.dict_merge(
-            default_j2_environment_config,
-            stack_group_config.get("j2_environment", {}),
-        )
-        j2_environment = Environment(**j2_environment_config)
-
         try:
-            template = j2_environment.get_template(basename)
+            template = self._get_template(
+                abs_directory_path,
+                basename,
+                stack_group_config.get("j2_environment", {}),
+            )
         except Exception as err:
             raise SceptreException(
                 f"{Path(directory_path, basename).as_posix()} - {err}"
@@ -523,6 +519,47 @@ class ConfigReader(object):
 
         return config
 
+    def _get_template(self, abs_directory_path, basename, j2_environment):
+        """
+        Returns the compiled template of a config file, compiling it if it has not been yet.
+
+        :param abs_directory_path: Absolute path of the directory the config file is in.
+        :type abs_directory_path: str
+        :param basename: The filename of the config file
+        :type basename: str
+        :param j2_environment: The j2_environment config of the StackGroup
+        :type j2_environment: dict
+        :returns: The compiled template.
+        :rtype: jinja2.Template
+        """
+        environment_key = (
+            abs_directory_path,
+            json.dumps(j2_environment, sort_keys=True, default=repr),
+        )
+        template_key = environment_key + (basename,)
+        if template_key in self._j2_templates:
+            return self._j2_templates[template_key]
+
+        j2_environment_instance = self._j2_environments.get(environment_key)
+        if j2_environment_instance is None:
+            default_j2_environment_config = {
+                "autoescape": select_autoescape(
+                    disabled_extensions=("yaml",),
+                    default=True,
+                ),
+                "loader": FileSystemLoader(abs_directory_path),
+                "undefined": StrictUndefined,
+            }
+            j2_environment_config = strategies.dict_merge(
+                default_j2_environment_config, j2_environment
+            )
+            j2_environment_instance = Environment(**j2_environment_config)
+            self._j2_environments[environment_key] = j2_environment_instance
+
+        template = j2_environment_instance.get_template(basename)
+        self._j2_templates[template_key] = template
+        return template
+
     @staticmethod
     def _check_valid_project_path(config_path):
         """
@@ -6,6 +6,7 @@ This module implements a ConnectionManager class, which simplifies and manages
 Boto3 calls.
 """
 
+import datetime
 import functools
 import logging
 import os
@@ -13,15 +14,26 @@ import random
 import threading
 import time
 import warnings
-from typing import Optional, Dict, Tuple, Any
+from typing import Optional, Dict, Tuple, Any, Callable
 
 import boto3
+import botocore.session
 import deprecation
-from botocore.credentials import Credentials
+from botocore.config import Config
+from botocore.credentials import Credentials, RefreshableCredentials
 from botocore.exceptions import ClientError
 
+from sceptre.credential_cache import (
+    DEFAULT_CREDENTIAL_CACHE_DIRECTORY,
+    AssumedRoleCredentialCache,
+)
 from sceptre.exceptions import InvalidAWSCredentialsError, RetryLimitExceededError
 from sceptre.helpers import mask_key, create_deprecated_alias_property
+from sceptre.rate_limiter import RateLimiter
+
+# The number of sessions and clients kept before the least recently used are discarded.
+MAX_CACHED_SESSIONS = 64
+MAX_CACHED_CLIENTS = 256
 
 
 def _retry_boto_call(func):
@@ -72,6 +84,44 @@ def _retry_boto_call(func):
     return decorated
 
 
+def _get_cached(cache: dict, key):
+    """
+    Returns a value from a cache, marking it as the most recently used.
+    """
+    value = cache.pop(key, None)
+    if value is not None:
+        cache[key] = value
+    return value
+
+
+def _credential_metadata(credentials: dict) -> dict:
+    """
+    Converts the credentials returned by ``sts:AssumeRole`` into the form used by botocore's
+    RefreshableCredentials.
+    """
+    expiration = credentials["Expiration"]
+    return {
+        "access_key": credentials["AccessKeyId"],
+        "secret_key": credentials["SecretAccessKey"],
+        "token": credentials["SessionToken"],
+        "expiry_time": (
+            expiration.isoformat()
+            if isinstance(expiration, datetime.datetime)
+            else expiration
+        ),
+    }
+
+
+def _set_cached(cache: dict, key, value, max_size: int):
+    """
+    Adds a value to a cache, discarding the least recently used values above max_size.
+    """
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > max_size:
+        del cache[next(iter(cache))]
+
+
 class ConnectionManager(object):
     """
     The Connection Manager is used to create boto3 clients for
@@ -82,6 +132,8 @@ class ConnectionManager(object):
     :param stack_name: The CloudFormation stack name for this connection.
     :param region: The region to use.
     :param sceptre_role_session_duration: The duration to assume the specified sceptre_role per session.
+    :param rate_limits: The rate limits configured for the stack, overriding the defaults of the
+        shared RateLimiter.
     """
 
     # STACK_DEFAULT is a sentinel value meaning "default to the stack's configuration". This is in
@@ -90,9 +142,17 @@ class ConnectionManager(object):
 
     _session_lock = threading.Lock()
     _client_lock = threading.Lock()
+    _key_locks_lock = threading.Lock()
+    _key_locks = {}
     _boto_sessions = {}
     _clients = {}
     _stack_keys = {}
+    _rate_limiter = RateLimiter()
+    # Clients are shared by all the threads using the same settings, so their connection pools
+    # need to be big enough for all of them. This is raised to the executor's concurrency.
+    _max_pool_connections = 10
+    # When set, the credentials of assumed sceptre_roles are kept on disk between invocations.
+    _credential_cache: Optional[AssumedRoleCredentialCache] = None
 
     iam_role = create_deprecated_alias_property(
         "iam_role", "sceptre_role", "4.0.0", "5.0.0"
@@ -110,6 +170,7 @@ class ConnectionManager(object):
         sceptre_role: Optional[str] = None,
         sceptre_role_session_duration: Optional[int] = None,
         *,
+        rate_limits: Optional[Dict[str, dict]] = None,
         session_class=boto3.Session,
         get_envs_func=lambda: os.environ,
     ):
@@ -120,6 +181,7 @@ class ConnectionManager(object):
         self.stack_name = stack_name
         self.sceptre_role = sceptre_role
         self.sceptre_role_session_duration = sceptre_role_session_duration
+        self.rate_limits = rate_limits
 
         if stack_name:
             self._stack_keys[stack_name] = (region, profile, sceptre_role)
@@ -280,101 +342,246 @@ class ConnectionManager(object):
             self._emit_iam_role_deprecation_warning()
             sceptre_role = iam_role
 
+        self.logger.debug("Getting Boto3 session")
+        key = (region, profile, sceptre_role)
         with self._session_lock:
-            self.logger.debug("Getting Boto3 session")
-            key = (region, profile, sceptre_role)
-
-            if self._boto_sessions.get(key) is None:
-                self.logger.debug("No Boto3 session found, creating one...")
-                self.logger.debug("Using cli credentials...")
-                environ = self._get_envs()
-                # Credentials from env take priority over profile
-                config = {
-                    "profile_name": profile,
-                    "region_name": region,
-                    "aws_access_key_id": environ.get("AWS_ACCESS_KEY_ID"),
-                    "aws_secret_access_key": environ.get("AWS_SECRET_ACCESS_KEY"),
-                    "aws_session_token": environ.get("AWS_SESSION_TOKEN"),
-                }
-
-                session = self._session_class(**config)
-                self._boto_sessions[key] = session
-
-                if session.get_credentials() is None:
-                    raise InvalidAWSCredentialsError(
-                        "Session credentials were not found. Profile: {0}. Region: {1}.".format(
-                            config["profile_name"], config["region_name"]
-                        )
-                    )
-
-                if sceptre_role:
-                    sts_client = session.client("sts")
-                    # maximum session name length is 64 chars. 56 + "-session" = 64
-                    session_name = f'{sceptre_role.split("/")[-1][:56]}-session'
-                    assume_role_kwargs = {
-                        "RoleArn": sceptre_role,
-                        "RoleSessionName": session_name,
-                    }
-                    if self.sceptre_role_session_duration:
-                        assume_role_kwargs["DurationSeconds"] = (
-                            self.sceptre_role_session_duration
-                        )
-                    sts_response = sts_client.assume_role(**assume_role_kwargs)
-
-                    credentials = sts_response["Credentials"]
-                    session = self._session_class(
-                        aws_access_key_id=credentials["AccessKeyId"],
-                        aws_secret_access_key=credentials["SecretAccessKey"],
-                        aws_session_token=credentials["SessionToken"],
-                        region_name=region,
-                    )
+            session = _get_cached(self._boto_sessions, key)
+        if session is not None:
+            return session
+
+        # Only threads needing a session with the same settings wait here, so sessions for
+        # different roles are assumed in parallel.
+        with self._lock_for(("session",) + key):
+            with self._session_lock:
+                session = _get_cached(self._boto_sessions, key)
+            if session is None:
+                session = self._create_session(profile, region, sceptre_role)
+                with self._session_lock:
+                    _set_cached(self._boto_sessions, key, session, MAX_CACHED_SESSIONS)
+
+        return session
+
+    def _create_session(
+        self,
+        profile: Optional[str],
+        region: Optional[str],
+        sceptre_role: Optional[str],
+    ) -> boto3.Session:
+        self.logger.debug("No Boto3 session found, creating one...")
+        self.logger.debug("Using cli credentials...")
+        environ = self._get_envs()
+        # Credentials from env take priority over profile
+        config = {
+            "profile_name": profile,
+            "region_name": region,
+            "aws_access_key_id": environ.get("AWS_ACCESS_KEY_ID"),
+            "aws_secret_access_key": environ.get("AWS_SECRET_ACCESS_KEY"),
+            "aws_session_token": environ.get("AWS_SESSION_TOKEN"),
+        }
+
+        session = self._session_class(**config)
+
+        if session.get_credentials() is None:
+            raise InvalidAWSCredentialsError(
+                "Session credentials were not found. Profile: {0}. Region: {1}.".format(
+                    config["profile_name"], config["region_name"]
+                )
+            )
 
-                    if session.get_credentials() is None:
-                        raise InvalidAWSCredentialsError(
-                            "Session credentials were not found. Role: {0}. Region: {1}.".format(
-                                sceptre_role, region
-                            )
-                        )
-
-                    self._boto_sessions[key] = session
-
-                self.logger.debug(
-                    "Using credential set from %s: %s",
-                    session.get_credentials().method,
-                    {
-                        "AccessKeyId": mask_key(session.get_credentials().access_key),
-                        "SecretAccessKey": mask_key(
-                            session.get_credentials().secret_key
+        if sceptre_role:
+            source_session = session
+            credentials = self._get_cached_credentials(profile, region, sceptre_role)
+            if credentials:
+                # Cached credentials may expire part way through the run, so the role is assumed
+                # again whenever they are about to.
+                session = self._session_class(
+                    botocore_session=self._refreshable_botocore_session(
+                        credentials,
+                        lambda: self._assume_role(
+                            source_session, profile, region, sceptre_role
                         ),
-                        "Region": session.region_name,
-                    },
+                    ),
+                    region_name=region,
                 )
+            else:
+                credentials = self._assume_role(session, profile, region, sceptre_role)
+                session = self._session_class(
+                    aws_access_key_id=credentials["AccessKeyId"],
+                    aws_secret_access_key=credentials["SecretAccessKey"],
+                    aws_session_token=credentials["SessionToken"],
+                    region_name=region,
+                )
+
+            if session.get_credentials() is None:
+                raise InvalidAWSCredentialsError(
+                    "Session credentials were not found. Role: {0}. Region: {1}.".format(
+                        sceptre_role, region
+                    )
+                )
+
+        self.logger.debug(
+            "Using credential set from %s: %s",
+            session.get_credentials().method,
+            {
+                "AccessKeyId": mask_key(session.get_credentials().access_key),
+                "SecretAccessKey": mask_key(session.get_credentials().secret_key),
+                "Region": session.region_name,
+            },
+        )
+
+        self.logger.debug("Boto3 session created")
+        return session
+
+    def _get_cached_credentials(
+        self,
+        profile: Optional[str],
+        region: Optional[str],
+        sceptre_role: str,
+    ) -> Optional[dict]:
+        """
+        Returns the cached credentials for the sceptre_role, if the credential cache is enabled
+        and has some that are still valid.
+        """
+        cache = self._credential_cache
+        if not cache:
+            return None
+        credentials = cache.get(
+            cache.key(sceptre_role, profile, region, self.sceptre_role_session_duration)
+        )
+        if credentials:
+            self.logger.debug("Using cached credentials for %s", sceptre_role)
+        return credentials
+
+    @staticmethod
+    def _refreshable_botocore_session(
+        credentials: dict, refresh: Callable[[], dict]
+    ) -> botocore.session.Session:
+        """
+        Returns a botocore session using credentials that are replaced by calling ``refresh``
+        shortly before they expire.
+
+        :param credentials: The ``Credentials`` of an ``sts:AssumeRole`` response.
+        :param refresh: Returns new credentials in the same form.
+        """
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+            metadata=_credential_metadata(credentials),
+            refresh_using=lambda: _credential_metadata(refresh()),
+            method="sts-assume-role",
+        )
+        return botocore_session
+
+    def _assume_role(
+        self,
+        session: boto3.Session,
+        profile: Optional[str],
+        region: Optional[str],
+        sceptre_role: str,
+    ) -> dict:
+        """
+        Assumes the sceptre_role, and caches its credentials if the credential cache is enabled.
+        """
+        sts_client = session.client("sts")
+        # maximum session name length is 64 chars. 56 + "-session" = 64
+        session_name = f'{sceptre_role.split("/")[-1][:56]}-session'
+        assume_role_kwargs = {
+            "RoleArn": sceptre_role,
+            "RoleSessionName": session_name,
+        }
+        if self.sceptre_role_session_duration:
+            assume_role_kwargs["DurationSeconds"] = self.sceptre_role_session_duration
+        credentials = sts_client.assume_role(**assume_role_kwargs)["Credentials"]
+
+        cache = self._credential_cache
+        if cache:
+            cache.set(
+                cache.key(
+                    sceptre_role, profile, region, self.sceptre_role_session_duration
+                ),
+                credentials,
+            )
+        return credentials
 
-                self.logger.debug("Boto3 session created")
+    @classmethod
+    def enable_credential_cache(cls, directory: Optional[str] = None):
+        """
+        Keeps the credentials of assumed sceptre_roles on disk, so that later invocations of
+        Sceptre can reuse them instead of assuming the roles again.
 
-            return self._boto_sessions[key]
+        :param directory: The directory to keep the credentials in. Defaults to
+            ``~/.aws/sceptre/cache``.
+        """
+        cls._credential_cache = AssumedRoleCredentialCache(
+            directory or DEFAULT_CREDENTIAL_CACHE_DIRECTORY
+        )
 
-    def _get_client(self, service, region, profile, stack_name, sceptre_role):
+    @classmethod
+    def _lock_for(cls, key: tuple) -> threading.Lock:
+        """
+        Returns the lock used to create the session or clients for a single set of settings.
+        """
+        with cls._key_locks_lock:
+            return cls._key_locks.setdefault(key, threading.Lock())
+
+    @classmethod
+    def set_max_pool_connections(cls, max_pool_connections: int):
+        """
+        Makes sure clients can hold at least max_pool_connections open connections, so that the
+        threads sharing a client do not wait for a connection.
+
+        The pool size of a client is fixed when it is created, so if the limit grows, the cached
+        clients are dropped and created again with the new limit when they are next needed.
+
+        :param max_pool_connections: The number of threads that may use a client at once.
+        """
+        with cls._client_lock:
+            if max_pool_connections <= cls._max_pool_connections:
+                return
+            cls._max_pool_connections = max_pool_connections
+            if cls._clients:
+                logging.getLogger(__name__).debug(
+                    "Recreating clients with %d connections", max_pool_connections
+                )
+                cls._clients.clear()
+
+    def _get_client(self, service, region, profile, sceptre_role):
         """
         Returns the Boto3 client associated with <service>.
 
         Equivalent to calling Boto3.client(<service>). Gets the client using
-        ``boto_session``.
+        ``boto_session``. Clients are shared by every Stack using the same region,
+        profile and sceptre_role.
 
         :param service: The Boto3 service to return a client for.
         :type service: str
         :returns: The Boto3 client.
         :rtype: boto3.client.Client
         """
+        key = (service, region, profile, sceptre_role)
         with self._client_lock:
-            key = (service, region, profile, stack_name, sceptre_role)
-            if self._clients.get(key) is None:
+            client = _get_cached(self._clients, key)
+        if client is not None:
+            return client
+
+        session = self._get_session(profile, region, sceptre_role)
+        # Boto3 sessions are not thread-safe, so clients are created from one session at a time.
+        with self._lock_for(("client", region, profile, sceptre_role)):
+            with self._client_lock:
+                client = _get_cached(self._clients, key)
+                max_pool_connections = self._max_pool_connections
+            if client is None:
                 self.logger.debug("No %s client found, creating one...", service)
-                self._clients[key] = self._get_session(
-                    profile, region, sceptre_role
-                ).client(service)
+                client = session.client(
+                    service,
+                    config=Config(max_pool_connections=max_pool_connections),
+                )
+                with self._client_lock:
+                    # The limit may have grown while the client was being created, in which case
+                    # the client is too small to be shared.
+                    if max_pool_connections == self._max_pool_connections:
+                        _set_cached(self._clients, key, client, MAX_CACHED_CLIENTS)
 
-            return self._clients[key]
+        return client
 
     @_retry_boto_call
     def call(
@@ -418,6 +625,49 @@ class ConnectionManager(object):
         :param iam_role: DEPRECATED. Use sceptre_role instead.
         :returns: The response from the Boto3 call.
         """
+        profile, region, sceptre_role = self.get_call_settings(
+            profile, region, stack_name, sceptre_role, iam_role=iam_role
+        )
+
+        if kwargs is None:  # pragma: no cover
+            kwargs = {}
+
+        client = self._get_client(service, region, profile, sceptre_role)
+        bucket = self._rate_limiter.get_bucket(
+            sceptre_role or profile, region, service, command, self.rate_limits
+        )
+        if bucket is None:
+            return getattr(client, command)(**kwargs)
+
+        waited = bucket.acquire()
+        if waited:
+            self.logger.debug(
+                "Rate limited %s.%s for %.2f seconds", service, command, waited
+            )
+        try:
+            response = getattr(client, command)(**kwargs)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "Throttling":
+                bucket.throttled()
+            raise
+        bucket.succeeded()
+        return response
+
+    def get_call_settings(
+        self,
+        profile: Optional[str] = STACK_DEFAULT,
+        region: Optional[str] = STACK_DEFAULT,
+        stack_name: Optional[str] = None,
+        sceptre_role: Optional[str] = STACK_DEFAULT,
+        *,
+        iam_role: Optional[str] = STACK_DEFAULT,
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Returns the profile, region and sceptre_role that ``call`` would use when passed these
+        arguments. See ``call`` for how each of them is interpreted.
+
+        :returns: The profile, region and sceptre_role, in that order.
+        """
         # If stack_name has been specified and we've already cached the region/profile/role
         # configured for that stack, the "defaults" we'll use will be those of that stack rather then
         # the defaults for the current ConnectionManager instance.
@@ -460,11 +710,7 @@ class ConnectionManager(object):
                 profile, region, sceptre_role, iam_role
             )
 
-        if kwargs is None:  # pragma: no cover
-            kwargs = {}
-
-        client = self._get_client(service, region, profile, stack_name, sceptre_role)
-        return getattr(client, command)(**kwargs)
+        return profile, region, sceptre_role
 
     def _coalesce_sceptre_role(self, iam_role: str, sceptre_role: str) -> str:
         """Evaluates the iam_role and sceptre_role parameters as passed to determine which value to
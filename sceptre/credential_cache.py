@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+sceptre.credential_cache
+
+This module implements an AssumedRoleCredentialCache, which keeps the credentials of
+assumed sceptre_roles on disk so that later invocations of Sceptre can reuse them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+
+from botocore.utils import JSONFileCache
+from dateutil.parser import parse
+from dateutil.tz import tzutc
+
+DEFAULT_CREDENTIAL_CACHE_DIRECTORY = os.path.join("~", ".aws", "sceptre", "cache")
+
+# Cached credentials are only reused if they are valid for at least this long. Reused credentials
+# are refreshed by assuming the role again shortly before they expire, so this only saves
+# assuming the role at the start of a run just to replace the credentials moments later.
+REFRESH_MARGIN = timedelta(minutes=15)
+
+
+class AssumedRoleCredentialCache(object):
+    """
+    Stores the credentials returned by ``sts:AssumeRole``, like the AWS CLI does. Each set of
+    credentials is kept in its own file, readable only by the current user, named after a hash
+    of the role, profile, region and session duration they were assumed with.
+
+    :param directory: The directory the credentials are stored in.
+    :param refresh_margin: How long cached credentials must remain valid to be reused.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CREDENTIAL_CACHE_DIRECTORY,
+        refresh_margin: timedelta = REFRESH_MARGIN,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.directory = os.path.expanduser(directory)
+        self.refresh_margin = refresh_margin
+        self._cache = JSONFileCache(self.directory)
+
+    @staticmethod
+    def key(
+        sceptre_role: str,
+        profile: Optional[str],
+        region: Optional[str],
+        duration: Optional[int],
+    ) -> str:
+        """
+        Returns the cache key for a role assumed with the given settings.
+        """
+        settings = json.dumps([sceptre_role, profile, region, duration])
+        return hashlib.sha1(settings.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns the cached credentials, or None if there are none that are valid for long
+        enough.
+
+        :param key: The cache key, as returned by ``key``.
+        """
+        try:
+            credentials = self._cache[key]
+            expiration = parse(credentials["Expiration"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if expiration.tzinfo is None:
+            expiration = expiration.replace(tzinfo=tzutc())
+        if expiration - datetime.now(tzutc()) < self.refresh_margin:
+            return None
+        return credentials
+
+    def set(self, key: str, credentials: dict):
+        """
+        Caches the credentials returned by ``sts:AssumeRole``. Failing to write them is not an
+        error, since they only need to be assumed again.
+
+        :param key: The cache key, as returned by ``key``.
+        :param credentials: The ``Credentials`` of the ``sts:AssumeRole`` response.
+        """
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            self._cache[key] = credentials
+        except (OSError, ValueError) as err:
+            self.logger.debug("Could not cache credentials: %s", err)
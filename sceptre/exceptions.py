@@ -159,6 +159,14 @@ class StackDoesNotExistError(SceptreException):
     pass
 
 
+class ExportDoesNotExistError(SceptreException):
+    """
+    Error raised when a CloudFormation export does not exist.
+    """
+
+    pass
+
+
 class ConfigFileNotFoundError(SceptreException):
     """
     Error raised when a config file does not exist.
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+sceptre.export_cache
+
+This module implements a StackExportCache, which holds an index of the CloudFormation exports in
+each account and region so that the resolvers reading them do not each have to list them.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sceptre.resolver_stats import ResolverStats
+
+ExportCacheKey = Tuple[Optional[str], Optional[str]]
+
+
+class StackExportCache(object):
+    """
+    Holds the exports of each account and region, keyed by the sceptre_role (or profile) and
+    region they were listed with, as a dict of export names to values.
+
+    Like the StackOutputCache, lookups are single-flight: when several threads need the exports of
+    a region that has not been listed yet, one of them lists them and the others wait for its
+    result. Failed lookups are not cached.
+
+    The cache also records which Stacks import each export, keyed like the exports and by the
+    export name, so that it is known which Stacks a change to an export would affect. Exports
+    with the same name in different accounts or regions are kept apart. The imports are written
+    to the resolver report at the end of each plan.
+
+    The cache is shared by the whole process. It is cleared whenever a SceptrePlan starts
+    executing, and a region's exports are dropped whenever a Stack in it is created, updated or
+    deleted.
+    """
+
+    _lock = threading.Lock()
+    _exports: Dict[ExportCacheKey, Dict[str, str]] = {}
+    _pending: Dict[ExportCacheKey, Future] = {}
+    _importers: Dict[Tuple[ExportCacheKey, str], Set[str]] = defaultdict(set)
+
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def key(
+        profile: Optional[str], region: Optional[str], sceptre_role: Optional[str]
+    ) -> ExportCacheKey:
+        """
+        Returns the key for the exports listed with the given settings.
+        """
+        return sceptre_role or profile, region
+
+    @classmethod
+    def get_exports(
+        cls, key: ExportCacheKey, list_exports: Callable[[], Dict[str, str]]
+    ) -> Dict[str, str]:
+        """
+        Returns the cached exports for a key, listing them if they are not cached yet.
+
+        :param key: The key, as returned by ``key``.
+        :param list_exports: Returns the exports of the account and region from AWS.
+        :returns: A dict of export names to export values.
+        """
+        with cls._lock:
+            if key in cls._exports:
+                ResolverStats.record_cache_lookup(hit=True)
+                return cls._exports[key]
+            future = cls._pending.get(key)
+            listing = future is None
+            if listing:
+                future = cls._pending[key] = Future()
+
+        if not listing:
+            ResolverStats.record_cache_lookup(hit=True)
+            cls.logger.debug("Waiting for exports in '%s'", key[1])
+            return future.result()
+
+        ResolverStats.record_cache_lookup(hit=False)
+        try:
+            exports = list_exports()
+        except BaseException as err:
+            with cls._lock:
+                if cls._pending.get(key) is future:
+                    del cls._pending[key]
+            future.set_exception(err)
+            raise
+
+        with cls._lock:
+            # A Stack in the region may have changed while the exports were being listed, in
+            # which case they are out of date and must not be kept.
+            if cls._pending.get(key) is future:
+                del cls._pending[key]
+                cls._exports[key] = exports
+        future.set_result(exports)
+        return exports
+
+    @classmethod
+    def record_import(cls, key: ExportCacheKey, export_name: str, stack_name: str):
+        """
+        Records that a Stack imports an export.
+
+        :param key: The key of the export's account and region, as returned by ``key``.
+        :param export_name: The name of the export.
+        :param stack_name: The name of the importing Stack.
+        """
+        with cls._lock:
+            cls._importers[key, export_name].add(stack_name)
+
+    @classmethod
+    def get_importers(cls, key: ExportCacheKey, export_name: str) -> Set[str]:
+        """
+        Returns the names of the Stacks recorded as importing an export.
+
+        :param key: The key of the export's account and region, as returned by ``key``.
+        :param export_name: The name of the export.
+        """
+        with cls._lock:
+            return set(cls._importers.get((key, export_name), ()))
+
+    @classmethod
+    def imports(cls) -> List[dict]:
+        """
+        Returns every recorded export and the Stacks importing it, sorted by region and export
+        name, for reporting.
+        """
+        with cls._lock:
+            importers = {key: sorted(stacks) for key, stacks in cls._importers.items()}
+        return [
+            {
+                "sceptre_role_or_profile": role_or_profile,
+                "region": region,
+                "export": export_name,
+                "stacks": stacks,
+            }
+            for ((role_or_profile, region), export_name), stacks in sorted(
+                importers.items(), key=lambda item: (str(item[0][0][1]), item[0][1])
+            )
+        ]
+
+    @classmethod
+    def invalidate(cls, region: Optional[str]):
+        """
+        Drops the exports of a region, however they were listed.
+
+        :param region: The region whose exports may have changed.
+        """
+        with cls._lock:
+            for cache in (cls._exports, cls._pending):
+                for key in [key for key in cache if key[1] == region]:
+                    del cache[key]
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops all cached exports and recorded imports.
+        """
+        with cls._lock:
+            cls._exports.clear()
+            cls._pending.clear()
+            cls._importers.clear()
@@ -95,6 +95,41 @@ def _call_func_on_values(func, attr, cls):
     return attr
 
 
+def _copy_paths_to_values(func, attr, cls):
+    """
+    Returns a copy of a dictionary or list in which every object of type `cls`
+    is replaced with the result of calling `func` on it. Only the dictionaries
+    and lists that lead to such objects are copied; any without them are
+    shared with `attr` rather than copied. Supports nested dictionaries and
+    lists. Does not detect objects used as keys in dictionaries.
+
+    :param attr: A dictionary or list to copy.
+    :type attr: dict or list
+    :return: The copied dictionary or list structure, or `attr` itself if it
+        contains no objects of type `cls`.
+    :rtype: dict or list
+    """
+    if isinstance(attr, cls):
+        return func(attr)
+
+    copied = None
+    if isinstance(attr, dict):
+        for key, value in attr.items():
+            new_value = _copy_paths_to_values(func, value, cls)
+            if new_value is not value:
+                if copied is None:
+                    copied = dict(attr)
+                copied[key] = new_value
+    elif isinstance(attr, list):
+        for index, value in enumerate(attr):
+            new_value = _copy_paths_to_values(func, value, cls)
+            if new_value is not value and copied is None:
+                copied = attr[:index]
+            if copied is not None:
+                copied.append(new_value)
+    return attr if copied is None else copied
+
+
 Container = Union[list, dict]
 Key = Union[str, int]
 
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+sceptre.output_cache
+
+This module implements a StackOutputCache, which shares the outputs of Stacks between
+all the resolvers that read them.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+from sceptre.output_snapshot import StackOutputSnapshot
+from sceptre.resolver_stats import ResolverStats
+
+OutputCacheKey = Tuple[Optional[str], Optional[str], str]
+
+
+class StackOutputCache(object):
+    """
+    Holds the outputs of each Stack, keyed by the sceptre_role (or profile) and region they were
+    read with and the Stack's external name.
+
+    Lookups are single-flight: when several threads need the outputs of a Stack that is not
+    cached yet, one of them describes the Stack and the others wait for its result. Failed
+    lookups are not cached.
+
+    The cache is shared by the whole process. It is cleared whenever a SceptrePlan starts
+    executing, and a Stack's outputs are dropped whenever it is created, updated or deleted.
+
+    If a StackOutputSnapshot is enabled, every output that is fetched or set is recorded in it.
+    While reading the snapshot is turned on (for commands that only render templates), outputs
+    missing from the cache are read from it before they are fetched.
+    """
+
+    _lock = threading.Lock()
+    _outputs: Dict[OutputCacheKey, dict] = {}
+    _pending: Dict[OutputCacheKey, Future] = {}
+    _snapshot: Optional[StackOutputSnapshot] = None
+    _read_snapshot = False
+
+    logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def key(
+        profile: Optional[str],
+        region: Optional[str],
+        sceptre_role: Optional[str],
+        stack_name: str,
+    ) -> OutputCacheKey:
+        """
+        Returns the key for the outputs of a Stack read with the given settings.
+        """
+        return sceptre_role or profile, region, stack_name
+
+    @classmethod
+    def get_outputs(
+        cls, key: OutputCacheKey, fetch_outputs: Callable[[], dict]
+    ) -> dict:
+        """
+        Returns the cached outputs for a key, fetching them if they are not cached yet.
+
+        :param key: The key, as returned by ``key``.
+        :param fetch_outputs: Returns the outputs of the Stack from AWS.
+        :returns: A dict of output keys to output values.
+        """
+        with cls._lock:
+            if key in cls._outputs:
+                ResolverStats.record_cache_lookup(hit=True)
+                return cls._outputs[key]
+            future = cls._pending.get(key)
+            fetching = future is None
+            if fetching:
+                future = cls._pending[key] = Future()
+
+        if not fetching:
+            ResolverStats.record_cache_lookup(hit=True)
+            cls.logger.debug("Waiting for outputs of '%s'", key[2])
+            return future.result()
+
+        try:
+            outputs = cls._snapshot.get(key) if cls._reads_snapshot() else None
+            ResolverStats.record_cache_lookup(hit=outputs is not None)
+            if outputs is None:
+                outputs = fetch_outputs()
+                if cls._snapshot:
+                    cls._snapshot.set(key, outputs)
+            else:
+                cls.logger.debug("Using snapshotted outputs of '%s'", key[2])
+        except BaseException as err:
+            with cls._lock:
+                if cls._pending.get(key) is future:
+                    del cls._pending[key]
+            future.set_exception(err)
+            raise
+
+        with cls._lock:
+            # The Stack may have been invalidated while it was being described, in which case
+            # these outputs are out of date and must not be kept.
+            if cls._pending.get(key) is future:
+                del cls._pending[key]
+                cls._outputs[key] = outputs
+        future.set_result(outputs)
+        return outputs
+
+    @classmethod
+    def is_cached(cls, key: OutputCacheKey) -> bool:
+        """
+        Returns whether the outputs for a key can be read without fetching them.
+
+        :param key: The key, as returned by ``key``.
+        """
+        with cls._lock:
+            if key in cls._outputs:
+                return True
+        return cls._reads_snapshot() and cls._snapshot.get(key) is not None
+
+    @classmethod
+    def set_outputs(cls, key: OutputCacheKey, outputs: dict):
+        """
+        Caches the outputs of a Stack that are already known.
+
+        :param key: The key, as returned by ``key``.
+        :param outputs: A dict of output keys to output values.
+        """
+        with cls._lock:
+            cls._outputs[key] = outputs
+        if cls._snapshot:
+            cls._snapshot.set(key, outputs)
+
+    @classmethod
+    def invalidate(cls, region: Optional[str], stack_name: str):
+        """
+        Drops the outputs of a Stack, however they were read.
+
+        :param region: The region of the Stack.
+        :param stack_name: The external name of the Stack.
+        """
+        with cls._lock:
+            for cache in (cls._outputs, cls._pending):
+                for key in [key for key in cache if key[1:] == (region, stack_name)]:
+                    del cache[key]
+        if cls._snapshot:
+            cls._snapshot.discard(region, stack_name)
+
+    @classmethod
+    def enable_snapshot(cls, snapshot: Optional[StackOutputSnapshot]):
+        """
+        Reads outputs from, and records them in, a snapshot kept between invocations of Sceptre.
+
+        :param snapshot: The snapshot to use, or None to stop using one.
+        """
+        cls._snapshot = snapshot
+
+    @classmethod
+    def read_snapshot(cls, enabled: bool):
+        """
+        Sets whether outputs are read from the snapshot. Outputs are always recorded in it, but
+        they are only read from it when the command cannot be harmed by outdated outputs.
+
+        :param enabled: Whether to read outputs from the snapshot.
+        """
+        cls._read_snapshot = enabled
+
+    @classmethod
+    def _reads_snapshot(cls) -> bool:
+        return cls._snapshot is not None and cls._read_snapshot
+
+    @classmethod
+    def save_snapshot(cls):
+        """
+        Writes the snapshot to disk, if one is enabled.
+        """
+        if cls._snapshot:
+            cls._snapshot.save()
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops all cached outputs. The snapshot is kept.
+        """
+        with cls._lock:
+            cls._outputs.clear()
+            cls._pending.clear()
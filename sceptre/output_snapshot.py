@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+sceptre.output_snapshot
+
+This module implements a StackOutputSnapshot, which keeps the outputs of Stacks on disk so that
+later invocations of Sceptre can resolve them without calling AWS.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from os import path
+from typing import Dict, Optional, Tuple
+
+SNAPSHOT_DIRECTORY = ".sceptre"
+SNAPSHOT_FILE = "stack_outputs.json"
+
+# How long, in seconds, snapshotted outputs are used for by default.
+DEFAULT_SNAPSHOT_TTL = 24 * 60 * 60
+
+SnapshotKey = Tuple[Optional[str], Optional[str], str]
+
+
+class StackOutputSnapshot(object):
+    """
+    Records the outputs of Stacks, keyed like the StackOutputCache, along with when they were
+    read. Outputs older than the TTL are ignored and dropped when the snapshot is saved.
+
+    :param file_path: The path of the JSON file the snapshot is stored in.
+    :param ttl: How long, in seconds, recorded outputs are used for.
+    """
+
+    def __init__(self, file_path: str, ttl: float = DEFAULT_SNAPSHOT_TTL):
+        self.logger = logging.getLogger(__name__)
+        self.file_path = file_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[SnapshotKey, Tuple[float, dict]] = self._load()
+        self._changed = False
+
+    @classmethod
+    def for_project(
+        cls, project_path: str, ttl: float = DEFAULT_SNAPSHOT_TTL
+    ) -> "StackOutputSnapshot":
+        """
+        Returns the snapshot stored in the ``.sceptre`` directory of a Sceptre project.
+
+        :param project_path: The absolute path to the Sceptre project.
+        :param ttl: How long, in seconds, recorded outputs are used for.
+        """
+        return cls(path.join(project_path, SNAPSHOT_DIRECTORY, SNAPSHOT_FILE), ttl)
+
+    def get(self, key: SnapshotKey) -> Optional[dict]:
+        """
+        Returns the recorded outputs of a Stack, or None if there are none that are recent enough.
+
+        :param key: The key, as returned by ``StackOutputCache.key``.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or self._is_expired(entry[0]):
+            return None
+        return entry[1]
+
+    def set(self, key: SnapshotKey, outputs: dict):
+        """
+        Records the outputs of a Stack.
+
+        :param key: The key, as returned by ``StackOutputCache.key``.
+        :param outputs: A dict of output keys to output values.
+        """
+        with self._lock:
+            self._entries[key] = (time.time(), outputs)
+            self._changed = True
+
+    def discard(self, region: Optional[str], stack_name: str):
+        """
+        Forgets the outputs of a Stack, however they were read.
+
+        :param region: The region of the Stack.
+        :param stack_name: The external name of the Stack.
+        """
+        with self._lock:
+            for key in [
+                key for key in self._entries if key[1:] == (region, stack_name)
+            ]:
+                del self._entries[key]
+                self._changed = True
+
+    def save(self):
+        """
+        Writes the snapshot back to disk, if anything has been recorded.
+        """
+        with self._lock:
+            if not self._changed:
+                return
+            entries = [
+                {"key": list(key), "saved_at": saved_at, "outputs": outputs}
+                for key, (saved_at, outputs) in self._entries.items()
+                if not self._is_expired(saved_at)
+            ]
+            self._changed = False
+
+        try:
+            os.makedirs(path.dirname(self.file_path), exist_ok=True)
+            with open(self.file_path, "w") as snapshot_file:
+                json.dump(entries, snapshot_file, indent=2, sort_keys=True)
+        except OSError as err:
+            self.logger.debug("Could not save stack outputs: %s", err)
+
+    def _is_expired(self, saved_at: float) -> bool:
+        return time.time() - saved_at > self.ttl
+
+    def _load(self) -> Dict[SnapshotKey, Tuple[float, dict]]:
+        try:
+            with open(self.file_path) as snapshot_file:
+                entries = json.load(snapshot_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            self.logger.debug("Ignoring unreadable stack outputs: %s", err)
+            return {}
+
+        try:
+            return {
+                tuple(entry["key"]): (float(entry["saved_at"]), dict(entry["outputs"]))
+                for entry in entries
+            }
+        except (KeyError, TypeError, ValueError) as err:
+            self.logger.debug("Ignoring unreadable stack outputs: %s", err)
+            return {}
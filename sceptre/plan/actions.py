@@ -27,8 +27,14 @@ from sceptre.exceptions import (
     UnknownStackChangeSetStatusError,
     UnknownStackStatusError,
 )
+from sceptre.export_cache import StackExportCache
 from sceptre.helpers import extract_datetime_from_aws_response_headers
 from sceptre.hooks import add_stack_hooks, add_stack_hooks_with_aliases
+from sceptre.output_cache import StackOutputCache
+from sceptre.plan.event_tailer import StackEventTailer
+from sceptre.plan.polling import DEFAULT_POLLING_OPTIONS, PollingPolicy
+from sceptre.plan.status_poller import StackStatusPoller
+from sceptre.rate_limiter import RateLimiter
 from sceptre.stack import Stack
 from sceptre.stack_status import StackChangeSetStatus, StackStatus
 
@@ -37,6 +43,10 @@ from typing import Dict, Optional, Tuple, Union
 if typing.TYPE_CHECKING:
     from sceptre.diffing.stack_differ import StackDiff, StackDiffer
 
+# While the shared status snapshot shows a Stack still in the same in-progress status, its events
+# are only read this often, in seconds, rather than on every poll.
+EVENT_TAIL_INTERVAL = 30
+
 
 class StackActions:
     """
@@ -57,7 +67,16 @@ class StackActions:
             self.stack.external_name,
             self.stack.sceptre_role,
             self.stack.sceptre_role_session_duration,
+            rate_limits=RateLimiter.limits_for_stack(self.stack),
         )
+        # Built up front so that invalid polling options are reported before any operation is
+        # started, rather than while waiting on it.
+        self.polling_policies = {
+            wait_type: PollingPolicy.for_stack(self.stack, wait_type)
+            for wait_type in DEFAULT_POLLING_OPTIONS
+        }
+        # The most recent response to describe_stacks for the Stack, if any.
+        self._last_description: Optional[dict] = None
 
     @add_stack_hooks
     def create(self):
@@ -374,6 +393,7 @@ class StackActions:
         except botocore.exceptions.ClientError:
             return []
 
+        self._publish_outputs(response["Stacks"][0])
         return {self.stack.name: response["Stacks"][0].get("Outputs", [])}
 
     def continue_update_rollback(self):
@@ -772,18 +792,75 @@ class StackActions:
         most_recent_event_datetime = extract_datetime_from_aws_response_headers(
             boto_response
         ) or (datetime.now(tzutc()) - timedelta(seconds=3))
+        event_tailer = StackEventTailer(
+            self.connection_manager,
+            self.stack.external_name,
+            most_recent_event_datetime,
+        )
 
+        delays = self.polling_policies["stack"].delays()
         elapsed = 0
-        while status == StackStatus.IN_PROGRESS and not timed_out(elapsed):
-            status = self._get_simplified_status(self._get_status())
-            most_recent_event_datetime = self._log_new_events(
-                most_recent_event_datetime
-            )
-            time.sleep(4)
-            elapsed += 4
+        self._last_description = None
+        try:
+            with StackStatusPoller.watch(
+                self.connection_manager, self.stack.external_name
+            ) as poller:
+                last_status = None
+                events_logged_at = elapsed
+                while status == StackStatus.IN_PROGRESS and not timed_out(elapsed):
+                    raw_status, from_snapshot = self._get_polled_status(poller)
+                    status = self._get_simplified_status(raw_status)
+                    # Reading events is a call per Stack, so it is skipped while the shared
+                    # snapshot shows nothing has changed. The Stack is described directly once
+                    # it leaves the snapshot, which logs the rest of its events.
+                    unchanged = from_snapshot and raw_status == last_status
+                    if (
+                        not unchanged
+                        or elapsed - events_logged_at >= EVENT_TAIL_INTERVAL
+                    ):
+                        self._log_new_events(event_tailer)
+                        events_logged_at = elapsed
+                    last_status = raw_status
+                    delay = next(delays)
+                    time.sleep(delay)
+                    elapsed += delay
+        finally:
+            # The Stack has been created, updated or deleted, so its outputs and the exports of
+            # its region have to be read again.
+            StackOutputCache.invalidate(self.stack.region, self.stack.external_name)
+            StackExportCache.invalidate(self.stack.region)
+
+        if status == StackStatus.COMPLETE:
+            self._publish_outputs(self._last_description)
 
         return status
 
+    def _publish_outputs(self, description: Optional[dict]):
+        """
+        Caches the outputs from a description of a Stack, such as when it has just been created
+        or updated, so that Stacks depending on it can read them without describing it again.
+
+        :param description: The Stack, as returned by ``describe_stacks``.
+        """
+        if description is None or description.get("StackStatus", "").startswith(
+            "DELETE"
+        ):
+            return
+
+        key = StackOutputCache.key(
+            self.connection_manager.profile,
+            self.connection_manager.region,
+            self.connection_manager.sceptre_role,
+            self.stack.external_name,
+        )
+        StackOutputCache.set_outputs(
+            key,
+            {
+                output["OutputKey"]: output["OutputValue"]
+                for output in description.get("Outputs", [])
+            },
+        )
+
     def _describe(self):
         return self.connection_manager.call(
             service="cloudformation",
@@ -791,15 +868,28 @@ class StackActions:
             kwargs={"StackName": self.stack.external_name},
         )
 
+    def _get_polled_status(self, poller: StackStatusPoller) -> Tuple[str, bool]:
+        """
+        Returns the Stack's status, using the poller shared with the other waiting Stacks while
+        the Stack is in progress and describing the Stack directly otherwise.
+
+        :param poller: The poller for the Stack's region, profile and sceptre_role.
+        :returns: The status, and whether it was read from the shared snapshot.
+        """
+        status = poller.get_status(self.stack.external_name)
+        if status is not None:
+            return status, True
+        return self._get_status(), False
+
     def _get_status(self):
         try:
-            status = self._describe()["Stacks"][0]["StackStatus"]
+            self._last_description = self._describe()["Stacks"][0]
         except botocore.exceptions.ClientError as exp:
             if exp.response["Error"]["Message"].endswith("does not exist"):
                 raise StackDoesNotExistError(exp.response["Error"]["Message"])
             else:
                 raise exp
-        return status
+        return self._last_description["StackStatus"]
 
     @staticmethod
     def _get_simplified_status(status):
@@ -829,17 +919,14 @@ class StackActions:
         else:
             raise UnknownStackStatusError("{0} is unknown".format(status))
 
-    def _log_new_events(self, after_datetime: datetime) -> datetime:
+    def _log_new_events(self, event_tailer: StackEventTailer):
         """
         Log the latest Stack events while the Stack is being built.
 
-        :param after_datetime: Only events after this datetime will be logged.
-        :returns: The datetime of the last logged event or after_datetime if no events were logged.
+        :param event_tailer: The tailer following the Stack's events, which only returns the
+            events that have not been logged yet.
         """
-        events = self.describe_events()["StackEvents"]
-        events.reverse()
-        new_events = [event for event in events if event["Timestamp"] > after_datetime]
-        for event in new_events:
+        for event in event_tailer.new_events():
             stack_event_status = [
                 self.stack.name,
                 event["LogicalResourceId"],
@@ -857,8 +944,6 @@ class StackActions:
                     ]
                 )
             self.logger.info(" ".join(stack_event_status))
-            after_datetime = event["Timestamp"]
-        return after_datetime
 
     def wait_for_cs_completion(self, change_set_name):
         """
@@ -869,11 +954,12 @@ class StackActions:
         :returns: The Change Set's status.
         :rtype: sceptre.stack_status.StackChangeSetStatus
         """
+        delays = self.polling_policies["change_set"].delays()
         while True:
             status = self._get_cs_status(change_set_name)
             if status != StackChangeSetStatus.PENDING:
                 break
-            time.sleep(2)
+            time.sleep(next(delays))
 
         return status
 
@@ -1063,7 +1149,7 @@ class StackActions:
         :returns: The response from describe_stack_drift_detection_status.
         """
         timeout = 300
-        sleep_interval = 10
+        delays = self.polling_policies["drift"].delays()
         elapsed = 0
 
         while True:
@@ -1077,8 +1163,9 @@ class StackActions:
             self._log_drift_status(response)
 
             if detection_status == "DETECTION_IN_PROGRESS":
-                time.sleep(sleep_interval)
-                elapsed += sleep_interval
+                delay = next(delays)
+                time.sleep(delay)
+                elapsed += delay
             else:
                 return response
 
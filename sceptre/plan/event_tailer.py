@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.event_tailer
+
+This module implements a StackEventTailer, which fetches only the CloudFormation
+events of a Stack that have not been seen yet.
+"""
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from sceptre.connection_manager import ConnectionManager
+
+
+class StackEventTailer(object):
+    """
+    Follows the events of a Stack, like ``tail -f``.
+
+    ``describe_stack_events`` returns the newest events first. Each call to ``new_events`` pages
+    through them only until it reaches the last event it has already returned, so no events are
+    missed when more than a page of events arrives between calls, and old events are not fetched
+    again.
+
+    :param connection_manager: The ConnectionManager used to describe the events.
+    :param stack_name: The external name of the Stack.
+    :param after_datetime: Only events after this datetime are returned.
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        stack_name: str,
+        after_datetime: datetime,
+    ):
+        self.connection_manager = connection_manager
+        self.stack_name = stack_name
+        self.after_datetime = after_datetime
+        self.last_event_id: Optional[str] = None
+
+    def new_events(self) -> Iterator[dict]:
+        """
+        Yields the events that have happened since the last call, oldest first.
+        """
+        events = self._fetch_unseen_events()
+        if events:
+            self.last_event_id = events[0]["EventId"]
+            self.after_datetime = events[0]["Timestamp"]
+
+        yield from reversed(events)
+
+    def _fetch_unseen_events(self) -> List[dict]:
+        events = []
+        kwargs = {"StackName": self.stack_name}
+        while True:
+            response = self.connection_manager.call(
+                service="cloudformation",
+                command="describe_stack_events",
+                kwargs=kwargs,
+            )
+            for event in response["StackEvents"]:
+                if self._has_been_seen(event):
+                    return events
+                events.append(event)
+
+            if not response.get("NextToken"):
+                return events
+            kwargs["NextToken"] = response["NextToken"]
+
+    def _has_been_seen(self, event: dict) -> bool:
+        if self.last_event_id is None:
+            return event["Timestamp"] <= self.after_datetime
+        # Events sharing the timestamp of the last seen event might still be new, so only the
+        # EventId tells when we have caught up. Older events have always been seen already.
+        return (
+            event["EventId"] == self.last_event_id
+            or event["Timestamp"] < self.after_datetime
+        )
@@ -7,15 +7,35 @@ This module implements a SceptrePlanExecutor, which is responsible for
 executing the command specified in a SceptrePlan.
 """
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Set
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Container, Deque, Dict, List, Optional, Set
 
+from sceptre.connection_manager import ConnectionManager
+from sceptre.exceptions import SceptreException
 from sceptre.plan.actions import StackActions
+from sceptre.plan.history import StackDurationHistory
 from sceptre.stack import Stack
 
+# The commands whose durations are recorded in the StackDurationHistory. These are the commands
+# that wait for CloudFormation to create, update or delete Stacks.
+TIMED_COMMANDS = {"create", "update", "delete", "launch", "execute_change_set"}
+
+# The number of threads there are by default when no batch of the launch_order is larger.
+DEFAULT_NUM_THREADS = 10
+
 
 class SceptrePlanExecutor(object):
-    def __init__(self, command: str, launch_order: List[Set[Stack]]):
+    def __init__(
+        self,
+        command: str,
+        launch_order: List[Set[Stack]],
+        max_concurrency: Optional[int] = None,
+        max_concurrency_per_region: Optional[int] = None,
+        max_concurrency_per_role: Optional[int] = None,
+        duration_history: Optional[StackDurationHistory] = None,
+    ):
         """
         Initialises a SceptrePlanExecutor, generates the launch order, threads
         and intial Stack Statuses.
@@ -23,38 +43,271 @@ class SceptrePlanExecutor(object):
         :param command: The command to execute on the Stack.
 
         :param launch_order: A list containing sets of Stacks that can be executed concurrently.
+
+        :param max_concurrency: The maximum number of Stacks to execute at the same time. Defaults
+            to the size of the largest batch of the launch_order, or DEFAULT_NUM_THREADS if that
+            is larger.
+
+        :param max_concurrency_per_region: The maximum number of Stacks to execute at the same time
+            in a single account and region.
+
+        :param max_concurrency_per_role: The maximum number of Stacks to execute at the same time
+            with a single sceptre_role (or profile, for Stacks without a sceptre_role).
+
+        :param duration_history: The history used to estimate how long each Stack will take, and
+            that the duration of each Stack is recorded in.
         """
 
         self.logger = logging.getLogger(__name__)
         self.command = command
         self.launch_order = launch_order
-        # Select the number of threads based upon the max batch size,
-        # or use 1 if all batches are empty
-        self.num_threads = len(max(launch_order, key=len)) or 1
+        # Stacks from different batches can be ready at the same time, so there can be more
+        # threads than the largest batch has Stacks, but never more than the plan has (or 1 if all
+        # batches are empty). Threads are only started as Stacks are, and _take_startable applies
+        # the concurrency limits.
+        num_stacks = sum(len(batch) for batch in launch_order) or 1
+        if not max_concurrency:
+            max_concurrency = max(
+                max((len(batch) for batch in launch_order), default=0),
+                DEFAULT_NUM_THREADS,
+            )
+        self.num_threads = min(num_stacks, max_concurrency)
+
+        self.concurrency_limits = {
+            "region": max_concurrency_per_region,
+            "role": max_concurrency_per_role,
+        }
+        self.duration_history = duration_history
 
     def execute(self, *args):
         """
-        Execute is responsible executing the sets of Stacks in launch_order
-        concurrently, in the correct order.
+        Execute is responsible executing the Stacks in launch_order concurrently,
+        in the correct order.
+
+        Rather than waiting for a whole batch of the launch_order to complete, each
+        Stack is queued as soon as every Stack it is ordered after has finished.
+        Queued Stacks are started as long as the concurrency limits allow it, those
+        on the longest remaining path through the plan first.
 
         :param args: Any arguments that should be passed through to the
                 StackAction being called.
         """
+        # Stacks with the same settings share Boto3 clients, so each client may be used by every
+        # worker at once.
+        ConnectionManager.set_max_pool_connections(self.num_threads)
+
         responses = {}
+        prerequisites = self._find_prerequisites()
+        dependents: Dict[Stack, Set[Stack]] = {stack: set() for stack in prerequisites}
+        for stack, required_stacks in prerequisites.items():
+            for required_stack in required_stacks:
+                dependents[required_stack].add(stack)
+
+        ready = deque(
+            stack
+            for stack, required_stacks in prerequisites.items()
+            if not required_stacks
+        )
+        priorities = self._critical_path_lengths(dependents)
+        running: Dict[Future, Stack] = {}
+        start_times: Dict[Future, float] = {}
+        # The keys each running Stack was counted under. They are released exactly as they were
+        # counted, since a sceptre_role set by a resolver may have been resolved in the meantime.
+        running_keys: Dict[Future, List[tuple]] = {}
+        in_use = Counter()
 
         with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-            for batch in self.launch_order:
-                futures = [
-                    executor.submit(self._execute, stack, *args) for stack in batch
-                ]
+            while ready or running:
+                for stack in self._take_startable(
+                    ready, priorities, len(running), in_use
+                ):
+                    keys = self._concurrency_keys(stack)
+                    in_use.update(keys)
+                    future = executor.submit(self._execute, stack, *args)
+                    running[future] = stack
+                    running_keys[future] = keys
+                    start_times[future] = time.monotonic()
 
-                for future in as_completed(futures):
+                if not running:
+                    raise SceptreException(
+                        "No queued stack can start within the concurrency limits: "
+                        + ", ".join(sorted(stack.name for stack in ready))
+                    )
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    in_use.subtract(running_keys.pop(future))
                     stack, status = future.result()
                     responses[stack] = status
+                    self._record_duration(
+                        stack, time.monotonic() - start_times.pop(future)
+                    )
+
+                    for dependent in dependents[stack]:
+                        prerequisites[dependent].discard(stack)
+                        if not prerequisites[dependent]:
+                            self.logger.debug(
+                                "%s - All prerequisites complete, queueing", dependent
+                            )
+                            ready.append(dependent)
+
+        if self.duration_history:
+            self.duration_history.save()
 
         return responses
 
+    def _take_startable(
+        self,
+        ready: Deque[Stack],
+        priorities: Dict[Stack, float],
+        num_running: int,
+        in_use: Counter,
+    ) -> List[Stack]:
+        """
+        Removes and returns the queued Stacks that can be started without exceeding the
+        concurrency limits, highest priority first. Stacks that cannot be started yet stay queued.
+
+        :param ready: The queue of Stacks whose prerequisites have all completed.
+        :param priorities: The priority of each Stack.
+        :param num_running: The number of Stacks currently executing.
+        :param in_use: The number of executing Stacks for each concurrency key.
+        """
+        startable = []
+        in_use = in_use.copy()
+        queued = sorted(ready, key=lambda stack: priorities[stack], reverse=True)
+        ready.clear()
+        for stack in queued:
+            if num_running + len(startable) >= self.num_threads:
+                ready.append(stack)
+                continue
+            keys = self._concurrency_keys(stack)
+            if all(
+                in_use[key] < self.concurrency_limits[key[0]]
+                for key in keys
+                if self.concurrency_limits[key[0]]
+            ):
+                in_use.update(keys)
+                startable.append(stack)
+            else:
+                ready.append(stack)
+        return startable
+
+    @staticmethod
+    def _concurrency_keys(stack: Stack) -> List[tuple]:
+        """
+        Returns the keys a Stack counts towards when applying concurrency limits.
+
+        The sceptre_role is not resolved here, since resolving it may require outputs from Stacks
+        that have not been launched yet. A sceptre_role set by a resolver is therefore grouped
+        under the Stack's profile.
+
+        :param stack: The Stack to get the keys for.
+        """
+        sceptre_role = getattr(stack, "_sceptre_role", None)
+        if isinstance(sceptre_role, str) and sceptre_role:
+            role = sceptre_role
+            # arn:aws:iam::<account id>:role/<role name>
+            account = (
+                sceptre_role.split(":")[4] if sceptre_role.count(":") >= 5 else role
+            )
+        else:
+            role = account = stack.profile
+        return [("region", account, stack.region), ("role", role)]
+
+    def _critical_path_lengths(
+        self, dependents: Dict[Stack, Set[Stack]]
+    ) -> Dict[Stack, float]:
+        """
+        Returns, for each Stack, the estimated time from starting it until the end of the longest
+        chain of Stacks waiting on it. Starting the Stacks with the longest remaining path first
+        shortens the total time of the plan when there are fewer workers than ready Stacks.
+
+        Stacks without a recorded duration are estimated using the average of the known ones.
+
+        :param dependents: The Stacks that wait on each Stack.
+        """
+        estimates = {
+            stack: (
+                self.duration_history.estimate(stack.name, self.command)
+                if self.duration_history
+                else None
+            )
+            for stack in dependents
+        }
+        known = [estimate for estimate in estimates.values() if estimate is not None]
+        default = sum(known) / len(known) if known else 1.0
+
+        lengths: Dict[Stack, float] = {}
+        # Stacks are ordered after all the Stacks they depend on, so walking the launch_order
+        # backwards visits every dependent before the Stacks it waits on.
+        for batch in reversed(self.launch_order):
+            for stack in batch:
+                own = estimates[stack] if estimates[stack] is not None else default
+                lengths[stack] = own + max(
+                    (lengths[dependent] for dependent in dependents[stack]), default=0
+                )
+        return lengths
+
+    def _record_duration(self, stack: Stack, duration: float):
+        if self.duration_history and self.command in TIMED_COMMANDS:
+            self.duration_history.record(stack.name, self.command, duration)
+
     def _execute(self, stack, *args):
         actions = StackActions(stack)
         result = getattr(actions, self.command)(*args)
         return stack, result
+
+    def _find_prerequisites(self) -> Dict[Stack, Set[Stack]]:
+        """
+        Works out which Stacks in the launch_order must finish before each Stack can start.
+
+        Two Stacks are related when one depends on the other, either directly or through Stacks
+        that are not part of the launch_order. For every related pair, the Stack in the earlier
+        batch must finish first. This keeps the ordering guarantees of the batches (including for
+        reversed orders, such as deletes) without waiting on unrelated Stacks.
+
+        :returns: A dict mapping each Stack to the Stacks it must wait for.
+        """
+        batch_indexes = {
+            stack: index
+            for index, batch in enumerate(self.launch_order)
+            for stack in batch
+        }
+        prerequisites: Dict[Stack, Set[Stack]] = {
+            stack: set() for stack in batch_indexes
+        }
+
+        for stack, index in batch_indexes.items():
+            for related in self._nearest_planned_dependencies(stack, batch_indexes):
+                if batch_indexes[related] < index:
+                    prerequisites[stack].add(related)
+                elif batch_indexes[related] > index:
+                    prerequisites[related].add(stack)
+
+        return prerequisites
+
+    @staticmethod
+    def _nearest_planned_dependencies(
+        stack: Stack, planned: Container[Stack]
+    ) -> Set[Stack]:
+        """
+        Returns the closest dependencies of a Stack that are part of the plan, looking through any
+        dependencies that are not.
+
+        :param stack: The Stack to find dependencies for.
+        :param planned: The Stacks that are part of the plan.
+        """
+        found = set()
+        visited = {stack}
+        to_visit = list(stack.dependencies)
+        while to_visit:
+            dependency = to_visit.pop()
+            if dependency in visited:
+                continue
+            visited.add(dependency)
+            if dependency in planned:
+                found.add(dependency)
+            else:
+                to_visit.extend(dependency.dependencies)
+        return found
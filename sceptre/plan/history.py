@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.history
+
+This module implements a StackDurationHistory, which keeps a local record of how
+long commands took to run against each Stack.
+"""
+import json
+import logging
+import os
+from os import path
+from typing import Dict, List, Optional
+
+HISTORY_DIRECTORY = ".sceptre"
+HISTORY_FILE = "stack_durations.json"
+
+
+class StackDurationHistory(object):
+    """
+    Records how long commands take to run on each Stack, so that later runs can estimate how
+    long they will take.
+
+    Only the most recent durations are kept for each Stack and command. The estimate is the
+    longest of those, so that a Stack that occasionally takes a long time is planned for.
+
+    :param file_path: The path of the JSON file the history is stored in.
+    :param max_samples: The number of durations to keep for each Stack and command.
+    """
+
+    def __init__(self, file_path: str, max_samples: int = 5):
+        self.logger = logging.getLogger(__name__)
+        self.file_path = file_path
+        self.max_samples = max_samples
+        self._durations: Dict[str, Dict[str, List[float]]] = self._load()
+        self._changed = False
+
+    @classmethod
+    def for_project(cls, project_path: str) -> "StackDurationHistory":
+        """
+        Returns the history stored in the ``.sceptre`` directory of a Sceptre project.
+
+        :param project_path: The absolute path to the Sceptre project.
+        """
+        return cls(path.join(project_path, HISTORY_DIRECTORY, HISTORY_FILE))
+
+    def estimate(self, stack_name: str, command: str) -> Optional[float]:
+        """
+        Returns the estimated duration of a command on a Stack, in seconds.
+
+        :param stack_name: The name of the Stack.
+        :param command: The command that will be run.
+        :returns: The estimate, or None if the command has never been recorded for the Stack.
+        """
+        samples = self._durations.get(stack_name, {}).get(command)
+        return max(samples) if samples else None
+
+    def record(self, stack_name: str, command: str, duration: float):
+        """
+        Records how long a command took to run on a Stack.
+
+        :param stack_name: The name of the Stack.
+        :param command: The command that was run.
+        :param duration: How long the command took, in seconds.
+        """
+        samples = self._durations.setdefault(stack_name, {}).setdefault(command, [])
+        samples.append(round(duration, 2))
+        del samples[: -self.max_samples]
+        self._changed = True
+
+    def save(self):
+        """
+        Writes the history back to disk, if anything has been recorded. Failing to write it,
+        such as in a read-only project directory, is not an error.
+        """
+        if not self._changed:
+            return
+
+        try:
+            directory = path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.file_path, "w") as history_file:
+                json.dump(self._durations, history_file, indent=2, sort_keys=True)
+        except OSError as err:
+            self.logger.debug("Could not save stack durations: %s", err)
+            return
+
+        self._changed = False
+
+    def _load(self) -> Dict[str, Dict[str, List[float]]]:
+        try:
+            with open(self.file_path) as history_file:
+                durations = json.load(history_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            self.logger.debug("Ignoring unreadable stack durations: %s", err)
+            return {}
+
+        return durations if isinstance(durations, dict) else {}
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.output_prefetcher
+
+This module implements a StackOutputPrefetcher, which fills the StackOutputCache with the
+outputs read by a plan's resolvers before they are resolved.
+"""
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+from botocore.exceptions import ClientError
+
+from sceptre.exceptions import SceptreException
+from sceptre.output_cache import StackOutputCache
+from sceptre.resolvers import ResolvableProperty, Resolver
+from sceptre.resolvers.stack_output import StackOutputBase
+from sceptre.stack import Stack
+
+# Describing every Stack in a region takes one call per 100 Stacks, so it is only worth doing
+# when a region's Stacks are read from often enough.
+MIN_BULK_STACKS = 5
+
+
+class StackOutputPrefetcher(object):
+    """
+    Collects the Stacks that the ``!stack_output`` and ``!stack_output_external`` resolvers of
+    a plan read from and describes them in bulk, with one paginated ``describe_stacks`` call per
+    profile, region and sceptre_role, rather than once per Stack.
+
+    Prefetching is best effort: any outputs that could not be prefetched are fetched when they
+    are resolved, as usual.
+
+    :param min_stacks: The fewest Stacks read with the same settings that are described in bulk.
+    """
+
+    def __init__(self, min_stacks: int = MIN_BULK_STACKS):
+        self.logger = logging.getLogger(__name__)
+        self.min_stacks = min_stacks
+
+    def prefetch(self, stacks: Iterable[Stack]):
+        """
+        Caches the outputs that the resolvers of the given Stacks will read.
+
+        :param stacks: The Stacks whose resolvers will be resolved.
+        """
+        targets: Dict[tuple, Set[str]] = defaultdict(set)
+        connection_managers = {}
+        for stack in stacks:
+            # Getting the connection manager of a Stack whose sceptre_role is resolvable would
+            # resolve it, which is what is being prepared for.
+            if isinstance(getattr(stack, "_sceptre_role", None), Resolver):
+                continue
+            for resolver in self._find_output_resolvers(stack):
+                try:
+                    target = resolver.prefetch_target()
+                except (SceptreException, StopIteration):
+                    continue
+                if target is None:
+                    continue
+                stack_name, profile, region, sceptre_role = target
+                settings = stack.connection_manager.get_call_settings(
+                    profile, region, stack_name, sceptre_role
+                )
+                if StackOutputCache.is_cached(
+                    StackOutputCache.key(*settings, stack_name)
+                ):
+                    continue
+                targets[settings].add(stack_name)
+                connection_managers.setdefault(settings, stack.connection_manager)
+
+        for settings, stack_names in targets.items():
+            if len(stack_names) < self.min_stacks:
+                continue
+            try:
+                self._describe_stacks(
+                    connection_managers[settings], settings, stack_names
+                )
+            except ClientError as err:
+                self.logger.debug("Could not prefetch stack outputs: %s", err)
+
+    def _describe_stacks(
+        self,
+        connection_manager,
+        settings: Tuple[str, str, str],
+        stack_names: Set[str],
+    ):
+        profile, region, sceptre_role = settings
+        self.logger.debug(
+            "Prefetching outputs of %d stacks in %s", len(stack_names), region
+        )
+        remaining = set(stack_names)
+        kwargs = {}
+        while remaining:
+            response = connection_manager.call(
+                service="cloudformation",
+                command="describe_stacks",
+                kwargs=kwargs,
+                profile=profile,
+                region=region,
+                sceptre_role=sceptre_role,
+            )
+            for stack in response.get("Stacks", []):
+                if stack["StackName"] not in remaining:
+                    continue
+                remaining.discard(stack["StackName"])
+                outputs = dict(
+                    (output["OutputKey"], output["OutputValue"])
+                    for output in stack.get("Outputs", [])
+                )
+                StackOutputCache.set_outputs(
+                    StackOutputCache.key(
+                        profile, region, sceptre_role, stack["StackName"]
+                    ),
+                    outputs,
+                )
+
+            if not response.get("NextToken"):
+                return
+            kwargs["NextToken"] = response["NextToken"]
+
+    @staticmethod
+    def _find_output_resolvers(stack: Stack) -> Iterator[StackOutputBase]:
+        def walk(value):
+            if isinstance(value, StackOutputBase):
+                yield value
+            if isinstance(value, Resolver):
+                yield from walk(value._argument)
+            elif isinstance(value, dict):
+                for item in value.values():
+                    yield from walk(item)
+            elif isinstance(value, list):
+                for item in value:
+                    yield from walk(item)
+
+        for prop in vars(Stack).values():
+            if isinstance(prop, ResolvableProperty):
+                yield from walk(getattr(stack, prop.name, None))
@@ -17,10 +17,39 @@ from sceptre.config.reader import ConfigReader
 from sceptre.context import SceptreContext
 from sceptre.diffing.stack_differ import StackDiff
 from sceptre.exceptions import ConfigFileNotFoundError
+from sceptre.export_cache import StackExportCache
 from sceptre.helpers import sceptreise_path
+from sceptre.output_cache import StackOutputCache
 from sceptre.plan.executor import SceptrePlanExecutor
+from sceptre.plan.history import StackDurationHistory
+from sceptre.plan.output_prefetcher import StackOutputPrefetcher
+from sceptre.resolver_stats import ResolverStats
+from sceptre.resolvers import Resolver
 from sceptre.stack import Stack
 
+# The commands that resolve the parameters of the Stacks they run on.
+PREFETCH_OUTPUTS_COMMANDS = {
+    "create",
+    "update",
+    "launch",
+    "create_change_set",
+    "validate",
+    "estimate_cost",
+    "generate",
+    "diff",
+    "dump_template",
+}
+
+# The commands that only render templates, which may use outputs from the snapshot kept by
+# --outputs-snapshot. Commands that change Stacks always read outputs from AWS.
+SNAPSHOT_OUTPUTS_COMMANDS = {
+    "validate",
+    "generate",
+    "diff",
+    "template",
+    "dump_template",
+}
+
 
 def require_resolved(func) -> Callable:
     @functools.wraps(func)
@@ -52,8 +81,44 @@ class SceptrePlan(object):
 
     @require_resolved
     def _execute(self, *args):
-        executor = SceptrePlanExecutor(self.command, self.launch_order)
-        return executor.execute(*args)
+        # Outputs, exports and deterministic resolver results are shared between the Stacks of a
+        # plan, but not trusted across plans.
+        StackOutputCache.clear()
+        StackExportCache.clear()
+        Resolver.clear_memo()
+        ResolverStats.clear()
+        StackOutputCache.read_snapshot(self.command in SNAPSHOT_OUTPUTS_COMMANDS)
+        if self.command in PREFETCH_OUTPUTS_COMMANDS:
+            StackOutputPrefetcher().prefetch(self)
+        executor = SceptrePlanExecutor(
+            self.command,
+            self.launch_order,
+            max_concurrency=self.context.options.get("max_concurrency"),
+            max_concurrency_per_region=self.context.options.get(
+                "max_concurrency_per_region"
+            ),
+            max_concurrency_per_role=self.context.options.get(
+                "max_concurrency_per_role"
+            ),
+            duration_history=self._duration_history(),
+        )
+        try:
+            return executor.execute(*args)
+        finally:
+            StackOutputCache.save_snapshot()
+            ResolverStats.publish(StackExportCache.imports())
+
+    def _duration_history(self) -> Optional[StackDurationHistory]:
+        """
+        Returns the history of Stack durations to prioritise Stacks with and record their
+        durations in, or None if it has been turned off.
+        """
+        options = self.context.options
+        if options.get("no_duration_history"):
+            return None
+        if options.get("duration_history"):
+            return StackDurationHistory(options["duration_history"])
+        return StackDurationHistory.for_project(self.context.project_path)
 
     def _generate_launch_order(self, reverse=False) -> List[Set[Stack]]:
         if self.context.ignore_dependencies:
@@ -61,16 +126,21 @@ class SceptrePlan(object):
 
         graph = self.graph.filtered(self.command_stacks, reverse)
 
+        # Each batch holds the Stacks whose dependencies are all in earlier batches. Rather than
+        # removing the batch from the graph and searching it again, the number of dependencies
+        # left is counted down for each dependent of the batch.
+        remaining = {stack: graph.count_dependencies(stack) for stack in graph}
+        batch = {stack for stack, count in remaining.items() if count == 0}
         launch_order = []
-        while graph.graph:
-            batch = set()
-            for stack in graph:
-                if graph.count_dependencies(stack) == 0:
-                    batch.add(stack)
+        while batch:
             launch_order.append(batch)
-
+            next_batch = set()
             for stack in batch:
-                graph.remove_stack(stack)
+                for dependent in graph.dependents(stack):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_batch.add(dependent)
+            batch = next_batch
 
         if not launch_order:
             raise ConfigFileNotFoundError(
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.polling
+
+This module implements a PollingPolicy, which decides how long to wait between
+checks on a Stack, Change Set or drift detection that is in progress.
+"""
+import random
+from typing import Iterator, Optional
+
+from sceptre.exceptions import InvalidConfigFileError
+from sceptre.stack import Stack
+
+POLLING_OPTION_KEY = "polling"
+
+# The expected duration is divided by this to get the initial delay, so that operations expected
+# to take a long time are not checked on as often from the start.
+EXPECTED_DURATION_DIVISOR = 20
+
+DEFAULT_POLLING_OPTIONS = {
+    "stack": {"initial_delay": 4, "max_delay": 20, "multiplier": 1.25},
+    "change_set": {"initial_delay": 2, "max_delay": 10, "multiplier": 1.5},
+    "drift": {"initial_delay": 5, "max_delay": 30, "multiplier": 1.5},
+}
+POLLING_OPTION_PARAMS = {
+    "initial_delay",
+    "max_delay",
+    "multiplier",
+    "jitter",
+    "expected_duration",
+}
+POLLING_OPTION_RANGES = {
+    "initial_delay": (lambda value: value > 0, "greater than 0"),
+    "max_delay": (lambda value: value > 0, "greater than 0"),
+    "multiplier": (lambda value: value >= 1, "at least 1"),
+    "jitter": (lambda value: 0 <= value < 1, "at least 0 and less than 1"),
+    "expected_duration": (lambda value: value >= 0, "at least 0"),
+}
+
+
+class PollingPolicy(object):
+    """
+    Waits a little longer between each check, up to a cap, so that quick operations are noticed
+    promptly while long ones use fewer API calls. Each delay is randomly varied by up to
+    ``jitter`` of its length, so that Stacks started together do not all poll at the same time.
+
+    :param initial_delay: The delay before the second check, in seconds.
+    :param max_delay: The longest delay between checks, in seconds.
+    :param multiplier: How much longer each delay is than the one before.
+    :param jitter: The fraction each delay is randomly varied by.
+    :param expected_duration: How long the operation is expected to take, in seconds. If set,
+        the initial delay is raised towards a twentieth of it.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float,
+        max_delay: float,
+        multiplier: float = 1.5,
+        jitter: float = 0.1,
+        expected_duration: Optional[float] = None,
+    ):
+        self.initial_delay = initial_delay
+        self.max_delay = max(max_delay, initial_delay)
+        self.multiplier = multiplier
+        self.jitter = jitter
+        if expected_duration:
+            self.initial_delay = min(
+                max(initial_delay, expected_duration / EXPECTED_DURATION_DIVISOR),
+                self.max_delay,
+            )
+
+    @classmethod
+    def for_stack(cls, stack: Stack, wait_type: str) -> "PollingPolicy":
+        """
+        Returns the policy for a kind of wait on a Stack, using the ``polling`` options of the
+        Stack's StackGroup config on top of the defaults.
+
+        :param stack: The Stack being waited on.
+        :param wait_type: One of ``stack``, ``change_set`` or ``drift``.
+        :raises: sceptre.exceptions.InvalidConfigFileError
+        """
+        options = dict(DEFAULT_POLLING_OPTIONS[wait_type])
+        configured = stack.stack_group_config.get(POLLING_OPTION_KEY) or {}
+        if not isinstance(configured, dict):
+            raise InvalidConfigFileError(
+                f"{stack.name} - '{POLLING_OPTION_KEY}' must be a mapping of wait types "
+                f"to options"
+            )
+
+        overrides = configured.get(wait_type) or {}
+        unknown = set(overrides) - POLLING_OPTION_PARAMS
+        if unknown:
+            raise InvalidConfigFileError(
+                f"{stack.name} - Unknown {POLLING_OPTION_KEY}.{wait_type} options: "
+                f"{', '.join(sorted(unknown))}"
+            )
+        options.update(overrides)
+
+        try:
+            options = {key: float(value) for key, value in options.items()}
+        except (TypeError, ValueError):
+            raise InvalidConfigFileError(
+                f"{stack.name} - {POLLING_OPTION_KEY}.{wait_type} options must be numbers"
+            )
+        for key, value in options.items():
+            in_range, description = POLLING_OPTION_RANGES[key]
+            if not in_range(value):
+                raise InvalidConfigFileError(
+                    f"{stack.name} - {POLLING_OPTION_KEY}.{wait_type}.{key} must be "
+                    f"{description}"
+                )
+        return cls(**options)
+
+    def delays(self) -> Iterator[float]:
+        """
+        Yields the time to wait before each check, in seconds.
+        """
+        delay = self.initial_delay
+        while True:
+            yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            delay = min(delay * self.multiplier, self.max_delay)
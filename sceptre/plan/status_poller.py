@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+sceptre.plan.status_poller
+
+This module implements a StackStatusPoller, which shares the work of checking the
+status of in-progress Stacks between all the Stacks waiting in the same account
+and region.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from sceptre.connection_manager import ConnectionManager
+
+IN_PROGRESS_STATUSES = [
+    "CREATE_IN_PROGRESS",
+    "DELETE_IN_PROGRESS",
+    "IMPORT_IN_PROGRESS",
+    "IMPORT_ROLLBACK_IN_PROGRESS",
+    "REVIEW_IN_PROGRESS",
+    "ROLLBACK_IN_PROGRESS",
+    "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_IN_PROGRESS",
+    "UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_ROLLBACK_IN_PROGRESS",
+]
+
+
+class StackStatusPoller(object):
+    """
+    Tracks which Stacks are in progress for a single region, profile and sceptre_role.
+
+    Rather than every waiting Stack describing itself on every tick, the first waiter to find the
+    shared snapshot out of date lists all in-progress Stacks (one paginated ``list_stacks`` call)
+    and every other waiter reads from that snapshot. The number of status checks therefore stays
+    roughly constant as the number of in-progress Stacks grows. Each Stack still reads its own
+    events, but only every so often while the snapshot shows its status unchanged.
+
+    A Stack missing from the snapshot is no longer (or not yet) in progress, so its final status
+    should be fetched directly.
+
+    :param connection_manager: The ConnectionManager used to list the Stacks.
+    :param max_age: How old, in seconds, the snapshot can be before it is refreshed.
+    """
+
+    _pollers: Dict[tuple, "StackStatusPoller"] = {}
+    _pollers_lock = threading.Lock()
+
+    def __init__(self, connection_manager: ConnectionManager, max_age: float = 2):
+        self.logger = logging.getLogger(__name__)
+        self.connection_manager = connection_manager
+        self.max_age = max_age
+
+        self._condition = threading.Condition()
+        self._watched = Counter()
+        self._statuses: Dict[str, str] = {}
+        self._refreshed_at: Optional[float] = None
+        self._refreshing = False
+
+    @classmethod
+    @contextmanager
+    def watch(
+        cls, connection_manager: ConnectionManager, stack_name: str
+    ) -> Iterator["StackStatusPoller"]:
+        """
+        Registers a Stack as waiting for the duration of the context and returns the poller
+        shared by all Stacks with the same connection settings.
+
+        :param connection_manager: The ConnectionManager of the waiting Stack.
+        :param stack_name: The external name of the waiting Stack.
+        """
+        key = (
+            connection_manager.region,
+            connection_manager.profile,
+            connection_manager.sceptre_role,
+        )
+        with cls._pollers_lock:
+            poller = cls._pollers.get(key)
+            if poller is None:
+                poller = cls._pollers[key] = cls(connection_manager)
+            with poller._condition:
+                poller._watched[stack_name] += 1
+
+        try:
+            yield poller
+        finally:
+            with cls._pollers_lock, poller._condition:
+                poller._watched[stack_name] -= 1
+                if poller._watched[stack_name] <= 0:
+                    del poller._watched[stack_name]
+                if not poller._watched:
+                    del cls._pollers[key]
+
+    def get_status(self, stack_name: str) -> Optional[str]:
+        """
+        Returns the status of a watched Stack from the shared snapshot, refreshing it first if it
+        is out of date.
+
+        :param stack_name: The external name of the Stack.
+        :returns: The Stack's status, or None if it is not in the snapshot or there is no other
+            Stack to share the snapshot with. In both cases the Stack should be described directly.
+        """
+        with self._condition:
+            if len(self._watched) < 2:
+                return None
+
+            while self._refreshing:
+                self._condition.wait()
+
+            if not self._is_stale():
+                return self._statuses.get(stack_name)
+
+            self._refreshing = True
+
+        statuses = None
+        try:
+            statuses = self._list_in_progress_statuses()
+        finally:
+            with self._condition:
+                self._refreshing = False
+                if statuses is not None:
+                    self._statuses = statuses
+                    self._refreshed_at = time.monotonic()
+                self._condition.notify_all()
+
+        return statuses.get(stack_name)
+
+    def _is_stale(self) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.max_age
+        )
+
+    def _list_in_progress_statuses(self) -> Dict[str, str]:
+        self.logger.debug(
+            "Listing in-progress stacks for %d waiting stacks", len(self._watched)
+        )
+        statuses = {}
+        kwargs = {"StackStatusFilter": IN_PROGRESS_STATUSES}
+        while True:
+            response = self.connection_manager.call(
+                service="cloudformation", command="list_stacks", kwargs=kwargs
+            )
+            for summary in response.get("StackSummaries", []):
+                statuses[summary["StackName"]] = summary["StackStatus"]
+
+            if not response.get("NextToken"):
+                return statuses
+            kwargs["NextToken"] = response["NextToken"]
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+sceptre.rate_limiter
+
+This module implements a RateLimiter, which keeps the rate of AWS API calls made by
+all threads just under the limits AWS applies.
+"""
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from sceptre.exceptions import InvalidConfigFileError
+
+if TYPE_CHECKING:
+    from sceptre.stack import Stack
+
+RATE_LIMITS_OPTION_KEY = "rate_limits"
+RATE_LIMIT_PARAMS = {"rate", "burst"}
+
+# Calls per second and burst size for each service, or "service.operation". CloudFormation
+# throttles its control plane APIs at a few requests per second per account and region.
+DEFAULT_RATE_LIMITS = {
+    "cloudformation": {"rate": 5, "burst": 10},
+}
+
+# When a call is throttled, the rate is multiplied by this.
+THROTTLED_RATE_FACTOR = 0.5
+# The rate is never lowered below this fraction of the configured rate.
+MIN_RATE_FACTOR = 0.05
+# Each successful call raises the rate by this fraction of the configured rate, until it is
+# back to the configured rate.
+RECOVERY_RATE_FACTOR = 0.02
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket. Each call takes a token, and tokens are added back at ``rate``
+    per second up to ``burst``. Callers that find the bucket empty reserve a future token and
+    sleep until it is due, outside the lock, so waiting calls are let through evenly.
+
+    The rate adapts to throttling: it is halved whenever AWS throttles a call and slowly raised
+    back towards the configured rate as calls succeed.
+
+    :param rate: The configured number of calls per second.
+    :param burst: The number of calls that can be made at once after a quiet period.
+    :param clock: Returns the current time, in seconds.
+    :param sleep: Sleeps for the given number of seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated_at = clock()
+
+    def acquire(self) -> float:
+        """
+        Takes a token, waiting for one if there are none left.
+
+        :returns: How long the call waited, in seconds.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait:
+            self._sleep(wait)
+        return wait
+
+    def throttled(self):
+        """
+        Lowers the rate after AWS has throttled a call.
+        """
+        with self._lock:
+            self._refill()
+            self.rate = max(
+                self.rate * THROTTLED_RATE_FACTOR, self.max_rate * MIN_RATE_FACTOR
+            )
+
+    def succeeded(self):
+        """
+        Raises the rate back towards the configured rate after a successful call.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(
+                    self.rate + self.max_rate * RECOVERY_RATE_FACTOR, self.max_rate
+                )
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+
+class RateLimiter(object):
+    """
+    Holds a TokenBucket for each account (or role), region, service and operation.
+
+    Limits set in StackGroup config take precedence over the defaults, and in each of those a
+    limit for ``service.operation`` takes precedence over one for ``service``. As buckets are
+    shared, the limits in place when a bucket is first used apply to every Stack that uses it.
+
+    :param default_limits: The limits used when none are configured.
+    """
+
+    def __init__(self, default_limits: Optional[Dict[str, dict]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.default_limits = (
+            DEFAULT_RATE_LIMITS if default_limits is None else default_limits
+        )
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple, Optional[TokenBucket]] = {}
+
+    @staticmethod
+    def limits_for_stack(stack: "Stack") -> Optional[Dict[str, dict]]:
+        """
+        Returns the ``rate_limits`` options of a Stack's StackGroup config, checking that they
+        are valid.
+
+        :param stack: The Stack whose limits to return.
+        :returns: The limits, with their rates and bursts as numbers, or None if none are set.
+        :raises: sceptre.exceptions.InvalidConfigFileError
+        """
+        configured = stack.stack_group_config.get(RATE_LIMITS_OPTION_KEY)
+        if configured is None:
+            return None
+        if not isinstance(configured, dict):
+            raise InvalidConfigFileError(
+                f"{stack.name} - '{RATE_LIMITS_OPTION_KEY}' must be a mapping of services "
+                f"or operations to limits"
+            )
+
+        limits = {}
+        for name, limit in configured.items():
+            if limit is None:
+                limits[name] = None
+                continue
+            if not isinstance(limit, dict):
+                raise InvalidConfigFileError(
+                    f"{stack.name} - {RATE_LIMITS_OPTION_KEY}.{name} must be a mapping "
+                    f"with a rate and optionally a burst"
+                )
+            unknown = set(limit) - RATE_LIMIT_PARAMS
+            if unknown:
+                raise InvalidConfigFileError(
+                    f"{stack.name} - Unknown {RATE_LIMITS_OPTION_KEY}.{name} options: "
+                    f"{', '.join(sorted(unknown))}"
+                )
+
+            limits[name] = {}
+            for param, value in limit.items():
+                if value is None:
+                    limits[name][param] = None
+                    continue
+                try:
+                    number = float(value)
+                except (TypeError, ValueError):
+                    number = None
+                if isinstance(value, bool) or number is None or number <= 0:
+                    raise InvalidConfigFileError(
+                        f"{stack.name} - {RATE_LIMITS_OPTION_KEY}.{name}.{param} must be a "
+                        f"positive number"
+                    )
+                limits[name][param] = number
+        return limits
+
+    def get_bucket(
+        self,
+        identity: Optional[str],
+        region: Optional[str],
+        service: str,
+        operation: str,
+        limits: Optional[Dict[str, dict]] = None,
+    ) -> Optional[TokenBucket]:
+        """
+        Returns the bucket for a call, or None if the call is not rate limited.
+
+        :param identity: The sceptre_role or profile the call is made with.
+        :param region: The region the call is made in.
+        :param service: The Boto3 service called.
+        :param operation: The Boto3 command called.
+        :param limits: Limits overriding the defaults, as configured in StackGroup config.
+        """
+        key = (identity, region, service, operation)
+        with self._lock:
+            if key not in self._buckets:
+                limit = self._find_limit(service, operation, limits or {})
+                self._buckets[key] = (
+                    TokenBucket(limit["rate"], limit.get("burst") or limit["rate"])
+                    if limit and limit.get("rate")
+                    else None
+                )
+            return self._buckets[key]
+
+    def _find_limit(
+        self, service: str, operation: str, limits: Dict[str, dict]
+    ) -> Optional[dict]:
+        for source in (limits, self.default_limits):
+            for name in (f"{service}.{operation}", service):
+                if name in source:
+                    return source[name]
+        return None
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+sceptre.resolver_stats
+
+This module implements ResolverStats, which records how often each type of resolver is resolved
+on each Stack and how long it takes, so that slow resolvers can be found.
+"""
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from os import path
+from typing import Dict, List, Optional, Tuple
+
+StatsKey = Tuple[str, Optional[str]]
+
+
+class ResolverStats(object):
+    """
+    Holds the number of calls, memo hits and misses, shared cache hits and misses and total wall
+    time of each resolver type on each Stack. The time of a resolver includes the time taken to
+    resolve the resolvers nested in its argument, which are also recorded on their own.
+
+    Lookups in the StackOutputCache and StackExportCache are counted against the resolver being
+    resolved on the thread that made them, so that a cache hit can be told apart from a call to
+    AWS.
+
+    The stats are shared by the whole process and cleared whenever a SceptrePlan starts
+    executing. When the plan finishes they are logged at debug level and, if a report has been
+    enabled, written to it as JSON, along with the exports the Stacks imported.
+    """
+
+    _lock = threading.Lock()
+    _stats: Dict[StatsKey, Dict[str, float]] = {}
+    _report_path: Optional[str] = None
+    _resolving = threading.local()
+
+    logger = logging.getLogger(__name__)
+
+    @classmethod
+    def enable_report(cls, report_path: str):
+        """
+        Writes the stats to a JSON file at the end of every plan.
+
+        :param report_path: The path of the file to write.
+        """
+        cls._report_path = report_path
+
+    @classmethod
+    def record(
+        cls,
+        resolver_type: str,
+        stack_name: Optional[str],
+        seconds: float,
+        memo_hit: Optional[bool] = None,
+    ):
+        """
+        Records a call to a resolver.
+
+        :param resolver_type: The name of the resolver's class.
+        :param stack_name: The name of the Stack the resolver is on.
+        :param seconds: The wall time the call took.
+        :param memo_hit: Whether the value was reused from an identical deterministic resolver,
+            or None if the resolver is not deterministic.
+        """
+        with cls._lock:
+            stat = cls._stat((resolver_type, stack_name))
+            stat["calls"] += 1
+            stat["seconds"] += seconds
+            if memo_hit is not None:
+                stat["memo_hits" if memo_hit else "memo_misses"] += 1
+
+    @classmethod
+    @contextmanager
+    def resolving(cls, resolver_type: str, stack_name: Optional[str]):
+        """
+        Counts the cache lookups made on this thread within the context against a resolver.
+
+        :param resolver_type: The name of the resolver's class.
+        :param stack_name: The name of the Stack the resolver is on.
+        """
+        resolvers = cls._resolving.__dict__.setdefault("resolvers", [])
+        resolvers.append((resolver_type, stack_name))
+        try:
+            yield
+        finally:
+            resolvers.pop()
+
+    @classmethod
+    def record_cache_lookup(cls, hit: bool):
+        """
+        Records a lookup in a shared cache against the resolver being resolved on this thread.
+        Lookups made outside of a resolver are not recorded.
+
+        :param hit: Whether the value was already cached, being fetched by another thread or read
+            from a snapshot, rather than fetched from AWS.
+        """
+        resolvers = getattr(cls._resolving, "resolvers", None)
+        if not resolvers:
+            return
+        with cls._lock:
+            stat = cls._stat(resolvers[-1])
+            stat["cache_hits" if hit else "cache_misses"] += 1
+
+    @classmethod
+    def _stat(cls, key: StatsKey) -> Dict[str, float]:
+        return cls._stats.setdefault(
+            key,
+            {
+                "calls": 0,
+                "memo_hits": 0,
+                "memo_misses": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "seconds": 0.0,
+            },
+        )
+
+    @classmethod
+    def report(cls) -> List[dict]:
+        """
+        Returns the stats of each resolver type on each Stack, slowest first.
+        """
+        with cls._lock:
+            entries = [
+                {"resolver": resolver_type, "stack": stack_name, **stat}
+                for (resolver_type, stack_name), stat in cls._stats.items()
+            ]
+        return sorted(entries, key=lambda entry: entry["seconds"], reverse=True)
+
+    @classmethod
+    def publish(cls, imports: Optional[List[dict]] = None):
+        """
+        Logs the stats at debug level and writes them to the report, if one is enabled.
+
+        :param imports: The exports imported by the Stacks and the Stacks importing each, as
+            returned by ``StackExportCache.imports``.
+        """
+        entries = cls.report()
+        imports = imports or []
+        if not entries and not imports:
+            return
+
+        for entry in entries:
+            cls.logger.debug(
+                "%s on %s: %d calls (%d memo hits, %d misses; %d cache hits, %d misses) "
+                "in %.3fs",
+                entry["resolver"],
+                entry["stack"],
+                entry["calls"],
+                entry["memo_hits"],
+                entry["memo_misses"],
+                entry["cache_hits"],
+                entry["cache_misses"],
+                entry["seconds"],
+            )
+
+        for imported in imports:
+            cls.logger.debug(
+                "Export %s in %s is imported by %s",
+                imported["export"],
+                imported["region"],
+                ", ".join(imported["stacks"]),
+            )
+
+        if cls._report_path is None:
+            return
+        try:
+            directory = path.dirname(cls._report_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(cls._report_path, "w") as report_file:
+                json.dump(
+                    {"resolvers": entries, "imports": imports}, report_file, indent=2
+                )
+        except OSError as err:
+            cls.logger.warning("Could not write resolver report: %s", err)
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops all recorded stats. The report, if enabled, is kept.
+        """
+        with cls._lock:
+            cls._stats.clear()
@@ -1,13 +1,34 @@
 # -*- coding: utf-8 -*-
 import abc
+import copy
+import functools
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from threading import RLock
-from typing import Any, TYPE_CHECKING, Type, Union, TypeVar
+from threading import Lock, RLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Type,
+    Union,
+    TypeVar,
+)
 
 from sceptre.exceptions import InvalidResolverArgumentError
-from sceptre.helpers import _call_func_on_values, delete_keys_from_containers
+from sceptre.helpers import (
+    _call_func_on_values,
+    _copy_paths_to_values,
+    delete_keys_from_containers,
+)
 from sceptre.logging import StackLoggerAdapter
+from sceptre.resolver_stats import ResolverStats
 from sceptre.resolvers.placeholders import (
     create_placeholder_value,
     are_placeholders_enabled,
@@ -25,6 +46,58 @@ class RecursiveResolve(Exception):
     pass
 
 
+# The number of threads shared by all Stacks for resolving io_bound resolvers.
+RESOLVER_POOL_SIZE = 16
+
+_resolver_pool: Optional[ThreadPoolExecutor] = None
+_resolver_pool_lock = Lock()
+
+# Tracks the (Stack, property) pairs that the current thread is in the middle of resolving, so that
+# a property that requires resolving itself can be detected. Resolvers run on the resolver pool
+# carry on the chain of the thread that submitted them.
+_resolution_state = threading.local()
+
+
+def _get_resolution_chain() -> tuple:
+    return getattr(_resolution_state, "chain", ())
+
+
+def _mark_resolver_pool_thread():
+    _resolution_state.in_resolver_pool = True
+
+
+def _submit_to_resolver_pool(func: Callable[[], Any]) -> Future:
+    """Runs a function on the resolver pool, as part of the current thread's resolution chain."""
+    global _resolver_pool
+    with _resolver_pool_lock:
+        if _resolver_pool is None:
+            _resolver_pool = ThreadPoolExecutor(
+                max_workers=RESOLVER_POOL_SIZE,
+                thread_name_prefix="sceptre-resolver",
+                initializer=_mark_resolver_pool_thread,
+            )
+
+    chain = _get_resolution_chain()
+
+    def run():
+        _resolution_state.chain = chain
+        try:
+            return func()
+        finally:
+            _resolution_state.chain = ()
+
+    return _resolver_pool.submit(run)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Converts nested lists and dicts into tuples so they can be used in a dict key."""
+    if isinstance(value, dict):
+        return dict, tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return list, tuple(_freeze(item) for item in value)
+    return value
+
+
 class CustomYamlTagBase:
     """A base class for custom Yaml Elements (i.e. hooks and resolvers).
 
@@ -93,7 +166,7 @@ class CustomYamlTagBase:
         keys_to_delete = []
 
         def resolve(containing_list_or_dict, key, obj: Resolver):
-            result = obj.resolve()
+            result = obj.resolve_memoised()
             # If the resolver "resolves to nothing", then it should get deleted out of its container.
             if result is None:
                 keys_to_delete.append((containing_list_or_dict, key))
@@ -119,26 +192,19 @@ class CustomYamlTagBase:
     def _recursively_clone(self: Self, stack: "stack.Stack") -> Self:
         """Recursively clones the instance and its arguments.
 
-        The returned instance will have an identical argument that is a different memory reference,
-        so that instances inherited from a stack group and applied across multiple stacks are
-        independent of each other.
+        The returned instance will have an identical argument, in which every list and dict that
+        holds a resolver is a different memory reference, so that instances inherited from a stack
+        group and applied across multiple stacks are independent of each other. Lists and dicts
+        without resolvers in them are shared, since resolving the argument never changes them.
 
         Furthermore, all nested resolvers in this resolver's argument will also be cloned to ensure
         they themselves are also independent and fully configured for the current stack.
         """
-
-        def recursively_clone_arguments(obj):
-            if isinstance(obj, Resolver):
-                return obj._recursively_clone(stack)
-            if isinstance(obj, list):
-                return [recursively_clone_arguments(item) for item in obj]
-            elif isinstance(obj, dict):
-                return {
-                    key: recursively_clone_arguments(val) for key, val in obj.items()
-                }
-            return obj
-
-        argument = recursively_clone_arguments(self._argument)
+        argument = _copy_paths_to_values(
+            lambda resolver: resolver._recursively_clone(stack),
+            self._argument,
+            Resolver,
+        )
         clone = type(self)(argument, stack)
         return clone
 
@@ -180,8 +246,23 @@ class CustomYamlTagBase:
 class Resolver(CustomYamlTagBase, metaclass=abc.ABCMeta):
     """
     Resolver is an abstract base class that should be subclassed by all Resolvers.
+
+    Resolvers that spend most of their time waiting on network I/O should set ``io_bound`` to True.
+    Such resolvers are resolved concurrently with the other resolvers in the same dict or list,
+    so their ``resolve`` method must not rely on the order resolvers are resolved in.
+
+    Resolvers whose result only depends on their class, their resolved argument and their
+    ``memo_key`` should set ``deterministic`` to True. The result of such a resolver is then
+    reused for every identical resolver (on any Stack) until ``clear_memo`` is called, which
+    happens whenever a SceptrePlan starts executing.
     """
 
+    io_bound = False
+    deterministic = False
+
+    _memo: Dict[Hashable, Any] = {}
+    _memo_lock = Lock()
+
     @abc.abstractmethod
     def resolve(self):
         """
@@ -192,6 +273,59 @@ class Resolver(CustomYamlTagBase, metaclass=abc.ABCMeta):
         """
         pass  # pragma: no cover
 
+    def memo_key(self) -> Hashable:
+        """
+        Returns anything other than the class and resolved argument that the result of a
+        deterministic resolver depends on, such as the modification time of a file it reads.
+        """
+        return None
+
+    @classmethod
+    def clear_memo(cls):
+        """Forgets the results of all deterministic resolvers."""
+        with cls._memo_lock:
+            cls._memo.clear()
+
+    def resolve_memoised(self) -> Any:
+        """
+        Resolves the resolver, reusing the result of an identical resolver if it is deterministic.
+        This should be used rather than calling ``resolve`` directly. Every call is recorded in
+        the ResolverStats.
+
+        :return: The resolved value.
+        """
+        resolver_type = type(self).__name__
+        stack_name = getattr(self.stack, "name", None)
+        start = time.perf_counter()
+        memo_hit = None
+        try:
+            with ResolverStats.resolving(resolver_type, stack_name):
+                if not self.deterministic:
+                    return self.resolve()
+
+                try:
+                    key = (type(self), _freeze(self.argument), self.memo_key())
+                    hash(key)
+                except TypeError:
+                    # The argument isn't something that can be compared, so the result can't
+                    # be reused.
+                    return self.resolve()
+
+                with self._memo_lock:
+                    memo_hit = key in self._memo
+                    if memo_hit:
+                        # Copied so that Stacks can't change each other's values.
+                        return copy.deepcopy(self._memo[key])
+
+                result = self.resolve()
+                with self._memo_lock:
+                    self._memo[key] = copy.deepcopy(result)
+                return result
+        finally:
+            ResolverStats.record(
+                resolver_type, stack_name, time.perf_counter() - start, memo_hit
+            )
+
     def raise_invalid_argument_error(self, message, from_: Exception = None):
         error_message = f"{self.stack.name} - {message}"
         if from_:
@@ -214,7 +348,10 @@ class ResolvableProperty(abc.ABC):
         self.logger = logging.getLogger(__name__)
         self.placeholder_type = placeholder_type
 
-        self._lock = RLock()
+        # This only guards creating the locks for each Stack. Since this descriptor is shared by
+        # every Stack, locking the value itself here would stop different Stacks from resolving
+        # their values at the same time.
+        self._locks_lock = Lock()
 
     def __get__(self, stack: "stack.Stack", stack_class: Type["stack.Stack"]) -> Any:
         """
@@ -225,7 +362,10 @@ class ResolvableProperty(abc.ABC):
         :return: The attribute stored with the suffix ``name`` in the instance.
         :rtype: The obtained value, as resolved by the property
         """
-        with self._lock, self._no_recursive_get(stack):
+        if stack is None:
+            # The property is being accessed on the class rather than on a Stack.
+            return self
+        with self._no_recursive_get(stack), self._get_lock(stack):
             if hasattr(stack, self.name):
                 return self.get_resolved_value(stack, stack_class)
 
@@ -237,27 +377,43 @@ class ResolvableProperty(abc.ABC):
         :param stack: The Stack instance the value is being set onto
         :param value: The value being set on the property
         """
-        with self._lock:
+        with self._get_lock(stack):
             self.assign_value_to_stack(stack, value)
 
+    def _get_lock(self, stack: "stack.Stack") -> RLock:
+        """Returns the lock guarding this property on a single Stack instance.
+
+        The lock is reentrant so that resolving a value can access it again (raising
+        RecursiveResolve rather than deadlocking). Resolvers that access this property on OTHER
+        Stacks take those Stacks' locks, which follow the direction of the dependency graph.
+
+        :param stack: The Stack instance the property is being accessed on
+        :return: The lock for this property on that Stack
+        """
+        lock_name = f"{self.name}_lock"
+        lock = vars(stack).get(lock_name)
+        if lock is None:
+            with self._locks_lock:
+                lock = vars(stack).setdefault(lock_name, RLock())
+        return lock
+
     @contextmanager
     def _no_recursive_get(self, stack: "stack.Stack"):
         # We don't care about recursive gets on the same property but different Stack instances,
         # only recursive gets on the same stack. Some Resolvers access the same property on OTHER
-        # stacks and that actually shouldn't be a problem. Remember, these descriptor instances are
-        # set on the CLASS and so instance variables on them are shared across all classes that
-        # access them. Thus, we set this "get_in_progress" attribute on the stack instance rather
-        # than the descriptor instance.
-        get_status_name = f"_{self.name}_get_in_progress"
-        if getattr(stack, get_status_name, False):
+        # stacks and that actually shouldn't be a problem. This is checked before taking the
+        # Stack's lock, since the thread holding it may be waiting on this one to resolve a value.
+        key = (id(stack), self.name)
+        chain = _get_resolution_chain()
+        if key in chain:
             raise RecursiveResolve(
                 f"Resolving Stack.{self.name[1:]} required resolving itself"
             )
-        setattr(stack, get_status_name, True)
+        _resolution_state.chain = chain + (key,)
         try:
             yield
         finally:
-            setattr(stack, get_status_name, False)
+            _resolution_state.chain = chain
 
     @abc.abstractmethod
     def get_resolved_value(
@@ -281,7 +437,7 @@ class ResolvableProperty(abc.ABC):
         :return: The resolved value (or placeholder, in certain circumstances)
         """
         try:
-            return resolver.resolve()
+            return resolver.resolve_memoised()
         except RecursiveResolve:
             # Recursive resolve issues shouldn't be masked by a placeholder.
             raise
@@ -319,8 +475,10 @@ class ResolvableContainerProperty(ResolvableProperty):
         self, stack: "stack.Stack", stack_class: Type["stack.Stack"]
     ) -> T_Container:
         container = super().__get__(stack, stack_class)
+        if stack is None:
+            return container
 
-        with self._lock:
+        with self._get_lock(stack):
             # Resolve any deferred resolvers, now that the recursive get lock has been released.
             self._resolve_deferred_resolvers(stack, container)
 
@@ -337,12 +495,20 @@ class ResolvableContainerProperty(ResolvableProperty):
         :param stack_class: The class of the Stack instance.
         :return: The fully resolved container.
         """
-        keys_to_delete = []
+        container = getattr(stack, self.name)
+        found = []
+        _call_func_on_values(
+            lambda attr, key, value: found.append((attr, key, value)),
+            container,
+            Resolver,
+        )
+        results = self._resolve_values([value for _, _, value in found])
 
-        def resolve(attr: Union[dict, list], key: Union[int, str], value: Resolver):
+        keys_to_delete = []
+        for (attr, key, value), get_result in zip(found, results):
             # Update the container key's value with the resolved value, if possible...
             try:
-                result = self.resolve_resolver_value(value)
+                result = get_result()
                 if result is None:
                     self.logger.debug(
                         f"Removing item {key} because resolver returned None."
@@ -350,8 +516,7 @@ class ResolvableContainerProperty(ResolvableProperty):
                     # We gather up resolvers (and their immediate containers) that resolve to None,
                     # since that really means the resolver resolves to nothing. This is not common,
                     # but should be supported. We gather these rather than immediately remove them
-                    # because this function is called in the context of looping over that attr, so
-                    # we cannot alter its size until after the loop is complete.
+                    # because removing them would shift the indexes of the other items in lists.
                     keys_to_delete.append((attr, key))
                 else:
                     attr[key] = result
@@ -364,15 +529,66 @@ class ResolvableContainerProperty(ResolvableProperty):
                     stack,
                     self.name,
                     key,
-                    lambda: value.resolve(),
+                    value.resolve_memoised,
                 )
 
-        container = getattr(stack, self.name)
-        _call_func_on_values(resolve, container, Resolver)
         delete_keys_from_containers(keys_to_delete)
 
         return container
 
+    def _resolve_values(self, resolvers: List[Resolver]) -> List[Callable[[], Any]]:
+        """Starts resolving the io_bound resolvers concurrently on the resolver pool.
+
+        Other resolvers, and all resolvers when there is only one io_bound resolver or this is
+        already running on the resolver pool, are resolved one after another when their result is
+        asked for, in the order they are in the container.
+
+        :param resolvers: The resolvers in the container, in order.
+        :return: For each resolver, a function that returns its resolved value or raises the
+            error raised by resolving it.
+        """
+        results = [
+            functools.partial(self.resolve_resolver_value, resolver)
+            for resolver in resolvers
+        ]
+        concurrent = [
+            index
+            for index, resolver in enumerate(resolvers)
+            if self._is_io_bound(resolver)
+        ]
+        if len(concurrent) < 2 or getattr(_resolution_state, "in_resolver_pool", False):
+            return results
+
+        for index in concurrent:
+            results[index] = self._wait_for(
+                _submit_to_resolver_pool(results[index]), results[index]
+            )
+        return results
+
+    @staticmethod
+    def _wait_for(future: Future, resolve: Callable[[], Any]) -> Callable[[], Any]:
+        def get_result():
+            # If the pool hasn't started resolving it yet, it is quicker (and avoids waiting on a
+            # pool that is busy with other Stacks) to resolve it on this thread instead.
+            if future.cancel():
+                return resolve()
+            return future.result()
+
+        return get_result
+
+    @classmethod
+    def _is_io_bound(cls, resolver: Resolver) -> bool:
+        """Returns whether a resolver, or any resolver nested in its argument, is io_bound."""
+        if resolver.io_bound:
+            return True
+        nested = []
+        _call_func_on_values(
+            lambda attr, key, value: nested.append(value),
+            [resolver._argument],
+            Resolver,
+        )
+        return any(cls._is_io_bound(value) for value in nested)
+
     def assign_value_to_stack(self, stack: "stack.Stack", value: Union[dict, list]):
         """Assigns a COPY of the specified value to the stack instance. This method copies the value
         rather than directly assigns it to avoid bugs related to shared objects in memory.
@@ -386,24 +602,25 @@ class ResolvableContainerProperty(ResolvableProperty):
     def _clone_container_with_resolvers(
         self, container: T_Container, stack: "stack.Stack"
     ) -> T_Container:
-        """Recurses into the container, cloning and setting up resolvers and creating a copy of all
-        nested containers.
+        """Copies the container, cloning and setting up resolvers.
+
+        Resolving the container replaces resolvers in, and removes them from, the lists and dicts
+        that hold them, so those are copied for each stack. Nested lists and dicts without any
+        resolvers in them are never changed, so they are shared with the original container
+        rather than copied. This matters for large values inherited from StackGroup configs, which
+        are cloned for every stack in the group.
 
         :param container: The container being recursed into and cloned
         :param stack: The stack the container is being copied for
-        :return: The fully copied container with resolvers fully set up.
+        :return: The copied container with resolvers fully set up.
         """
-
-        def recurse(obj):
-            if isinstance(obj, Resolver):
-                return obj.clone_for_stack(stack)
-            if isinstance(obj, list):
-                return [recurse(item) for item in obj]
-            elif isinstance(obj, dict):
-                return {key: recurse(val) for key, val in obj.items()}
-            return obj
-
-        return recurse(container)
+        cloned = _copy_paths_to_values(
+            lambda resolver: resolver.clone_for_stack(stack), container, Resolver
+        )
+        if cloned is container and isinstance(container, (list, dict)):
+            # The top-level container is always the stack's own, since it is cheap to copy.
+            cloned = copy.copy(container)
+        return cloned
 
     def _resolve_deferred_resolvers(self, stack: "stack.Stack", container: T_Container):
         def raise_if_not_resolved(attr, key, value):
@@ -13,6 +13,8 @@ class EnvironmentVariable(Resolver):
     :type argument: str
     """
 
+    deterministic = True
+
     def __init__(self, *args, **kwargs):
         super(EnvironmentVariable, self).__init__(*args, **kwargs)
 
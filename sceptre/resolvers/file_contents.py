@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import os
+
 from sceptre.resolvers import Resolver
 
 
@@ -11,9 +13,21 @@ class FileContents(Resolver):
     :type argument: str
     """
 
+    deterministic = True
+
     def __init__(self, *args, **kwargs):
         super(FileContents, self).__init__(*args, **kwargs)
 
+    def memo_key(self):
+        """
+        Returns the modification time of the file, so that its contents are read again if it
+        changes.
+        """
+        try:
+            return os.stat(self.argument).st_mtime_ns
+        except (EnvironmentError, TypeError):
+            return None
+
     def resolve(self):
         """
         Retrieves the contents of a file at a given absolute file path.
@@ -19,6 +19,8 @@ class Join(Resolver):
 
     """
 
+    deterministic = True
+
     def resolve(self):
         error_message = (
             "The argument to !join must be a 2-element list, where the first element is the join "
@@ -22,6 +22,8 @@ class Select(Resolver):
            - !split ["/", !stack_output my/database/stack.yaml::ConnectionString]
     """
 
+    deterministic = True
+
     def resolve(self):
         error_message = (
             "The argument to !select must be a two-element list, where the first element is the "
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import shlex
+
+from sceptre.exceptions import ExportDoesNotExistError, SceptreException
+from sceptre.export_cache import StackExportCache
+from sceptre.resolvers import Resolver
+
+
+class StackExport(Resolver):
+    """
+    Resolver for retrieving the value of a CloudFormation export in the current Sceptre
+    stack_group's account and region, or those of another profile.
+
+    The exports of each account and region are listed once and shared by every ``!stack_export``
+    resolver, however many exports they read.
+
+    :param argument: The export name, optionally followed by the profile, region and
+        sceptre_role to list the exports with.
+    :type argument: str in the format ``"<export name> [<profile>[::<region>[::<sceptre_role>]]]"``
+    """
+
+    io_bound = True
+
+    def __init__(self, *args, **kwargs):
+        self.logger = logging.getLogger(__name__)
+        super(StackExport, self).__init__(*args, **kwargs)
+
+    def resolve(self):
+        """
+        Retrieves the value of a CloudFormation export.
+
+        :returns: The value of the export.
+        :rtype: str
+        :raises: sceptre.exceptions.ExportDoesNotExistError
+        """
+        self.logger.debug("Resolving Stack export: {0}".format(self.argument))
+        export_name, profile, region, sceptre_role = self._parse_argument(self.argument)
+
+        settings = self.stack.connection_manager.get_call_settings(
+            profile, region, sceptre_role=sceptre_role
+        )
+        key = StackExportCache.key(*settings)
+        exports = StackExportCache.get_exports(
+            key, lambda: self._list_exports(*settings)
+        )
+        StackExportCache.record_import(key, export_name, self.stack.name)
+
+        try:
+            return exports[export_name]
+        except KeyError:
+            raise ExportDoesNotExistError(
+                "No export named '{0}' exists in {1}".format(export_name, settings[1])
+            )
+
+    def _list_exports(self, profile, region, sceptre_role):
+        """
+        Communicates with AWS CloudFormation to list every export in a region.
+
+        :returns: The exports, as a dict of export names to values.
+        :rtype: dict
+        """
+        self.logger.debug("Listing exports in '{0}'...".format(region))
+        exports = {}
+        kwargs = {}
+        while True:
+            response = self.stack.connection_manager.call(
+                service="cloudformation",
+                command="list_exports",
+                kwargs=kwargs,
+                profile=profile,
+                region=region,
+                sceptre_role=sceptre_role,
+            )
+            for export in response.get("Exports", []):
+                exports[export["Name"]] = export["Value"]
+
+            if not response.get("NextToken"):
+                return exports
+            kwargs["NextToken"] = response["NextToken"]
+
+    @staticmethod
+    def _parse_argument(argument):
+        """
+        Parses the resolver's argument.
+
+        :param argument: The resolver's argument.
+        :type argument: str
+        :returns: The export name, profile, region and sceptre_role.
+        :rtype: tuple
+        :raises: sceptre.exceptions.SceptreException
+        """
+        arguments = shlex.split(argument) if isinstance(argument, str) else []
+
+        if not arguments or len(arguments) > 2:
+            message = (
+                "!stack_export arg should match "
+                "EXPORT_NAME [PROFILE[::REGION[::SCEPTRE_ROLE]]]"
+            )
+            raise SceptreException(message)
+
+        profile = region = sceptre_role = None
+
+        if len(arguments) > 1:
+            extra_args = arguments[1].split("::")
+            if len(extra_args) > 3:
+                message = (
+                    "!stack_export second arg should be "
+                    "in the format 'PROFILE[::REGION[::SCEPTRE_ROLE]]'"
+                )
+                raise SceptreException(message)
+            profile, region, sceptre_role = extra_args + [None] * (3 - len(extra_args))
+
+        return arguments[0], profile, region, sceptre_role
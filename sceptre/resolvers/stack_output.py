@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import functools
 import logging
 import shlex
 
@@ -13,6 +12,7 @@ from sceptre.exceptions import (
 )
 
 from sceptre.helpers import normalise_path, sceptreise_path
+from sceptre.output_cache import StackOutputCache
 from sceptre.resolvers import Resolver
 
 TEMPLATE_EXTENSION = ".yaml"
@@ -23,6 +23,8 @@ class StackOutputBase(Resolver):
     A abstract base class which provides methods for getting Stack outputs.
     """
 
+    io_bound = True
+
     def __init__(self, *args, **kwargs):
         self.logger = logging.getLogger(__name__)
         super(StackOutputBase, self).__init__(*args, **kwargs)
@@ -52,9 +54,34 @@ class StackOutputBase(Resolver):
                 )
             )
 
-    @functools.lru_cache(maxsize=4096)
     def _get_stack_outputs(
         self, stack_name, profile=None, region=None, sceptre_role=None
+    ):
+        """
+        Gets the outputs of a specific Stack, from the StackOutputCache shared by
+        all resolvers if they have already been fetched.
+
+        :param stack_name: Name of the Stack to collect output for.
+        :type stack_name: str
+        :returns: A formatted version of the Stack outputs.
+        :rtype: dict
+        :raises: sceptre.stack.DependencyStackNotLaunchedException
+        """
+        key = StackOutputCache.key(
+            *self.stack.connection_manager.get_call_settings(
+                profile, region, stack_name, sceptre_role
+            ),
+            stack_name,
+        )
+        return StackOutputCache.get_outputs(
+            key,
+            lambda: self._fetch_stack_outputs(
+                stack_name, profile, region, sceptre_role
+            ),
+        )
+
+    def _fetch_stack_outputs(
+        self, stack_name, profile=None, region=None, sceptre_role=None
     ):
         """
         Communicates with AWS CloudFormation to fetch outputs from a specific
@@ -95,6 +122,17 @@ class StackOutputBase(Resolver):
 
         return formatted_outputs
 
+    def prefetch_target(self):
+        """
+        Returns the Stack whose outputs this resolver will read, so that they can be fetched
+        in bulk before resolution.
+
+        :returns: The Stack name, profile, region and sceptre_role that will be passed to
+            ``_get_output_value``, or None if they cannot be known without resolving anything.
+        :rtype: tuple or None
+        """
+        return None
+
 
 class StackOutput(StackOutputBase):
     """
@@ -131,6 +169,32 @@ class StackOutput(StackOutputBase):
         :rtype: str
         """
         self.logger.debug("Resolving Stack output: {0}".format(self.argument))
+        stack, stack_name = self._get_dependency_stack()
+
+        return self._get_output_value(
+            stack_name,
+            self.output_key,
+            profile=stack.profile,
+            region=stack.region,
+            sceptre_role=stack.sceptre_role,
+        )
+
+    def prefetch_target(self):
+        stack, stack_name = self._get_dependency_stack()
+        # Resolving the dependency's sceptre_role could read other outputs, so the outputs of a
+        # Stack with a resolvable sceptre_role are left to be fetched when they are resolved.
+        sceptre_role = getattr(stack, "_sceptre_role", None)
+        if isinstance(sceptre_role, Resolver):
+            return None
+        return stack_name, stack.profile, stack.region, sceptre_role
+
+    def _get_dependency_stack(self):
+        """
+        Finds the dependency Stack this resolver reads outputs from.
+
+        :returns: The dependency Stack and its external name.
+        :rtype: tuple
+        """
         friendly_stack_name = self.dependency_stack_name.replace(TEMPLATE_EXTENSION, "")
 
         stack = next(
@@ -142,14 +206,7 @@ class StackOutput(StackOutputBase):
         stack_name = "-".join(
             [stack.project_code, friendly_stack_name.replace("/", "-")]
         )
-
-        return self._get_output_value(
-            stack_name,
-            self.output_key,
-            profile=stack.profile,
-            region=stack.region,
-            sceptre_role=stack.sceptre_role,
-        )
+        return stack, stack_name
 
 
 class StackOutputExternal(StackOutputBase):
@@ -173,7 +230,30 @@ class StackOutputExternal(StackOutputBase):
         """
         self.logger.debug("Resolving external Stack output: {0}".format(self.argument))
 
-        arguments = shlex.split(self.argument)
+        dependency_stack_name, output_key, *settings = self._parse_argument(
+            self.argument
+        )
+        return self._get_output_value(dependency_stack_name, output_key, *settings)
+
+    def prefetch_target(self):
+        # An argument containing other resolvers can only be parsed once they are resolved.
+        if not isinstance(self._argument, str):
+            return None
+        dependency_stack_name, _, *settings = self._parse_argument(self._argument)
+        return (dependency_stack_name, *settings)
+
+    @staticmethod
+    def _parse_argument(argument):
+        """
+        Parses the resolver's argument.
+
+        :param argument: The resolver's argument.
+        :type argument: str
+        :returns: The Stack name, output key, profile, region and sceptre_role.
+        :rtype: tuple
+        :raises: sceptre.exceptions.SceptreException
+        """
+        arguments = shlex.split(argument)
 
         if not arguments:
             message = "!stack_output_external requires at least one argument"
@@ -210,6 +290,4 @@ class StackOutputExternal(StackOutputBase):
             except StopIteration:
                 pass
 
-        return self._get_output_value(
-            dependency_stack_name, output_key, profile, region, sceptre_role
-        )
+        return dependency_stack_name, output_key, profile, region, sceptre_role
@@ -22,6 +22,8 @@ class Sub(Resolver):
              database: {{var.database}}
     """
 
+    deterministic = True
+
     def resolve(self):
         error_message = (
             "The argument to !sub must be a two-element list, where the first element is the "
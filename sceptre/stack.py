@@ -8,8 +8,9 @@ This module implements a Stack class, which stores a Stack's data.
 """
 
 import logging
+import threading
 
-from typing import List, Dict, Union, Any, Optional
+from typing import List, Dict, Union, Any, Optional, Tuple
 from deprecation import deprecated
 
 from sceptre import __version__
@@ -21,6 +22,7 @@ from sceptre.helpers import (
     create_deprecated_alias_property,
 )
 from sceptre.hooks import Hook, HookProperty
+from sceptre.rate_limiter import RateLimiter
 from sceptre.resolvers import (
     ResolvableContainerProperty,
     ResolvableValueProperty,
@@ -128,6 +130,10 @@ class Stack:
     :param config: The complete config for the stack. Used by dump config.
     """
 
+    # The IDs given to each canonical Stack path, shared by every Stack with that path.
+    _identity_ids: Dict[str, int] = {}
+    _identity_lock = threading.Lock()
+
     parameters = ResolvableContainerProperty("parameters")
     sceptre_user_data = ResolvableContainerProperty(
         "sceptre_user_data", PlaceholderType.alphanum
@@ -211,6 +217,7 @@ class Stack:
         self.logger = logging.getLogger(__name__)
 
         self.name = sceptreise_path(name)
+        self._identity = self._intern_identity(self.name)
         self.project_code = project_code
         self.region = region
         self.required_version = required_version
@@ -336,9 +343,26 @@ class Stack:
         return self.name
 
     def __eq__(self, stack):
-        # We should not use any resolvable properties in __eq__, since it is used when adding the
-        # Stack to a set, which is done very early in plan resolution. Trying to reference resolvers
-        # before the plan is fully resolved can potentially blow up.
+        # Stacks are identified by their canonical path alone, so that comparing and hashing them
+        # (which sets, dicts and the StackGraph do constantly) never has to look at their
+        # dependencies. Use structurally_equal to compare their configuration.
+        if not isinstance(stack, Stack):
+            return NotImplemented
+        return self._identity == stack._identity
+
+    def __hash__(self):
+        return self._identity[0]
+
+    def structurally_equal(self, stack: "Stack") -> bool:
+        """
+        Returns whether another Stack has the same configuration as this one. Dependencies are
+        compared by identity, rather than by their own configuration.
+
+        :param stack: The Stack to compare with.
+        """
+        # We should not use any resolvable properties here, since Stacks may be compared before
+        # the plan is fully resolved, and trying to reference resolvers then can potentially
+        # blow up.
         return (
             self.name == stack.name
             and self.external_name == stack.external_name
@@ -359,8 +383,15 @@ class Stack:
             and self.obsolete == stack.obsolete
         )
 
-    def __hash__(self):
-        return hash(str(self))
+    @classmethod
+    def _intern_identity(cls, name: str) -> Tuple[int, str]:
+        """
+        Returns the identity of the Stack with a canonical path: an ID shared by every Stack with
+        that path, along with the path itself.
+        """
+        with cls._identity_lock:
+            identity_id = cls._identity_ids.setdefault(name, len(cls._identity_ids))
+        return identity_id, name
 
     @property
     def connection_manager(self) -> ConnectionManager:
@@ -393,6 +424,7 @@ class Stack:
                 self.external_name,
                 sceptre_role,
                 self.sceptre_role_session_duration,
+                rate_limits=RateLimiter.limits_for_stack(self),
             )
             if cache_connection_manager:
                 self._connection_manager = connection_manager
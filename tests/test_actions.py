@@ -10,12 +10,14 @@ from dateutil.tz import tzutc
 
 from sceptre.exceptions import (
     CannotUpdateFailedStackError,
+    InvalidConfigFileError,
     ProtectedStackError,
     StackDoesNotExistError,
     UnknownStackChangeSetStatusError,
     UnknownStackStatusError,
 )
 from sceptre.plan.actions import StackActions
+from sceptre.plan.event_tailer import StackEventTailer
 from sceptre.stack import Stack
 from sceptre.stack_status import StackChangeSetStatus, StackStatus
 from sceptre.template import Template
@@ -68,6 +70,13 @@ class TestStackActions(object):
     def teardown_method(self, test_method):
         self.patcher_connection_manager.stop()
 
+    def test_init__invalid_polling_config__raises_before_any_operation(self):
+        self.stack.stack_group_config = {"polling": {"stack": {"jitter": 1.5}}}
+
+        with pytest.raises(InvalidConfigFileError, match="jitter"):
+            StackActions(self.stack)
+        self.mock_ConnectionManager.return_value.call.assert_not_called()
+
     @patch("sceptre.stack.Template")
     def test_template_loads_template(self, mock_Template):
         self.stack._template = None
@@ -558,10 +567,20 @@ class TestStackActions(object):
 
     @patch("sceptre.plan.actions.StackActions._describe")
     def test_describe_outputs_sends_correct_request(self, mock_describe):
-        mock_describe.return_value = {"Stacks": [{"Outputs": sentinel.outputs}]}
+        outputs = [{"OutputKey": "Key", "OutputValue": "Value"}]
+        mock_describe.return_value = {"Stacks": [{"Outputs": outputs}]}
         response = self.actions.describe_outputs()
         mock_describe.assert_called_once_with()
-        assert response == {self.stack.name: sentinel.outputs}
+        assert response == {self.stack.name: outputs}
+
+    @patch("sceptre.plan.actions.StackOutputCache.set_outputs")
+    @patch("sceptre.plan.actions.StackActions._describe")
+    def test_describe_outputs_caches_outputs(self, mock_describe, mock_set_outputs):
+        mock_describe.return_value = {
+            "Stacks": [{"Outputs": [{"OutputKey": "Key", "OutputValue": "Value"}]}]
+        }
+        self.actions.describe_outputs()
+        mock_set_outputs.assert_called_once_with(ANY, {"Key": "Value"})
 
     @patch("sceptre.plan.actions.StackActions._describe")
     def test_describe_outputs_handles_stack_with_no_outputs(self, mock_describe):
@@ -957,7 +976,104 @@ class TestStackActions(object):
         else:
             mock_call_type = mock_log_new_events.mock_calls[0].args[0]
 
-        assert type(mock_call_type) is datetime.datetime
+        assert type(mock_call_type) is StackEventTailer
+
+    @patch("sceptre.plan.actions.StackActions._log_new_events")
+    @patch("sceptre.plan.actions.StackActions._get_status")
+    @patch("sceptre.plan.actions.StackActions._get_simplified_status")
+    @patch("sceptre.plan.actions.StackOutputCache.invalidate")
+    def test_wait_for_completion_invalidates_cached_outputs(
+        self,
+        mock_invalidate,
+        mock_get_simplified_status,
+        mock_get_status,
+        mock_log_new_events,
+    ):
+        mock_get_simplified_status.return_value = StackStatus.COMPLETE
+
+        self.actions._wait_for_completion()
+
+        mock_invalidate.assert_called_once_with(
+            self.actions.stack.region, self.actions.stack.external_name
+        )
+
+    @pytest.mark.parametrize(
+        "stack_status, expected_outputs",
+        [
+            pytest.param("UPDATE_COMPLETE", {"VpcId": "vpc-123"}, id="updated"),
+            pytest.param("UPDATE_ROLLBACK_COMPLETE", None, id="failed"),
+            pytest.param("DELETE_COMPLETE", None, id="deleted"),
+        ],
+    )
+    @patch("sceptre.plan.actions.time.sleep")
+    @patch("sceptre.plan.actions.StackActions._log_new_events")
+    @patch("sceptre.plan.actions.StackOutputCache.set_outputs")
+    def test_wait_for_completion_publishes_outputs_of_completed_stack(
+        self,
+        mock_set_outputs,
+        mock_log_new_events,
+        mock_sleep,
+        stack_status,
+        expected_outputs,
+    ):
+        self.actions.connection_manager.call.return_value = {
+            "Stacks": [
+                {
+                    "StackStatus": stack_status,
+                    "Outputs": [{"OutputKey": "VpcId", "OutputValue": "vpc-123"}],
+                }
+            ]
+        }
+
+        self.actions._wait_for_completion()
+
+        if expected_outputs is None:
+            mock_set_outputs.assert_not_called()
+        else:
+            mock_set_outputs.assert_called_once_with(ANY, expected_outputs)
+
+    @patch("sceptre.plan.actions.time.sleep")
+    @patch("sceptre.plan.actions.StackActions._log_new_events")
+    @patch("sceptre.plan.actions.StackActions._get_polled_status")
+    def test_wait_for_completion__unchanged_in_shared_snapshot__skips_events(
+        self, mock_get_polled_status, mock_log_new_events, mock_sleep
+    ):
+        self.actions.polling_policies["stack"] = Mock()
+        self.actions.polling_policies["stack"].delays.return_value = iter([10] * 10)
+        mock_get_polled_status.side_effect = [
+            ("UPDATE_IN_PROGRESS", True),
+            ("UPDATE_IN_PROGRESS", True),
+            ("UPDATE_IN_PROGRESS", True),
+            ("UPDATE_IN_PROGRESS", True),
+            ("UPDATE_IN_PROGRESS", True),
+            ("UPDATE_COMPLETE", False),
+        ]
+
+        self.actions._wait_for_completion()
+
+        # On the first poll, once EVENT_TAIL_INTERVAL has passed, and on completion.
+        assert mock_log_new_events.call_count == 3
+
+    @patch("sceptre.plan.actions.StackActions._get_status")
+    def test_get_polled_status__in_shared_snapshot__does_not_describe_stack(
+        self, mock_get_status
+    ):
+        poller = Mock()
+        poller.get_status.return_value = "UPDATE_IN_PROGRESS"
+
+        assert self.actions._get_polled_status(poller) == ("UPDATE_IN_PROGRESS", True)
+        poller.get_status.assert_called_once_with(sentinel.external_name)
+        mock_get_status.assert_not_called()
+
+    @patch("sceptre.plan.actions.StackActions._get_status")
+    def test_get_polled_status__not_in_shared_snapshot__describes_stack(
+        self, mock_get_status
+    ):
+        poller = Mock()
+        poller.get_status.return_value = None
+        mock_get_status.return_value = "UPDATE_COMPLETE"
+
+        assert self.actions._get_polled_status(poller) == ("UPDATE_COMPLETE", False)
 
     @pytest.mark.parametrize(
         "test_input,expected",
@@ -978,18 +1094,18 @@ class TestStackActions(object):
         with pytest.raises(UnknownStackStatusError):
             self.actions._get_simplified_status("UNKOWN_STATUS")
 
-    @patch("sceptre.plan.actions.StackActions.describe_events")
-    def test_log_new_events_calls_describe_events(self, mock_describe_events):
-        mock_describe_events.return_value = {"StackEvents": []}
-        self.actions._log_new_events(datetime.datetime.now(datetime.timezone.utc))
-        self.actions.describe_events.assert_called_once_with()
+    def test_log_new_events_gets_new_events_from_tailer(self):
+        event_tailer = Mock()
+        event_tailer.new_events.return_value = iter([])
+        self.actions._log_new_events(event_tailer)
+        event_tailer.new_events.assert_called_once_with()
 
-    @patch("sceptre.plan.actions.StackActions.describe_events")
-    def test_log_new_events_prints_correct_event(self, mock_describe_events, caplog):
+    def test_log_new_events_prints_correct_event(self, caplog):
         with caplog.at_level("DEBUG"):
             self.actions.stack.name = "stack-name"
-            mock_describe_events.return_value = {
-                "StackEvents": [
+            event_tailer = Mock()
+            event_tailer.new_events.return_value = iter(
+                [
                     {
                         "Timestamp": datetime.datetime(
                             2016, 3, 15, 14, 1, 0, 0, tzinfo=tzutc()
@@ -1008,35 +1124,19 @@ class TestStackActions(object):
                         "ResourceStatus": "resource-status",
                     },
                 ]
-            }
-            self.actions._log_new_events(
-                datetime.datetime(2016, 3, 15, 14, 0, 0, 0, tzinfo=tzutc())
             )
-            assert len(self.actions.describe_events()["StackEvents"]) == 2
-            assert [
-                self.actions.stack.name,
-                self.actions.describe_events()["StackEvents"][1]["LogicalResourceId"],
-                self.actions.describe_events()["StackEvents"][1]["ResourceType"],
-                self.actions.describe_events()["StackEvents"][1]["ResourceStatus"],
-                self.actions.describe_events()["StackEvents"][1][
-                    "ResourceStatusReason"
-                ],
-            ].sort() == caplog.messages[0].split().sort()
-            assert [
-                self.actions.stack.name,
-                self.actions.describe_events()["StackEvents"][0]["LogicalResourceId"],
-                self.actions.describe_events()["StackEvents"][0]["ResourceType"],
-                self.actions.describe_events()["StackEvents"][0]["ResourceStatus"],
-            ].sort() == caplog.messages[1].split().sort()
-
-    @patch("sceptre.plan.actions.StackActions.describe_events")
-    def test_log_new_events_with_hook_status_prints_correct_event(
-        self, mock_describe_events, caplog
-    ):
+            self.actions._log_new_events(event_tailer)
+            assert caplog.messages == [
+                "stack-name id-1 type-1 resource User Initiated",
+                "stack-name id-2 type-2 resource-status ",
+            ]
+
+    def test_log_new_events_with_hook_status_prints_correct_event(self, caplog):
         with caplog.at_level("DEBUG"):
             self.actions.stack.name = "stack-name-with-hook-status"
-            mock_describe_events.return_value = {
-                "StackEvents": [
+            event_tailer = Mock()
+            event_tailer.new_events.return_value = iter(
+                [
                     {
                         "Timestamp": datetime.datetime(
                             2023, 8, 15, 14, 3, 0, 0, tzinfo=tzutc()
@@ -1062,33 +1162,14 @@ class TestStackActions(object):
                         "HookFailureMode": "WARN",
                     },
                 ]
-            }
-            self.actions._log_new_events(
-                datetime.datetime(2023, 8, 15, 14, 0, 0, 0, tzinfo=tzutc())
             )
-            assert len(self.actions.describe_events()["StackEvents"]) == 2
-            assert [
-                self.actions.stack.name,
-                self.actions.describe_events()["StackEvents"][1]["LogicalResourceId"],
-                self.actions.describe_events()["StackEvents"][1]["ResourceType"],
-                self.actions.describe_events()["StackEvents"][1]["ResourceStatus"],
-                self.actions.describe_events()["StackEvents"][1]["HookType"],
-                self.actions.describe_events()["StackEvents"][1]["HookStatus"],
-                self.actions.describe_events()["StackEvents"][1]["HookFailureMode"],
-            ].sort() == caplog.messages[0].split().sort()
-            assert [
-                self.actions.stack.name,
-                self.actions.describe_events()["StackEvents"][0]["LogicalResourceId"],
-                self.actions.describe_events()["StackEvents"][0]["ResourceType"],
-                self.actions.describe_events()["StackEvents"][0]["ResourceStatus"],
-                self.actions.describe_events()["StackEvents"][0][
-                    "ResourceStatusReason"
-                ],
-                self.actions.describe_events()["StackEvents"][0]["HookType"],
-                self.actions.describe_events()["StackEvents"][0]["HookStatus"],
-                self.actions.describe_events()["StackEvents"][0]["HookStatusReason"],
-                self.actions.describe_events()["StackEvents"][0]["HookFailureMode"],
-            ].sort() == caplog.messages[1].split().sort()
+            self.actions._log_new_events(event_tailer)
+            assert caplog.messages == [
+                "stack-name-with-hook-status id-3 type-3 resource-with-cf-hook  "
+                "type-3 HOOK_COMPLETE_SUCCEEDED  WARN",
+                "stack-name-with-hook-status id-4 type-4 another-resource-with-cf-hook "
+                "User Initiated type-4 HOOK_IN_PROGRESS Good hook WARN",
+            ]
 
     @patch("sceptre.plan.actions.StackActions._get_cs_status")
     def test_wait_for_cs_completion_calls_get_cs_status(self, mock_get_cs_status):
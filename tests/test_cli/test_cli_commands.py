@@ -42,9 +42,16 @@ class TestCli:
     def setup_method(self, test_method):
         self.patcher_ConfigReader = patch("sceptre.plan.plan.ConfigReader")
         self.patcher_StackActions = patch("sceptre.plan.executor.StackActions")
+        self.patcher_StackDurationHistory = patch(
+            "sceptre.plan.plan.StackDurationHistory"
+        )
 
         self.mock_ConfigReader = self.patcher_ConfigReader.start()
         self.mock_StackActions = self.patcher_StackActions.start()
+        self.mock_StackDurationHistory = self.patcher_StackDurationHistory.start()
+        self.mock_StackDurationHistory.for_project.return_value.estimate.return_value = (
+            None
+        )
 
         self.mock_config_reader = MagicMock(spec=ConfigReader)
         self.mock_stack_actions = MagicMock(spec=StackActions)
@@ -75,6 +82,7 @@ class TestCli:
     def teardown_method(self, test_method):
         self.patcher_ConfigReader.stop()
         self.patcher_StackActions.stop()
+        self.patcher_StackDurationHistory.stop()
 
     @patch("sys.exit")
     def test_catch_exceptions(self, mock_exit):
@@ -337,6 +345,123 @@ class TestCli:
         assert result.exit_code == 0
         assert user_variables == output
 
+    def test_concurrency_options_are_passed_to_context_options(self):
+        @cli.command()
+        @click.pass_context
+        def noop(ctx):
+            click.echo(yaml.safe_dump(ctx.obj.get("options")))
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "--max-concurrency",
+                "10",
+                "--max-concurrency-per-region",
+                "5",
+                "--max-concurrency-per-role",
+                "2",
+                "noop",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert yaml.safe_load(result.output) == {
+            "max_concurrency": 10,
+            "max_concurrency_per_region": 5,
+            "max_concurrency_per_role": 2,
+            "duration_history": None,
+            "no_duration_history": False,
+        }
+
+    def test_duration_history_options_are_passed_to_context_options(self):
+        @cli.command()
+        @click.pass_context
+        def noop(ctx):
+            click.echo(yaml.safe_dump(ctx.obj.get("options")))
+
+        result = self.runner.invoke(
+            cli,
+            ["--duration-history", "durations.json", "--no-duration-history", "noop"],
+        )
+
+        assert result.exit_code == 0
+        options = yaml.safe_load(result.output)
+        assert options["duration_history"] == "durations.json"
+        assert options["no_duration_history"] is True
+
+    @patch("sceptre.cli.ConnectionManager.enable_credential_cache")
+    def test_cache_credentials_enables_credential_cache(
+        self, mock_enable_credential_cache
+    ):
+        @cli.command()
+        def noop():
+            pass
+
+        result = self.runner.invoke(cli, ["--cache-credentials", "noop"])
+
+        assert result.exit_code == 0
+        mock_enable_credential_cache.assert_called_once_with()
+
+    @patch("sceptre.cli.ConnectionManager.enable_credential_cache")
+    def test_credential_cache_is_disabled_by_default(
+        self, mock_enable_credential_cache
+    ):
+        @cli.command()
+        def noop():
+            pass
+
+        result = self.runner.invoke(cli, ["noop"])
+
+        assert result.exit_code == 0
+        mock_enable_credential_cache.assert_not_called()
+
+    @patch("sceptre.cli.StackOutputCache.enable_snapshot")
+    def test_outputs_snapshot_enables_snapshot(self, mock_enable_snapshot):
+        @cli.command()
+        def noop():
+            pass
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "--dir",
+                "project",
+                "--outputs-snapshot",
+                "--outputs-snapshot-ttl",
+                "60",
+                "noop",
+            ],
+        )
+
+        assert result.exit_code == 0
+        snapshot = mock_enable_snapshot.call_args[0][0]
+        assert snapshot.file_path == os.path.join(
+            "project", ".sceptre", "stack_outputs.json"
+        )
+        assert snapshot.ttl == 60
+
+    @patch("sceptre.cli.StackOutputCache.enable_snapshot")
+    def test_outputs_snapshot_is_disabled_by_default(self, mock_enable_snapshot):
+        @cli.command()
+        def noop():
+            pass
+
+        result = self.runner.invoke(cli, ["noop"])
+
+        assert result.exit_code == 0
+        mock_enable_snapshot.assert_not_called()
+
+    @patch("sceptre.cli.ResolverStats.enable_report")
+    def test_resolver_report_enables_report(self, mock_enable_report):
+        @cli.command()
+        def noop():
+            pass
+
+        result = self.runner.invoke(cli, ["--resolver-report", "report.json", "noop"])
+
+        assert result.exit_code == 0
+        mock_enable_report.assert_called_once_with("report.json")
+
     def test_validate_template_with_valid_template(self):
         self.mock_stack_actions.validate.return_value = {
             "Parameters": "Example",
@@ -10,6 +10,7 @@ import yaml
 
 from click.testing import CliRunner
 from freezegun import freeze_time
+from jinja2 import Environment
 from glob import glob
 
 from sceptre.config.reader import ConfigReader
@@ -621,6 +622,39 @@ class TestConfigReader(object):
 
             assert result == {"key": "value"}
 
+    def test_render__same_config_file__compiles_it_once(self):
+        with self.runner.isolated_filesystem():
+            project_path = os.path.abspath("./example")
+            directory_path = os.path.join(project_path, "config", "configs")
+            os.makedirs(directory_path)
+            for basename in ("config.yaml", "other.yaml"):
+                with open(os.path.join(directory_path, basename), "w") as file:
+                    file.write("key: {{ stack_group_config.value }}")
+
+            self.context.project_path = project_path
+            config_reader = ConfigReader(self.context)
+
+            with patch(
+                "sceptre.config.reader.Environment", wraps=Environment
+            ) as mock_environment:
+                first = config_reader._render(
+                    "configs", "config.yaml", {"stack_group_config": {"value": 1}}
+                )
+                second = config_reader._render(
+                    "configs", "config.yaml", {"stack_group_config": {"value": 2}}
+                )
+                config_reader._render("configs", "other.yaml", {})
+                config_reader._render(
+                    "configs",
+                    "config.yaml",
+                    {"j2_environment": {"extensions": ["jinja2.ext.do"]}},
+                )
+
+            assert first == {"key": 1}
+            assert second == {"key": 2}
+            assert mock_environment.call_count == 2
+            assert len(config_reader._j2_templates) == 3
+
     def test_render__invalid_jinja_template__raises_and_creates_debug_file(self):
         with self.runner.isolated_filesystem():
             project_path = os.path.abspath("./example")
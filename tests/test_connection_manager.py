@@ -1,20 +1,27 @@
 # -*- coding: utf-8 -*-
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
 import pytest
 
 from collections import defaultdict
 from typing import Union
-from unittest.mock import Mock, patch, sentinel, create_autospec
+from unittest.mock import ANY, MagicMock, Mock, patch, sentinel, create_autospec
 from deprecation import fail_if_not_removed
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
+from dateutil.tz import tzutc
 
 from sceptre.connection_manager import (
     ConnectionManager,
     _retry_boto_call,
 )
 from sceptre.exceptions import RetryLimitExceededError, InvalidAWSCredentialsError
+from sceptre.rate_limiter import RateLimiter
 
 
 class TestConnectionManager(object):
@@ -35,6 +42,9 @@ class TestConnectionManager(object):
         ConnectionManager._boto_sessions = {}
         ConnectionManager._clients = {}
         ConnectionManager._stack_keys = {}
+        ConnectionManager._rate_limiter = RateLimiter()
+        ConnectionManager._max_pool_connections = 10
+        ConnectionManager._credential_cache = None
 
         self.connection_manager = ConnectionManager(
             region=self.region,
@@ -45,6 +55,9 @@ class TestConnectionManager(object):
             get_envs_func=lambda: self.environment_variables,
         )
 
+    def teardown_method(self, test_method):
+        ConnectionManager._credential_cache = None
+
     def test_connection_manager_initialised_with_no_optional_parameters(self):
         connection_manager = ConnectionManager(region=sentinel.region)
 
@@ -245,6 +258,96 @@ class TestConnectionManager(object):
             DurationSeconds=21600,
         )
 
+    def test_get_session__different_roles__assumed_in_parallel(self):
+        # Both assume_role calls have to be in flight at once for the barrier to open.
+        barrier = threading.Barrier(2, timeout=5)
+        self.mock_session.client.return_value.assume_role.side_effect = (
+            lambda **kwargs: barrier.wait() is not None and MagicMock()
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.connection_manager.get_session, sceptre_role=role)
+                for role in ("role-a", "role-b")
+            ]
+            for future in futures:
+                future.result()
+
+        assert len(ConnectionManager._boto_sessions) == 2
+
+    def test_get_session__same_settings_concurrently__creates_one_session(self):
+        self.connection_manager.sceptre_role = "role"
+        assume_role = self.mock_session.client.return_value.assume_role
+        assume_role.side_effect = lambda **kwargs: time.sleep(0.05) or MagicMock()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(
+                executor.map(lambda _: self.connection_manager.get_session(), range(4))
+            )
+
+        assert assume_role.call_count == 1
+        assert all(session is sessions[0] for session in sessions)
+
+    def test_get_session__credential_cache_enabled__reuses_cached_credentials(
+        self, tmp_path
+    ):
+        ConnectionManager.enable_credential_cache(str(tmp_path))
+        self.connection_manager.sceptre_role = "role"
+        assume_role = self.mock_session.client.return_value.assume_role
+        assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "key-id",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(tzutc()) + timedelta(hours=1),
+            }
+        }
+
+        self.connection_manager.get_session()
+        # A later invocation starts with empty in-memory caches.
+        ConnectionManager._boto_sessions = {}
+        self.connection_manager.get_session()
+
+        assume_role.assert_called_once()
+        self.session_class.assert_called_with(
+            botocore_session=ANY, region_name=self.region
+        )
+        botocore_session = self.session_class.call_args[1]["botocore_session"]
+        assert botocore_session.get_credentials().access_key == "key-id"
+
+    def test_get_session__cached_credentials_about_to_expire__assumes_role_again(
+        self, tmp_path
+    ):
+        ConnectionManager.enable_credential_cache(str(tmp_path))
+        ConnectionManager._credential_cache.refresh_margin = timedelta(0)
+        self.connection_manager.sceptre_role = "role"
+        assume_role = self.mock_session.client.return_value.assume_role
+        assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "old-key-id",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(tzutc()) + timedelta(minutes=5),
+            }
+        }
+        self.connection_manager.get_session()
+        ConnectionManager._boto_sessions = {}
+        self.connection_manager.get_session()
+        assume_role.return_value = {
+            "Credentials": {
+                "AccessKeyId": "new-key-id",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(tzutc()) + timedelta(hours=1),
+            }
+        }
+
+        botocore_session = self.session_class.call_args[1]["botocore_session"]
+        credentials = botocore_session.get_credentials().get_frozen_credentials()
+
+        assert credentials.access_key == "new-key-id"
+        assert assume_role.call_count == 2
+
     def test_get_session__with_sceptre_role__returning_empty_credentials__raises_invalid_aws_credentials_error(
         self,
     ):
@@ -263,27 +366,96 @@ class TestConnectionManager(object):
         region = "eu-west-1"
         profile = None
         sceptre_role = None
-        stack = self.stack_name
 
         client = self.connection_manager._get_client(
-            service, region, profile, stack, sceptre_role
+            service, region, profile, sceptre_role
         )
         expected_client = self.mock_session.client.return_value
         assert client == expected_client
-        self.mock_session.client.assert_any_call(service)
+        self.mock_session.client.assert_any_call(service, config=ANY)
+        config = self.mock_session.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == ConnectionManager._max_pool_connections
+
+    def test_get_client__different_stacks_with_same_settings__share_client(self):
+        other_connection_manager = ConnectionManager(
+            region=self.region,
+            stack_name="other-stack",
+            session_class=self.session_class,
+            get_envs_func=lambda: self.environment_variables,
+        )
+
+        client_1 = self.connection_manager._get_client(
+            "cloudformation", self.region, None, None
+        )
+        client_2 = other_connection_manager._get_client(
+            "cloudformation", self.region, None, None
+        )
+        assert client_1 is client_2
+        assert self.mock_session.client.call_count == 1
+
+    def test_get_client__cache_full__evicts_least_recently_used(self):
+        self.mock_session.client.side_effect = lambda service, config: Mock(
+            name=service
+        )
+        with patch("sceptre.connection_manager.MAX_CACHED_CLIENTS", 2):
+            s3 = self.connection_manager._get_client("s3", self.region, None, None)
+            self.connection_manager._get_client("sts", self.region, None, None)
+            self.connection_manager._get_client("s3", self.region, None, None)
+            self.connection_manager._get_client("ec2", self.region, None, None)
+
+        assert list(ConnectionManager._clients) == [
+            ("s3", self.region, None, None),
+            ("ec2", self.region, None, None),
+        ]
+        assert ConnectionManager._clients[("s3", self.region, None, None)] is s3
+
+    def test_set_max_pool_connections__only_raises_pool_size(self):
+        ConnectionManager.set_max_pool_connections(50)
+        ConnectionManager.set_max_pool_connections(20)
+
+        assert ConnectionManager._max_pool_connections == 50
+
+    def test_set_max_pool_connections__raised__recreates_cached_clients(self):
+        self.mock_session.client.side_effect = lambda service, config: Mock(
+            config=config
+        )
+        client_1 = self.connection_manager._get_client(
+            "cloudformation", self.region, None, None
+        )
+
+        ConnectionManager.set_max_pool_connections(50)
+        client_2 = self.connection_manager._get_client(
+            "cloudformation", self.region, None, None
+        )
+
+        assert client_1.config.max_pool_connections == 10
+        assert client_2.config.max_pool_connections == 50
+
+    def test_set_max_pool_connections__not_raised__keeps_cached_clients(self):
+        client_1 = self.connection_manager._get_client(
+            "cloudformation", self.region, None, None
+        )
+
+        ConnectionManager.set_max_pool_connections(5)
+
+        assert (
+            self.connection_manager._get_client(
+                "cloudformation", self.region, None, None
+            )
+            is client_1
+        )
 
     def test_get_client_with_existing_client(self):
         service = "cloudformation"
         region = "eu-west-1"
         sceptre_role = None
         profile = None
-        stack = self.stack_name
 
         client_1 = self.connection_manager._get_client(
-            service, region, profile, stack, sceptre_role
+            service, region, profile, sceptre_role
         )
         client_2 = self.connection_manager._get_client(
-            service, region, profile, stack, sceptre_role
+            service, region, profile, sceptre_role
         )
         assert client_1 == client_2
         assert self.mock_session.client.call_count == 1
@@ -296,14 +468,13 @@ class TestConnectionManager(object):
         region = "eu-west-1"
         sceptre_role = None
         profile = None
-        stack = self.stack_name
 
         self.connection_manager.profile = None
         client_1 = self.connection_manager._get_client(
-            service, region, profile, stack, sceptre_role
+            service, region, profile, sceptre_role
         )
         client_2 = self.connection_manager._get_client(
-            service, region, profile, stack, sceptre_role
+            service, region, profile, sceptre_role
         )
         assert client_1 == client_2
 
@@ -332,7 +503,7 @@ class TestConnectionManager(object):
         self, service, stack_name, profile, region, sceptre_role
     ):
         self.connection_manager._clients = clients = defaultdict(Mock)
-        clients[(service, region, profile, stack_name, sceptre_role)] = expected = Mock(
+        clients[(service, region, profile, sceptre_role)] = expected = Mock(
             name="expected"
         )
         return expected
@@ -386,6 +557,40 @@ class TestConnectionManager(object):
         )
         expected_client.list_buckets.assert_any_call()
 
+    def test_call__rate_limited_service__throttling_lowers_rate(self):
+        self.set_connection_manager_vars("profile", self.region, None)
+        expected_client = self.set_up_expected_client(
+            "cloudformation", None, "profile", self.region, None
+        )
+        expected_client.describe_stacks.side_effect = [
+            ClientError(
+                {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
+                "DescribeStacks",
+            ),
+            sentinel.response,
+        ]
+
+        with patch("sceptre.connection_manager.time.sleep"):
+            response = self.connection_manager.call("cloudformation", "describe_stacks")
+
+        assert response == sentinel.response
+        bucket = ConnectionManager._rate_limiter.get_bucket(
+            "profile", self.region, "cloudformation", "describe_stacks"
+        )
+        assert bucket.rate < bucket.max_rate
+
+    def test_call__rate_limits_configured__uses_configured_limits(self):
+        self.connection_manager.rate_limits = {"s3": {"rate": 2, "burst": 4}}
+        self.set_connection_manager_vars("profile", self.region, None)
+        self.set_up_expected_client("s3", None, "profile", self.region, None)
+
+        self.connection_manager.call("s3", "list_buckets")
+
+        bucket = ConnectionManager._rate_limiter.get_bucket(
+            "profile", self.region, "s3", "list_buckets"
+        )
+        assert (bucket.max_rate, bucket.burst) == (2, 4)
+
     def test_call__stack_name_set_and_cached__profile_region_and_role_are_stack_default__uses_target_stack_settings(
         self,
     ):
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import os
+import stat
+from datetime import datetime, timedelta
+
+from dateutil.tz import tzutc
+
+from sceptre.credential_cache import AssumedRoleCredentialCache
+
+
+def credentials_expiring_in(delta):
+    return {
+        "AccessKeyId": "key-id",
+        "SecretAccessKey": "secret",
+        "SessionToken": "token",
+        "Expiration": datetime.now(tzutc()) + delta,
+    }
+
+
+class TestAssumedRoleCredentialCache(object):
+    def test_key__differs_for_each_setting(self):
+        keys = {
+            AssumedRoleCredentialCache.key("role", "profile", "eu-west-1", 3600),
+            AssumedRoleCredentialCache.key("other", "profile", "eu-west-1", 3600),
+            AssumedRoleCredentialCache.key("role", None, "eu-west-1", 3600),
+            AssumedRoleCredentialCache.key("role", "profile", "us-east-1", 3600),
+            AssumedRoleCredentialCache.key("role", "profile", "eu-west-1", None),
+        }
+
+        assert len(keys) == 5
+
+    def test_get__valid_credentials__returns_them(self, tmp_path):
+        cache = AssumedRoleCredentialCache(str(tmp_path))
+        cache.set("key", credentials_expiring_in(timedelta(hours=1)))
+
+        credentials = AssumedRoleCredentialCache(str(tmp_path)).get("key")
+
+        assert credentials["SessionToken"] == "token"
+
+    def test_get__credentials_about_to_expire__returns_none(self, tmp_path):
+        cache = AssumedRoleCredentialCache(str(tmp_path))
+        cache.set("key", credentials_expiring_in(timedelta(minutes=5)))
+
+        assert cache.get("key") is None
+
+    def test_get__nothing_cached__returns_none(self, tmp_path):
+        assert AssumedRoleCredentialCache(str(tmp_path)).get("key") is None
+
+    def test_get__unreadable_file__returns_none(self, tmp_path):
+        (tmp_path / "key.json").write_text("not json")
+
+        assert AssumedRoleCredentialCache(str(tmp_path)).get("key") is None
+
+    def test_set__file_only_readable_by_user(self, tmp_path):
+        directory = tmp_path / "cache"
+        cache = AssumedRoleCredentialCache(str(directory))
+        cache.set("key", credentials_expiring_in(timedelta(hours=1)))
+
+        mode = stat.S_IMODE(os.stat(directory / "key.json").st_mode)
+        assert mode == 0o600
+        assert stat.S_IMODE(os.stat(directory).st_mode) & 0o077 == 0
+
+    def test_set__cannot_write__does_not_raise(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = AssumedRoleCredentialCache(str(blocker / "cache"))
+
+        cache.set("key", credentials_expiring_in(timedelta(hours=1)))
+
+        assert cache.get("key") is None
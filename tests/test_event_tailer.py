@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import datetime
+from unittest.mock import Mock, call
+
+from dateutil.tz import tzutc
+
+from sceptre.plan.event_tailer import StackEventTailer
+
+
+def event(event_id, minute):
+    return {
+        "EventId": event_id,
+        "Timestamp": datetime.datetime(2024, 1, 1, 12, minute, tzinfo=tzutc()),
+    }
+
+
+class TestStackEventTailer(object):
+    def setup_method(self, test_method):
+        self.connection_manager = Mock()
+        self.tailer = StackEventTailer(
+            self.connection_manager,
+            "prj-stack",
+            datetime.datetime(2024, 1, 1, 12, 0, tzinfo=tzutc()),
+        )
+
+    def event_ids(self):
+        return [new_event["EventId"] for new_event in self.tailer.new_events()]
+
+    def test_new_events__returns_events_after_datetime_oldest_first(self):
+        self.connection_manager.call.return_value = {
+            "StackEvents": [event("c", 2), event("b", 1), event("a", 0)]
+        }
+
+        assert self.event_ids() == ["b", "c"]
+        self.connection_manager.call.assert_called_once_with(
+            service="cloudformation",
+            command="describe_stack_events",
+            kwargs={"StackName": "prj-stack"},
+        )
+
+    def test_new_events__stops_paging_at_last_seen_event(self):
+        self.connection_manager.call.side_effect = [
+            {"StackEvents": [event("b", 1)]},
+            {"StackEvents": [event("d", 3), event("c", 3)], "NextToken": "token"},
+            {"StackEvents": [event("b", 1)], "NextToken": "old"},
+        ]
+
+        assert self.event_ids() == ["b"]
+        assert self.event_ids() == ["c", "d"]
+        assert self.connection_manager.call.call_count == 3
+        assert self.connection_manager.call.call_args.kwargs["kwargs"] == {
+            "StackName": "prj-stack",
+            "NextToken": "token",
+        }
+
+    def test_new_events__follows_next_token_until_caught_up(self):
+        self.connection_manager.call.side_effect = [
+            {"StackEvents": [event("d", 4), event("c", 3)], "NextToken": "token"},
+            {"StackEvents": [event("b", 2), event("a", 0)], "NextToken": "old"},
+        ]
+
+        assert self.event_ids() == ["b", "c", "d"]
+        assert self.connection_manager.call.call_args_list[1] == call(
+            service="cloudformation",
+            command="describe_stack_events",
+            kwargs={"StackName": "prj-stack", "NextToken": "token"},
+        )
+
+    def test_new_events__returns_events_with_same_timestamp_as_last_seen(self):
+        self.connection_manager.call.side_effect = [
+            {"StackEvents": [event("a", 1)]},
+            {"StackEvents": [event("b", 1), event("a", 1)]},
+            {"StackEvents": [event("b", 1), event("a", 1)]},
+        ]
+
+        assert self.event_ids() == ["a"]
+        assert self.event_ids() == ["b"]
+        assert self.event_ids() == []
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sceptre.exceptions import SceptreException
+from sceptre.plan.executor import SceptrePlanExecutor
+from sceptre.plan.history import StackDurationHistory
+from sceptre.stack import Stack
+
+
+def stack_factory(name, dependencies=None):
+    return Stack(
+        name=name,
+        project_code="prj",
+        region="eu-west-1",
+        template_handler_config={"type": "file", "path": "template.yaml"},
+        dependencies=dependencies,
+    )
+
+
+class TestSceptrePlanExecutor(object):
+    def setup_method(self, test_method):
+        self.patcher_StackActions = patch("sceptre.plan.executor.StackActions")
+        self.mock_StackActions = self.patcher_StackActions.start()
+        self.calls = []
+        self.lock = threading.Lock()
+
+        def make_actions(stack):
+            actions = MagicMock()
+
+            def launch(*args):
+                with self.lock:
+                    self.calls.append((stack.name, args))
+                return "complete"
+
+            actions.launch.side_effect = launch
+            return actions
+
+        self.mock_StackActions.side_effect = make_actions
+
+    def teardown_method(self, test_method):
+        self.patcher_StackActions.stop()
+
+    def test_execute_returns_responses_for_all_stacks(self):
+        vpc = stack_factory("vpc")
+        app = stack_factory("app", [vpc])
+        executor = SceptrePlanExecutor("launch", [{vpc}, {app}])
+
+        responses = executor.execute()
+
+        assert responses == {vpc: "complete", app: "complete"}
+        assert self.calls == [("vpc", ()), ("app", ())]
+
+    def test_execute_passes_args_to_action(self):
+        stack = stack_factory("stack")
+        executor = SceptrePlanExecutor("launch", [{stack}])
+        executor.execute("arg")
+
+        self.mock_StackActions.assert_called_once_with(stack)
+        assert self.calls == [("stack", ("arg",))]
+
+    @patch("sceptre.plan.executor.ConnectionManager.set_max_pool_connections")
+    def test_execute__sizes_connection_pools_to_concurrency(
+        self, mock_set_max_pool_connections
+    ):
+        stacks = {stack_factory(f"stack-{index}") for index in range(3)}
+        executor = SceptrePlanExecutor("launch", [stacks], max_concurrency=2)
+
+        executor.execute()
+
+        mock_set_max_pool_connections.assert_called_once_with(2)
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_num_threads",
+        [
+            pytest.param({}, 10, id="default"),
+            pytest.param({"max_concurrency": 20}, 20, id="raised"),
+            pytest.param({"max_concurrency": 50}, 30, id="capped at stack count"),
+        ],
+    )
+    def test_init__num_threads_bounded_by_default(self, kwargs, expected_num_threads):
+        launch_order = [{stack_factory(f"stack-{index}")} for index in range(30)]
+
+        executor = SceptrePlanExecutor("launch", launch_order, **kwargs)
+
+        assert executor.num_threads == expected_num_threads
+
+    def test_init__large_batch__one_thread_per_stack_in_batch(self):
+        batch = {stack_factory(f"stack-{index}") for index in range(15)}
+
+        executor = SceptrePlanExecutor("launch", [batch])
+
+        assert executor.num_threads == 15
+
+    def test_find_prerequisites__only_waits_on_related_stacks(self):
+        slow = stack_factory("slow")
+        fast = stack_factory("fast")
+        app = stack_factory("app", [fast])
+        executor = SceptrePlanExecutor("launch", [{slow, fast}, {app}])
+
+        assert executor._find_prerequisites() == {
+            slow: set(),
+            fast: set(),
+            app: {fast},
+        }
+
+    def test_find_prerequisites__reversed_launch_order(self):
+        vpc = stack_factory("vpc")
+        app = stack_factory("app", [vpc])
+        executor = SceptrePlanExecutor("delete", [{app}, {vpc}])
+
+        assert executor._find_prerequisites() == {app: set(), vpc: {app}}
+
+    def test_find_prerequisites__looks_through_stacks_not_in_plan(self):
+        vpc = stack_factory("vpc")
+        subnets = stack_factory("subnets", [vpc])
+        app = stack_factory("app", [subnets])
+        executor = SceptrePlanExecutor("launch", [{vpc}, set(), {app}])
+
+        assert executor._find_prerequisites() == {vpc: set(), app: {vpc}}
+
+    def test_execute__does_not_wait_for_unrelated_stack_in_earlier_batch(self):
+        slow = stack_factory("slow")
+        fast = stack_factory("fast")
+        app = stack_factory("app", [fast])
+        app_launched = threading.Event()
+
+        def make_actions(stack):
+            actions = MagicMock()
+            if stack is slow:
+                # Only finishes once app has been launched, which would never happen if app
+                # waited for the whole first batch.
+                actions.launch.side_effect = lambda: (
+                    "complete" if app_launched.wait(5) else "timed out"
+                )
+            elif stack is app:
+                actions.launch.side_effect = lambda: app_launched.set() or "complete"
+            else:
+                actions.launch.return_value = "complete"
+            return actions
+
+        self.mock_StackActions.side_effect = make_actions
+        executor = SceptrePlanExecutor("launch", [{slow, fast}, {app}])
+
+        responses = executor.execute()
+
+        assert responses == {slow: "complete", fast: "complete", app: "complete"}
+
+    def test_execute__ready_stacks_outnumber_largest_batch__runs_them_together(self):
+        a = stack_factory("a")
+        slow = stack_factory("slow")
+        b = stack_factory("b", [a])
+        c = stack_factory("c", [a])
+        # slow, b and c only finish once all three are running at the same time.
+        all_running = threading.Barrier(3, timeout=5)
+
+        def make_actions(stack):
+            actions = MagicMock()
+            if stack is a:
+                actions.launch.return_value = "complete"
+            else:
+
+                def launch():
+                    try:
+                        all_running.wait()
+                    except threading.BrokenBarrierError:
+                        return "timed out"
+                    return "complete"
+
+                actions.launch.side_effect = launch
+            return actions
+
+        self.mock_StackActions.side_effect = make_actions
+        executor = SceptrePlanExecutor("launch", [{a, slow}, {b, c}])
+
+        responses = executor.execute()
+
+        assert responses == {
+            a: "complete",
+            slow: "complete",
+            b: "complete",
+            c: "complete",
+        }
+
+    def test_execute__raises_error_from_action(self):
+        stack = stack_factory("stack")
+        dependent = stack_factory("dependent", [stack])
+        self.mock_StackActions.side_effect = None
+        self.mock_StackActions.return_value.launch.side_effect = ValueError("boom")
+        executor = SceptrePlanExecutor("launch", [{stack}, {dependent}])
+
+        with pytest.raises(ValueError):
+            executor.execute()
+
+        self.mock_StackActions.assert_called_once_with(stack)
+
+    def test_concurrency_keys__static_sceptre_role(self):
+        stack = stack_factory("stack")
+        stack.sceptre_role = "arn:aws:iam::123456789012:role/deploy"
+
+        assert SceptrePlanExecutor._concurrency_keys(stack) == [
+            ("region", "123456789012", "eu-west-1"),
+            ("role", "arn:aws:iam::123456789012:role/deploy"),
+        ]
+
+    def test_concurrency_keys__no_sceptre_role_uses_profile(self):
+        stack = stack_factory("stack")
+        stack.profile = "dev"
+
+        assert SceptrePlanExecutor._concurrency_keys(stack) == [
+            ("region", "dev", "eu-west-1"),
+            ("role", "dev"),
+        ]
+
+    @pytest.mark.parametrize(
+        "kwargs, regions, expected_peak",
+        [
+            pytest.param({}, ["eu-west-1"] * 6, 6, id="unlimited"),
+            pytest.param({"max_concurrency": 2}, ["eu-west-1"] * 6, 2, id="global"),
+            pytest.param(
+                {"max_concurrency_per_region": 1},
+                ["eu-west-1"] * 3 + ["us-east-1"] * 3,
+                2,
+                id="per region",
+            ),
+            pytest.param(
+                {"max_concurrency_per_role": 3}, ["eu-west-1"] * 6, 3, id="per role"
+            ),
+        ],
+    )
+    def test_execute__respects_concurrency_limits(self, kwargs, regions, expected_peak):
+        stacks = [
+            Stack(
+                name=f"stack-{index}",
+                project_code="prj",
+                region=region,
+                template_handler_config={"type": "file", "path": "template.yaml"},
+            )
+            for index, region in enumerate(regions)
+        ]
+        running = set()
+        peaks = []
+
+        def make_actions(stack):
+            actions = MagicMock()
+
+            def launch():
+                with self.lock:
+                    running.add(stack)
+                    peaks.append(len(running))
+                time.sleep(0.1)
+                with self.lock:
+                    running.remove(stack)
+                return "complete"
+
+            actions.launch.side_effect = launch
+            return actions
+
+        self.mock_StackActions.side_effect = make_actions
+        executor = SceptrePlanExecutor("launch", [set(stacks)], **kwargs)
+
+        responses = executor.execute()
+
+        assert len(responses) == len(stacks)
+        assert max(peaks) == expected_peak
+
+    def test_execute__role_resolved_while_running__releases_counted_keys(self):
+        stacks = [stack_factory("first"), stack_factory("second")]
+        for stack in stacks:
+            stack.profile = "dev"
+            # A sceptre_role set by a resolver, which is only resolved once the Stack runs.
+            stack._sceptre_role = MagicMock()
+
+        def make_actions(stack):
+            actions = MagicMock()
+
+            def launch():
+                stack._sceptre_role = "arn:aws:iam::123456789012:role/deploy"
+                return "complete"
+
+            actions.launch.side_effect = launch
+            return actions
+
+        self.mock_StackActions.side_effect = make_actions
+        executor = SceptrePlanExecutor(
+            "launch", [set(stacks)], max_concurrency_per_role=1
+        )
+        responses = {}
+        thread = threading.Thread(
+            target=lambda: responses.update(executor.execute()), daemon=True
+        )
+
+        thread.start()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert responses == {stack: "complete" for stack in stacks}
+
+    def test_execute__queued_stacks_cannot_start__raises_error(self):
+        stack = stack_factory("stack")
+        executor = SceptrePlanExecutor("launch", [{stack}])
+
+        with patch.object(executor, "_take_startable", return_value=[]):
+            with pytest.raises(SceptreException, match="stack"):
+                executor.execute()
+
+    def test_execute__starts_longest_chain_first(self):
+        single = stack_factory("single")
+        first = stack_factory("first")
+        second = stack_factory("second", [first])
+        executor = SceptrePlanExecutor(
+            "launch", [{single, first}, {second}], max_concurrency=1
+        )
+
+        executor.execute()
+
+        assert [name for name, _ in self.calls] == ["first", "single", "second"]
+
+    def test_execute__uses_duration_history_to_prioritise_and_records_durations(
+        self, tmp_path
+    ):
+        history = StackDurationHistory(str(tmp_path / "durations.json"))
+        history.record("single", "launch", 100)
+        history.record("first", "launch", 1)
+        single = stack_factory("single")
+        first = stack_factory("first")
+        second = stack_factory("second", [first])
+        executor = SceptrePlanExecutor(
+            "launch",
+            [{single, first}, {second}],
+            max_concurrency=1,
+            duration_history=history,
+        )
+
+        executor.execute()
+
+        assert [name for name, _ in self.calls] == ["single", "first", "second"]
+        assert history.estimate("second", "launch") is not None
+        assert (tmp_path / "durations.json").exists()
+
+    def test_execute__does_not_record_durations_of_read_only_commands(self, tmp_path):
+        history = StackDurationHistory(str(tmp_path / "durations.json"))
+        stack = stack_factory("stack")
+        executor = SceptrePlanExecutor("describe", [{stack}], duration_history=history)
+
+        executor.execute()
+
+        assert history.estimate("stack", "describe") is None
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sceptre.export_cache import StackExportCache
+from sceptre.resolver_stats import ResolverStats
+
+
+class TestStackExportCache(object):
+    def setup_method(self, test_method):
+        StackExportCache.clear()
+        ResolverStats.clear()
+
+    def teardown_method(self, test_method):
+        StackExportCache.clear()
+        ResolverStats.clear()
+
+    def test_key__uses_sceptre_role_over_profile(self):
+        assert StackExportCache.key("profile", "eu-west-1", "role") == (
+            "role",
+            "eu-west-1",
+        )
+        assert StackExportCache.key("profile", "eu-west-1", None) == (
+            "profile",
+            "eu-west-1",
+        )
+
+    def test_get_exports__concurrent_lookups__share_one_listing(self):
+        key = StackExportCache.key(None, "eu-west-1", None)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def list_exports():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"Name": "Value"}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(StackExportCache.get_exports, key, list_exports)
+                for _ in range(4)
+            ]
+            started.wait(5)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [{"Name": "Value"}] * 4
+        assert len(calls) == 1
+
+    def test_get_exports__failed_listing__is_not_cached(self):
+        key = StackExportCache.key(None, "eu-west-1", None)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            StackExportCache.get_exports(key, fail)
+        assert StackExportCache.get_exports(key, lambda: {"Name": "Value"}) == {
+            "Name": "Value"
+        }
+
+    def test_invalidate__drops_exports_of_region(self):
+        eu_key = StackExportCache.key("profile", "eu-west-1", None)
+        us_key = StackExportCache.key("profile", "us-east-1", None)
+        StackExportCache.get_exports(eu_key, lambda: {"Name": "old"})
+        StackExportCache.get_exports(us_key, lambda: {"Name": "us"})
+
+        StackExportCache.invalidate("eu-west-1")
+
+        assert StackExportCache.get_exports(eu_key, lambda: {"Name": "new"}) == {
+            "Name": "new"
+        }
+        assert StackExportCache.get_exports(us_key, lambda: {"Name": "new"}) == {
+            "Name": "us"
+        }
+
+    def test_record_import__collects_importing_stacks(self):
+        key = StackExportCache.key(None, "eu-west-1", None)
+        StackExportCache.record_import(key, "network-VpcId", "dev/app")
+        StackExportCache.record_import(key, "network-VpcId", "dev/db")
+        StackExportCache.record_import(key, "network-SubnetId", "dev/app")
+
+        assert StackExportCache.get_importers(key, "network-VpcId") == {
+            "dev/app",
+            "dev/db",
+        }
+        assert StackExportCache.get_importers(key, "unknown") == set()
+
+    def test_record_import__same_name_in_other_region__kept_apart(self):
+        ireland = StackExportCache.key(None, "eu-west-1", None)
+        virginia = StackExportCache.key(None, "us-east-1", None)
+        StackExportCache.record_import(ireland, "network-VpcId", "dev/app")
+        StackExportCache.record_import(virginia, "network-VpcId", "us/app")
+
+        assert StackExportCache.get_importers(ireland, "network-VpcId") == {"dev/app"}
+        assert StackExportCache.get_importers(virginia, "network-VpcId") == {"us/app"}
+
+    def test_imports__lists_importers_of_each_export(self):
+        ireland = StackExportCache.key("dev", "eu-west-1", None)
+        virginia = StackExportCache.key("dev", "us-east-1", None)
+        StackExportCache.record_import(virginia, "network-VpcId", "us/app")
+        StackExportCache.record_import(ireland, "network-VpcId", "dev/db")
+        StackExportCache.record_import(ireland, "network-VpcId", "dev/app")
+
+        assert StackExportCache.imports() == [
+            {
+                "sceptre_role_or_profile": "dev",
+                "region": "eu-west-1",
+                "export": "network-VpcId",
+                "stacks": ["dev/app", "dev/db"],
+            },
+            {
+                "sceptre_role_or_profile": "dev",
+                "region": "us-east-1",
+                "export": "network-VpcId",
+                "stacks": ["us/app"],
+            },
+        ]
+
+    def test_get_exports__records_hits_and_misses_against_resolver(self):
+        key = StackExportCache.key(None, "eu-west-1", None)
+
+        def fetch():
+            return {"network-VpcId": "vpc-123"}
+
+        with ResolverStats.resolving("Resolver", "dev/app"):
+            StackExportCache.get_exports(key, fetch)
+            StackExportCache.get_exports(key, fetch)
+
+        [entry] = ResolverStats.report()
+        assert (entry["cache_hits"], entry["cache_misses"]) == (1, 1)
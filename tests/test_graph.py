@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from sceptre.config.graph import StackGraph
+from sceptre.exceptions import CircularDependenciesError
+
+
+class FakeStack(object):
+    def __init__(self, name, dependencies=None):
+        self.name = name
+        self.dependencies = dependencies or []
+
+    def __str__(self):
+        return self.name
+
+    __repr__ = __str__
+
+
+class TestStackGraph(object):
+    def test_init__adds_stacks_and_dependency_edges(self):
+        vpc = FakeStack("vpc")
+        subnets = FakeStack("subnets", [vpc])
+        app = FakeStack("app", [vpc, subnets])
+
+        graph = StackGraph({vpc, subnets, app})
+
+        assert set(graph) == {vpc, subnets, app}
+        assert graph.count_dependencies(vpc) == 0
+        assert graph.count_dependencies(subnets) == 1
+        assert graph.count_dependencies(app) == 2
+
+    def test_init__cycle__raises_with_full_path(self):
+        a = FakeStack("a")
+        b = FakeStack("b", [a])
+        c = FakeStack("c", [b])
+        a.dependencies = [c]
+
+        with pytest.raises(CircularDependenciesError) as excinfo:
+            StackGraph({a, b, c})
+
+        message = str(excinfo.value)
+        assert message.startswith("Dependency cycle detected: ")
+        path = message.split(": ")[1].split(" -> ")
+        assert path[0] == path[-1]
+        assert sorted(path[:-1]) == ["a", "b", "c"]
+
+    def test_init__several_cycles__reports_each(self):
+        a = FakeStack("a")
+        b = FakeStack("b", [a])
+        a.dependencies = [b]
+        c = FakeStack("c")
+        c.dependencies = [c]
+        d = FakeStack("d", [a, c])
+
+        with pytest.raises(CircularDependenciesError) as excinfo:
+            StackGraph({a, b, c, d})
+
+        cycles = str(excinfo.value).split(": ")[1].split("; ")
+        assert len(cycles) == 2
+        assert "c -> c" in cycles
+        assert not any("d" in cycle.split(" -> ") for cycle in cycles)
+
+    def test_filtered__keeps_sources_and_their_dependencies(self):
+        vpc = FakeStack("vpc")
+        app = FakeStack("app", [vpc])
+        other = FakeStack("other")
+
+        graph = StackGraph({vpc, app, other}).filtered({app})
+
+        assert set(graph) == {vpc, app}
+
+    def test_filtered__reverse__keeps_sources_and_their_dependents(self):
+        vpc = FakeStack("vpc")
+        app = FakeStack("app", [vpc])
+        other = FakeStack("other")
+
+        graph = StackGraph({vpc, app, other}).filtered({vpc}, reverse=True)
+
+        assert set(graph) == {vpc, app}
+        assert graph.count_dependencies(app) == 0
+
+    def test_dependents__returns_stacks_depending_on_stack(self):
+        vpc = FakeStack("vpc")
+        app = FakeStack("app", [vpc])
+        db = FakeStack("db", [vpc])
+
+        graph = StackGraph({vpc, app, db})
+
+        assert set(graph.dependents(vpc)) == {app, db}
+        assert graph.dependents(app) == []
+
+    def test_remove_stack__removes_stack_and_its_edges(self):
+        vpc = FakeStack("vpc")
+        app = FakeStack("app", [vpc])
+        graph = StackGraph({vpc, app})
+
+        graph.remove_stack(vpc)
+
+        assert list(graph) == [app]
+        assert graph.count_dependencies(app) == 0
+
+    def test_init__long_chain__does_not_recurse(self):
+        stacks = [FakeStack("0")]
+        for index in range(1, 5000):
+            stacks.append(FakeStack(str(index), [stacks[-1]]))
+
+        graph = StackGraph(set(stacks))
+
+        assert len(graph) == 5000
+        assert len(graph.filtered({stacks[-1]})) == 5000
+
+    def test_to_networkx__returns_digraph_of_dependency_edges(self):
+        vpc = FakeStack("vpc")
+        app = FakeStack("app", [vpc])
+        other = FakeStack("other")
+
+        graph = StackGraph({vpc, app, other}).to_networkx()
+
+        assert set(graph.nodes) == {vpc, app, other}
+        assert list(graph.edges) == [(vpc, app)]
@@ -12,6 +12,7 @@ from sceptre.helpers import (
     get_external_stack_name,
     create_deprecated_alias_property,
     delete_keys_from_containers,
+    _copy_paths_to_values,
 )
 from sceptre.helpers import normalise_path
 from sceptre.helpers import sceptreise_path
@@ -194,3 +195,28 @@ class TestHelpers(object):
         delete_keys_from_containers(arg)
         expected = ["keep me", "keep me"]
         assert a == b == expected
+
+    def test_copy_paths_to_values__copies_only_containers_leading_to_values(self):
+        untouched_dict = {"a": [1, 2]}
+        untouched_list = [{"b": 3}]
+        attr = {
+            "untouched_dict": untouched_dict,
+            "untouched_list": untouched_list,
+            "changed": [1, {"value": 2.5}, 3],
+        }
+
+        result = _copy_paths_to_values(lambda value: value * 2, attr, float)
+
+        assert result == {
+            "untouched_dict": {"a": [1, 2]},
+            "untouched_list": [{"b": 3}],
+            "changed": [1, {"value": 5.0}, 3],
+        }
+        assert result["untouched_dict"] is untouched_dict
+        assert result["untouched_list"] is untouched_list
+        assert attr["changed"] == [1, {"value": 2.5}, 3]
+
+    def test_copy_paths_to_values__no_values__returns_attr(self):
+        attr = {"a": [1, {"b": "c"}]}
+
+        assert _copy_paths_to_values(lambda value: value * 2, attr, float) is attr
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import json
+
+from sceptre.plan.history import StackDurationHistory
+
+
+class TestStackDurationHistory(object):
+    def test_for_project__stores_history_in_project_directory(self, tmp_path):
+        history = StackDurationHistory.for_project(str(tmp_path))
+
+        assert history.file_path == str(tmp_path / ".sceptre" / "stack_durations.json")
+
+    def test_estimate__unknown_stack__returns_none(self, tmp_path):
+        history = StackDurationHistory(str(tmp_path / "durations.json"))
+
+        assert history.estimate("dev/vpc", "launch") is None
+
+    def test_estimate__returns_longest_recent_duration(self, tmp_path):
+        history = StackDurationHistory(str(tmp_path / "durations.json"), max_samples=2)
+        history.record("dev/vpc", "launch", 100)
+        history.record("dev/vpc", "launch", 5)
+        history.record("dev/vpc", "launch", 10)
+
+        assert history.estimate("dev/vpc", "launch") == 10
+        assert history.estimate("dev/vpc", "delete") is None
+
+    def test_save__round_trips_through_file(self, tmp_path):
+        file_path = str(tmp_path / "nested" / "durations.json")
+        history = StackDurationHistory(file_path)
+        history.record("dev/vpc", "create", 12.345)
+        history.save()
+
+        assert StackDurationHistory(file_path).estimate("dev/vpc", "create") == 12.35
+
+    def test_save__nothing_recorded__does_not_write_file(self, tmp_path):
+        file_path = tmp_path / "durations.json"
+        StackDurationHistory(str(file_path)).save()
+
+        assert not file_path.exists()
+
+    def test_save__file_in_current_directory__writes_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        history = StackDurationHistory("durations.json")
+        history.record("dev/vpc", "create", 3)
+        history.save()
+
+        assert StackDurationHistory("durations.json").estimate("dev/vpc", "create") == 3
+
+    def test_save__directory_not_writable__does_not_raise(self, tmp_path):
+        # A file where the directory should be cannot be written into, even as root.
+        (tmp_path / ".sceptre").write_text("")
+        history = StackDurationHistory.for_project(str(tmp_path))
+        history.record("dev/vpc", "create", 3)
+
+        history.save()
+
+        assert (
+            StackDurationHistory.for_project(str(tmp_path)).estimate(
+                "dev/vpc", "create"
+            )
+            is None
+        )
+
+    def test_load__invalid_file__starts_empty(self, tmp_path):
+        file_path = tmp_path / "durations.json"
+        file_path.write_text("not json")
+
+        assert (
+            StackDurationHistory(str(file_path)).estimate("dev/vpc", "launch") is None
+        )
+
+    def test_load__reads_existing_file(self, tmp_path):
+        file_path = tmp_path / "durations.json"
+        file_path.write_text(json.dumps({"dev/vpc": {"launch": [3, 7]}}))
+
+        assert StackDurationHistory(str(file_path)).estimate("dev/vpc", "launch") == 7
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sceptre.output_cache import StackOutputCache
+from sceptre.resolver_stats import ResolverStats
+
+
+class TestStackOutputCache(object):
+    def setup_method(self, test_method):
+        StackOutputCache.clear()
+        ResolverStats.clear()
+
+    def teardown_method(self, test_method):
+        StackOutputCache.clear()
+        ResolverStats.clear()
+
+    def test_key__uses_sceptre_role_over_profile(self):
+        assert StackOutputCache.key("profile", "eu-west-1", "role", "stack") == (
+            "role",
+            "eu-west-1",
+            "stack",
+        )
+        assert StackOutputCache.key("profile", "eu-west-1", None, "stack") == (
+            "profile",
+            "eu-west-1",
+            "stack",
+        )
+
+    def test_get_outputs__cached__does_not_fetch_again(self):
+        calls = []
+        key = StackOutputCache.key(None, "eu-west-1", None, "stack")
+
+        def fetch():
+            calls.append(1)
+            return {"Key": "Value"}
+
+        assert StackOutputCache.get_outputs(key, fetch) == {"Key": "Value"}
+        assert StackOutputCache.get_outputs(key, fetch) == {"Key": "Value"}
+        assert len(calls) == 1
+
+    def test_get_outputs__concurrent_lookups__share_one_fetch(self):
+        key = StackOutputCache.key(None, "eu-west-1", None, "stack")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"Key": "Value"}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(StackOutputCache.get_outputs, key, fetch)
+                for _ in range(4)
+            ]
+            started.wait(5)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [{"Key": "Value"}] * 4
+        assert len(calls) == 1
+
+    def test_get_outputs__fetch_fails__error_raised_and_not_cached(self):
+        key = StackOutputCache.key(None, "eu-west-1", None, "stack")
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            StackOutputCache.get_outputs(key, fail)
+
+        assert StackOutputCache.get_outputs(key, lambda: {"Key": "Value"}) == {
+            "Key": "Value"
+        }
+
+    def test_invalidate__drops_stack_for_every_role(self):
+        for role in ("role-a", "role-b"):
+            StackOutputCache.set_outputs(
+                StackOutputCache.key(None, "eu-west-1", role, "stack"), {"Key": role}
+            )
+        other = StackOutputCache.key(None, "eu-west-1", "role-a", "other")
+        StackOutputCache.set_outputs(other, {"Key": "other"})
+
+        StackOutputCache.invalidate("eu-west-1", "stack")
+
+        assert StackOutputCache._outputs == {other: {"Key": "other"}}
+
+    def test_get_outputs__records_hits_and_misses_against_resolver(self):
+        key = StackOutputCache.key(None, "eu-west-1", None, "stack")
+
+        def fetch():
+            return {"Key": "Value"}
+
+        with ResolverStats.resolving("Resolver", "dev/app"):
+            StackOutputCache.get_outputs(key, fetch)
+            StackOutputCache.get_outputs(key, fetch)
+
+        [entry] = ResolverStats.report()
+        assert (entry["cache_hits"], entry["cache_misses"]) == (1, 1)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from sceptre.output_cache import StackOutputCache
+from sceptre.plan.output_prefetcher import StackOutputPrefetcher
+from sceptre.resolvers.stack_output import StackOutputExternal
+from sceptre.stack import Stack
+
+
+class TestStackOutputPrefetcher(object):
+    def setup_method(self, test_method):
+        StackOutputCache.clear()
+        self.connection_manager = MagicMock()
+        self.connection_manager.get_call_settings.side_effect = (
+            lambda profile, region, stack_name, sceptre_role: (
+                profile,
+                region or "eu-west-1",
+                sceptre_role,
+            )
+        )
+        self.prefetcher = StackOutputPrefetcher(min_stacks=2)
+
+    def teardown_method(self, test_method):
+        StackOutputCache.clear()
+
+    def make_stack(self, parameters, **kwargs):
+        stack = Stack(
+            name="dev/app/stack",
+            project_code="prj",
+            template_handler_config={"path": "template.yaml"},
+            region="eu-west-1",
+            parameters=parameters,
+            **kwargs,
+        )
+        stack._connection_manager = self.connection_manager
+        return stack
+
+    def describe_response(self, *names, next_token=None):
+        response = {
+            "Stacks": [
+                {
+                    "StackName": name,
+                    "Outputs": [{"OutputKey": "Key", "OutputValue": name + "-value"}],
+                }
+                for name in names
+            ]
+        }
+        if next_token:
+            response["NextToken"] = next_token
+        return response
+
+    def test_prefetch__caches_outputs_of_targets(self):
+        stack = self.make_stack(
+            {
+                "a": StackOutputExternal("stack-a::Key"),
+                "b": [StackOutputExternal("stack-b::Key")],
+            }
+        )
+        self.connection_manager.call.side_effect = [
+            self.describe_response("stack-a", "other", next_token="token"),
+            self.describe_response("stack-b"),
+        ]
+
+        self.prefetcher.prefetch([stack])
+
+        kwargs = [
+            call[1]["kwargs"] for call in self.connection_manager.call.call_args_list
+        ]
+        assert kwargs == [{"NextToken": "token"}, {"NextToken": "token"}]
+        for name in ("stack-a", "stack-b"):
+            key = StackOutputCache.key(None, "eu-west-1", None, name)
+            assert StackOutputCache.get_outputs(key, None) == {"Key": name + "-value"}
+        other = StackOutputCache.key(None, "eu-west-1", None, "other")
+        assert other not in StackOutputCache._outputs
+
+    def test_prefetch__stops_paging_once_all_targets_found(self):
+        stack = self.make_stack(
+            {
+                "a": StackOutputExternal("stack-a::Key"),
+                "b": StackOutputExternal("stack-b::Key"),
+            }
+        )
+        self.connection_manager.call.return_value = self.describe_response(
+            "stack-a", "stack-b", next_token="token"
+        )
+
+        self.prefetcher.prefetch([stack])
+
+        assert self.connection_manager.call.call_count == 1
+
+    def test_prefetch__finds_resolvers_nested_in_arguments(self):
+        outer = StackOutputExternal(
+            [StackOutputExternal("stack-a::Key"), StackOutputExternal("stack-b::Key")]
+        )
+        stack = self.make_stack({"a": outer})
+        self.connection_manager.call.return_value = self.describe_response(
+            "stack-a", "stack-b"
+        )
+
+        self.prefetcher.prefetch([stack])
+
+        assert len(StackOutputCache._outputs) == 2
+
+    def test_prefetch__too_few_targets__does_not_describe(self):
+        stack = self.make_stack({"a": StackOutputExternal("stack-a::Key")})
+
+        self.prefetcher.prefetch([stack])
+
+        self.connection_manager.call.assert_not_called()
+
+    def test_prefetch__groups_targets_by_settings(self):
+        stack = self.make_stack(
+            {
+                "a": StackOutputExternal("stack-a::Key"),
+                "b": StackOutputExternal("stack-b::Key profile::us-east-1"),
+            }
+        )
+
+        self.prefetcher.prefetch([stack])
+
+        self.connection_manager.call.assert_not_called()
+
+    def test_prefetch__already_cached__is_not_described(self):
+        stack = self.make_stack(
+            {
+                "a": StackOutputExternal("stack-a::Key"),
+                "b": StackOutputExternal("stack-b::Key"),
+            }
+        )
+        StackOutputCache.set_outputs(
+            StackOutputCache.key(None, "eu-west-1", None, "stack-a"), {}
+        )
+
+        self.prefetcher.prefetch([stack])
+
+        self.connection_manager.call.assert_not_called()
+
+    def test_prefetch__invalid_argument__is_skipped(self):
+        stack = self.make_stack(
+            {
+                "a": StackOutputExternal("stack-a::Key"),
+                "b": StackOutputExternal("stack-b::Key"),
+                "c": StackOutputExternal("invalid"),
+            }
+        )
+        self.connection_manager.call.return_value = self.describe_response(
+            "stack-a", "stack-b"
+        )
+
+        self.prefetcher.prefetch([stack])
+
+        assert len(StackOutputCache._outputs) == 2
+
+    def test_prefetch__client_error__is_ignored(self):
+        stack = self.make_stack(
+            {
+                "a": StackOutputExternal("stack-a::Key"),
+                "b": StackOutputExternal("stack-b::Key"),
+            }
+        )
+        self.connection_manager.call.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "Denied"}}, "DescribeStacks"
+        )
+
+        self.prefetcher.prefetch([stack])
+
+        assert StackOutputCache._outputs == {}
+
+    def test_prefetch__resolvable_sceptre_role__skips_stack(self):
+        stack = self.make_stack(
+            {
+                "a": StackOutputExternal("stack-a::Key"),
+                "b": StackOutputExternal("stack-b::Key"),
+            },
+            sceptre_role=StackOutputExternal("role-stack::Arn"),
+        )
+
+        self.prefetcher.prefetch([stack])
+
+        self.connection_manager.get_call_settings.assert_not_called()
+        self.connection_manager.call.assert_not_called()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import json
+from unittest.mock import patch
+
+from sceptre.output_cache import StackOutputCache
+from sceptre.output_snapshot import StackOutputSnapshot
+
+
+class TestStackOutputSnapshot(object):
+    def setup_method(self, test_method):
+        self.key = ("role", "eu-west-1", "prj-vpc")
+
+    def test_get__unknown_stack__returns_none(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+
+        assert snapshot.get(self.key) is None
+
+    def test_save__round_trips_outputs(self, tmp_path):
+        file_path = str(tmp_path / "dir" / "outputs.json")
+        snapshot = StackOutputSnapshot(file_path)
+        snapshot.set(self.key, {"VpcId": "vpc-123"})
+        snapshot.save()
+
+        assert StackOutputSnapshot(file_path).get(self.key) == {"VpcId": "vpc-123"}
+
+    @patch("sceptre.output_snapshot.time.time")
+    def test_get__expired_outputs__returns_none(self, mock_time, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"), ttl=60)
+        mock_time.return_value = 1000
+        snapshot.set(self.key, {"VpcId": "vpc-123"})
+
+        mock_time.return_value = 1059
+        assert snapshot.get(self.key) == {"VpcId": "vpc-123"}
+        mock_time.return_value = 1061
+        assert snapshot.get(self.key) is None
+
+    @patch("sceptre.output_snapshot.time.time")
+    def test_save__drops_expired_outputs(self, mock_time, tmp_path):
+        file_path = tmp_path / "outputs.json"
+        snapshot = StackOutputSnapshot(str(file_path), ttl=60)
+        mock_time.return_value = 1000
+        snapshot.set(self.key, {"VpcId": "vpc-123"})
+        mock_time.return_value = 1030
+        snapshot.set(("role", "eu-west-1", "prj-app"), {})
+
+        mock_time.return_value = 1070
+        snapshot.save()
+
+        entries = json.loads(file_path.read_text())
+        assert [entry["key"] for entry in entries] == [["role", "eu-west-1", "prj-app"]]
+
+    def test_discard__forgets_stack_however_it_was_read(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        snapshot.set(("role", "eu-west-1", "prj-vpc"), {})
+        snapshot.set(("profile", "eu-west-1", "prj-vpc"), {})
+        snapshot.set(("role", "us-east-1", "prj-vpc"), {})
+
+        snapshot.discard("eu-west-1", "prj-vpc")
+
+        assert snapshot.get(("role", "eu-west-1", "prj-vpc")) is None
+        assert snapshot.get(("profile", "eu-west-1", "prj-vpc")) is None
+        assert snapshot.get(("role", "us-east-1", "prj-vpc")) == {}
+
+    def test_save__nothing_recorded__does_not_write(self, tmp_path):
+        file_path = tmp_path / "outputs.json"
+        StackOutputSnapshot(str(file_path)).save()
+
+        assert not file_path.exists()
+
+    def test_init__unreadable_file__is_ignored(self, tmp_path):
+        file_path = tmp_path / "outputs.json"
+        file_path.write_text("{not json")
+
+        assert StackOutputSnapshot(str(file_path)).get(self.key) is None
+
+    def test_for_project__stores_snapshot_in_sceptre_directory(self, tmp_path):
+        snapshot = StackOutputSnapshot.for_project(str(tmp_path), ttl=5)
+
+        assert snapshot.file_path == str(tmp_path / ".sceptre" / "stack_outputs.json")
+        assert snapshot.ttl == 5
+
+
+class TestStackOutputCacheWithSnapshot(object):
+    def setup_method(self, test_method):
+        StackOutputCache.clear()
+        StackOutputCache.read_snapshot(True)
+        self.key = StackOutputCache.key(None, "eu-west-1", "role", "prj-vpc")
+
+    def teardown_method(self, test_method):
+        StackOutputCache.clear()
+        StackOutputCache.enable_snapshot(None)
+        StackOutputCache.read_snapshot(False)
+
+    def test_get_outputs__snapshotted__does_not_fetch(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        snapshot.set(self.key, {"VpcId": "vpc-123"})
+        StackOutputCache.enable_snapshot(snapshot)
+
+        def fetch():
+            raise AssertionError("outputs should not be fetched")
+
+        assert StackOutputCache.get_outputs(self.key, fetch) == {"VpcId": "vpc-123"}
+
+    def test_get_outputs__snapshot_reads_off__fetches_and_snapshots(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        snapshot.set(self.key, {"VpcId": "old"})
+        StackOutputCache.enable_snapshot(snapshot)
+        StackOutputCache.read_snapshot(False)
+
+        assert not StackOutputCache.is_cached(self.key)
+        assert StackOutputCache.get_outputs(self.key, lambda: {"VpcId": "new"}) == {
+            "VpcId": "new"
+        }
+        assert snapshot.get(self.key) == {"VpcId": "new"}
+
+    def test_get_outputs__fetched__is_snapshotted(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        StackOutputCache.enable_snapshot(snapshot)
+
+        StackOutputCache.get_outputs(self.key, lambda: {"VpcId": "vpc-123"})
+
+        assert snapshot.get(self.key) == {"VpcId": "vpc-123"}
+
+    def test_set_outputs__is_snapshotted(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        StackOutputCache.enable_snapshot(snapshot)
+
+        StackOutputCache.set_outputs(self.key, {"VpcId": "vpc-123"})
+
+        assert snapshot.get(self.key) == {"VpcId": "vpc-123"}
+
+    def test_invalidate__discards_snapshotted_outputs(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        snapshot.set(self.key, {"VpcId": "vpc-123"})
+        StackOutputCache.enable_snapshot(snapshot)
+
+        StackOutputCache.invalidate("eu-west-1", "prj-vpc")
+
+        assert snapshot.get(self.key) is None
+
+    def test_clear__keeps_snapshot(self, tmp_path):
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        snapshot.set(self.key, {"VpcId": "vpc-123"})
+        StackOutputCache.enable_snapshot(snapshot)
+
+        StackOutputCache.clear()
+
+        assert snapshot.get(self.key) == {"VpcId": "vpc-123"}
@@ -1,7 +1,11 @@
 import pytest
 from unittest.mock import MagicMock, patch, sentinel
 
+from sceptre.config.graph import StackGraph
 from sceptre.context import SceptreContext
+from sceptre.export_cache import StackExportCache
+from sceptre.output_cache import StackOutputCache
+from sceptre.output_snapshot import StackOutputSnapshot
 from sceptre.stack import Stack
 from sceptre.config.reader import ConfigReader
 from sceptre.plan.plan import SceptrePlan
@@ -61,3 +65,122 @@ class TestSceptrePlan(object):
             plan = MagicMock(spec=SceptrePlan)
             plan.context = self.mock_context
             plan.invalid_command()
+
+    def _plan_for(self, stacks, command_stacks):
+        plan = SceptrePlan.__new__(SceptrePlan)
+        plan.context = self.mock_context
+        plan.context.ignore_dependencies = False
+        plan.graph = StackGraph(stacks)
+        plan.command_stacks = command_stacks
+        return plan
+
+    def _stack(self, dependencies=()):
+        return MagicMock(spec=Stack, dependencies=list(dependencies))
+
+    def test_generate_launch_order__batches_stacks_after_their_dependencies(self):
+        vpc = self._stack()
+        subnets = self._stack([vpc])
+        db = self._stack([subnets])
+        app = self._stack([vpc, db])
+        other = self._stack()
+        plan = self._plan_for({vpc, subnets, db, app, other}, {app})
+
+        assert plan._generate_launch_order() == [{vpc}, {subnets}, {db}, {app}]
+
+    def test_generate_launch_order__reverse__batches_stacks_after_dependents(self):
+        vpc = self._stack()
+        subnets = self._stack([vpc])
+        app = self._stack([vpc, subnets])
+        plan = self._plan_for({vpc, subnets, app}, {vpc})
+
+        assert plan._generate_launch_order(reverse=True) == [{app}, {subnets}, {vpc}]
+
+    @pytest.mark.parametrize(
+        "command, expected_outputs",
+        [
+            pytest.param("generate", {"VpcId": "snapshotted"}, id="generate"),
+            pytest.param("launch", {"VpcId": "fetched"}, id="launch"),
+        ],
+    )
+    @patch("sceptre.plan.plan.StackOutputPrefetcher")
+    @patch("sceptre.plan.plan.SceptrePlanExecutor")
+    def test_execute__only_rendering_commands_read_outputs_snapshot(
+        self, mock_executor, mock_prefetcher, tmp_path, command, expected_outputs
+    ):
+        key = StackOutputCache.key(None, "eu-west-1", None, "prj-vpc")
+        snapshot = StackOutputSnapshot(str(tmp_path / "outputs.json"))
+        snapshot.set(key, {"VpcId": "snapshotted"})
+        StackOutputCache.enable_snapshot(snapshot)
+        mock_executor.return_value.execute.side_effect = (
+            lambda: StackOutputCache.get_outputs(key, lambda: {"VpcId": "fetched"})
+        )
+        plan = self._plan_for({self._stack()}, set())
+        plan.command = command
+        plan.launch_order = []
+
+        try:
+            assert plan._execute() == expected_outputs
+        finally:
+            StackOutputCache.enable_snapshot(None)
+            StackOutputCache.read_snapshot(False)
+            StackOutputCache.clear()
+
+    @pytest.mark.parametrize(
+        "options, expected_path",
+        [
+            pytest.param({}, "/project/.sceptre/stack_durations.json", id="default"),
+            pytest.param(
+                {"duration_history": "/tmp/durations.json"},
+                "/tmp/durations.json",
+                id="configured path",
+            ),
+            pytest.param(
+                {
+                    "duration_history": "/tmp/durations.json",
+                    "no_duration_history": True,
+                },
+                None,
+                id="turned off",
+            ),
+        ],
+    )
+    @patch("sceptre.plan.plan.SceptrePlanExecutor")
+    def test_execute__uses_configured_duration_history(
+        self, mock_executor, options, expected_path
+    ):
+        plan = self._plan_for({self._stack()}, set())
+        plan.context = MagicMock(options=options, project_path="/project")
+        plan.command = "launch"
+        plan.launch_order = []
+
+        plan._execute()
+
+        history = mock_executor.call_args[1]["duration_history"]
+        assert (history and history.file_path) == expected_path
+
+    @patch("sceptre.plan.plan.ResolverStats.publish")
+    @patch("sceptre.plan.plan.SceptrePlanExecutor")
+    def test_execute__publishes_recorded_imports(self, mock_executor, mock_publish):
+        key = StackExportCache.key("dev", "eu-west-1", None)
+        mock_executor.return_value.execute.side_effect = (
+            lambda: StackExportCache.record_import(key, "network-VpcId", "dev/app")
+        )
+        plan = self._plan_for({self._stack()}, set())
+        plan.command = "launch"
+        plan.launch_order = []
+
+        try:
+            plan._execute()
+        finally:
+            StackExportCache.clear()
+
+        mock_publish.assert_called_once_with(
+            [
+                {
+                    "sceptre_role_or_profile": "dev",
+                    "region": "eu-west-1",
+                    "export": "network-VpcId",
+                    "stacks": ["dev/app"],
+                }
+            ]
+        )
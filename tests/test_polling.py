@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+
+import pytest
+
+from sceptre.exceptions import InvalidConfigFileError
+from sceptre.plan.polling import PollingPolicy
+from sceptre.stack import Stack
+
+
+def stack_factory(stack_group_config=None):
+    return Stack(
+        name="stack",
+        project_code="prj",
+        region="eu-west-1",
+        template_handler_config={"type": "file", "path": "template.yaml"},
+        stack_group_config=stack_group_config,
+    )
+
+
+class TestPollingPolicy(object):
+    def test_delays__back_off_up_to_max_delay(self):
+        policy = PollingPolicy(initial_delay=2, max_delay=10, multiplier=2, jitter=0)
+
+        assert list(islice(policy.delays(), 5)) == [2, 4, 8, 10, 10]
+
+    def test_delays__are_varied_by_jitter(self):
+        policy = PollingPolicy(initial_delay=10, max_delay=10, jitter=0.2)
+
+        for delay in islice(policy.delays(), 50):
+            assert 8 <= delay <= 12
+
+    def test_expected_duration__raises_initial_delay(self):
+        policy = PollingPolicy(
+            initial_delay=4, max_delay=60, jitter=0, expected_duration=600
+        )
+
+        assert next(policy.delays()) == 30
+
+    def test_expected_duration__does_not_exceed_max_delay(self):
+        policy = PollingPolicy(
+            initial_delay=4, max_delay=20, jitter=0, expected_duration=6000
+        )
+
+        assert next(policy.delays()) == 20
+
+    def test_for_stack__uses_defaults(self):
+        policy = PollingPolicy.for_stack(stack_factory(), "change_set")
+
+        assert (policy.initial_delay, policy.max_delay) == (2, 10)
+
+    def test_for_stack__uses_stack_group_config(self):
+        stack = stack_factory(
+            {"polling": {"stack": {"initial_delay": 10, "max_delay": 60}}}
+        )
+
+        policy = PollingPolicy.for_stack(stack, "stack")
+
+        assert (policy.initial_delay, policy.max_delay) == (10, 60)
+        assert policy.multiplier == 1.25
+
+    @pytest.mark.parametrize(
+        "polling",
+        [
+            pytest.param("fast", id="not a mapping"),
+            pytest.param({"stack": {"interval": 3}}, id="unknown option"),
+            pytest.param({"stack": {"max_delay": "long"}}, id="not a number"),
+            pytest.param({"stack": {"jitter": 1.5}}, id="jitter too large"),
+            pytest.param({"stack": {"jitter": -0.1}}, id="negative jitter"),
+            pytest.param({"stack": {"initial_delay": 0}}, id="zero initial delay"),
+            pytest.param({"stack": {"max_delay": -5}}, id="negative max delay"),
+            pytest.param({"stack": {"multiplier": 0.5}}, id="shrinking delays"),
+            pytest.param(
+                {"stack": {"expected_duration": -60}}, id="negative expected duration"
+            ),
+        ],
+    )
+    def test_for_stack__invalid_config__raises_error(self, polling):
+        with pytest.raises(InvalidConfigFileError):
+            PollingPolicy.for_stack(stack_factory({"polling": polling}), "stack")
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import MagicMock
+
+import pytest
+
+from sceptre.exceptions import InvalidConfigFileError
+from sceptre.rate_limiter import RateLimiter, TokenBucket
+
+
+def stack_factory(stack_group_config):
+    stack = MagicMock()
+    stack.name = "dev/app"
+    stack.stack_group_config = stack_group_config
+    return stack
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+class TestTokenBucket(object):
+    def setup_method(self, test_method):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(2, 3, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_acquire__within_burst__does_not_wait(self):
+        waits = [self.bucket.acquire() for _ in range(3)]
+
+        assert waits == [0, 0, 0]
+        assert self.clock.sleeps == []
+
+    def test_acquire__burst_used__spaces_calls_by_rate(self):
+        waits = [self.bucket.acquire() for _ in range(5)]
+
+        assert waits == [0, 0, 0, 0.5, 1.0]
+
+    def test_acquire__tokens_refill_over_time(self):
+        for _ in range(3):
+            self.bucket.acquire()
+        self.clock.now += 1
+
+        assert [self.bucket.acquire() for _ in range(3)] == [0, 0, 0.5]
+
+    def test_throttled__halves_rate_down_to_minimum(self):
+        self.bucket.throttled()
+        assert self.bucket.rate == 1
+
+        for _ in range(10):
+            self.bucket.throttled()
+        assert self.bucket.rate == pytest.approx(0.1)
+
+    def test_succeeded__recovers_rate_up_to_configured_rate(self):
+        self.bucket.throttled()
+        self.bucket.succeeded()
+        assert self.bucket.rate == pytest.approx(1.04)
+
+        for _ in range(100):
+            self.bucket.succeeded()
+        assert self.bucket.rate == 2
+
+
+class TestRateLimiter(object):
+    def test_get_bucket__service_without_limit__returns_none(self):
+        limiter = RateLimiter()
+
+        assert limiter.get_bucket("role", "eu-west-1", "s3", "list_buckets") is None
+
+    def test_get_bucket__shares_bucket_per_key(self):
+        limiter = RateLimiter()
+
+        first = limiter.get_bucket("role", "eu-west-1", "cloudformation", "list_stacks")
+        second = limiter.get_bucket(
+            "role", "eu-west-1", "cloudformation", "list_stacks"
+        )
+        other_region = limiter.get_bucket(
+            "role", "us-east-1", "cloudformation", "list_stacks"
+        )
+
+        assert first is second
+        assert first is not other_region
+
+    @pytest.mark.parametrize(
+        "limits, expected_rate",
+        [
+            pytest.param(None, 5, id="default"),
+            pytest.param({"cloudformation": {"rate": 3}}, 3, id="service"),
+            pytest.param(
+                {
+                    "cloudformation": {"rate": 3},
+                    "cloudformation.describe_stack_events": {"rate": 1},
+                },
+                1,
+                id="operation",
+            ),
+        ],
+    )
+    def test_get_bucket__uses_most_specific_limit(self, limits, expected_rate):
+        limiter = RateLimiter()
+
+        bucket = limiter.get_bucket(
+            "role", "eu-west-1", "cloudformation", "describe_stack_events", limits
+        )
+
+        assert bucket.max_rate == expected_rate
+
+    def test_get_bucket__limit_without_rate__disables_limit(self):
+        limiter = RateLimiter()
+
+        bucket = limiter.get_bucket(
+            "role",
+            "eu-west-1",
+            "cloudformation",
+            "list_stacks",
+            {"cloudformation": {"rate": None}},
+        )
+
+        assert bucket is None
+
+    def test_limits_for_stack__not_configured__returns_none(self):
+        assert RateLimiter.limits_for_stack(stack_factory({})) is None
+
+    def test_limits_for_stack__valid_config__returns_numeric_limits(self):
+        stack = stack_factory(
+            {
+                "rate_limits": {
+                    "cloudformation": {"rate": "5", "burst": 10},
+                    "cloudformation.list_stacks": {"rate": None},
+                }
+            }
+        )
+
+        assert RateLimiter.limits_for_stack(stack) == {
+            "cloudformation": {"rate": 5.0, "burst": 10.0},
+            "cloudformation.list_stacks": {"rate": None},
+        }
+
+    @pytest.mark.parametrize(
+        "rate_limits",
+        [
+            ["cloudformation"],
+            {"cloudformation": 5},
+            {"cloudformation": {"rate": "fast"}},
+            {"cloudformation": {"rate": 0}},
+            {"cloudformation": {"rate": 2, "burst": -1}},
+            {"cloudformation": {"rate": True}},
+            {"cloudformation": {"limit": 5}},
+        ],
+    )
+    def test_limits_for_stack__invalid_config__raises_error(self, rate_limits):
+        stack = stack_factory({"rate_limits": rate_limits})
+
+        with pytest.raises(InvalidConfigFileError, match="^dev/app - "):
+            RateLimiter.limits_for_stack(stack)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+
+from sceptre.resolver_stats import ResolverStats
+
+
+class TestResolverStats(object):
+    def setup_method(self, test_method):
+        ResolverStats.clear()
+
+    def teardown_method(self, test_method):
+        ResolverStats.clear()
+        ResolverStats._report_path = None
+
+    def test_record__aggregates_per_resolver_type_and_stack(self):
+        ResolverStats.record("StackOutput", "dev/app", 1.0)
+        ResolverStats.record("StackOutput", "dev/app", 2.0)
+        ResolverStats.record("FileContents", "dev/app", 0.5, memo_hit=False)
+        ResolverStats.record("FileContents", "dev/app", 0.25, memo_hit=True)
+        ResolverStats.record("StackOutput", "dev/db", 0.1)
+
+        assert ResolverStats.report() == [
+            {
+                "resolver": "StackOutput",
+                "stack": "dev/app",
+                "calls": 2,
+                "memo_hits": 0,
+                "memo_misses": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "seconds": 3.0,
+            },
+            {
+                "resolver": "FileContents",
+                "stack": "dev/app",
+                "calls": 2,
+                "memo_hits": 1,
+                "memo_misses": 1,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "seconds": 0.75,
+            },
+            {
+                "resolver": "StackOutput",
+                "stack": "dev/db",
+                "calls": 1,
+                "memo_hits": 0,
+                "memo_misses": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "seconds": 0.1,
+            },
+        ]
+
+    def test_record_cache_lookup__counts_against_innermost_resolver(self):
+        with ResolverStats.resolving("StackOutput", "dev/app"):
+            ResolverStats.record_cache_lookup(hit=False)
+            with ResolverStats.resolving("StackOutputExternal", "dev/app"):
+                ResolverStats.record_cache_lookup(hit=True)
+            ResolverStats.record_cache_lookup(hit=True)
+
+        stats = {entry["resolver"]: entry for entry in ResolverStats.report()}
+        assert (
+            stats["StackOutput"]["cache_hits"],
+            stats["StackOutput"]["cache_misses"],
+        ) == (
+            1,
+            1,
+        )
+        assert stats["StackOutputExternal"]["cache_hits"] == 1
+        assert stats["StackOutputExternal"]["calls"] == 0
+
+    def test_record_cache_lookup__outside_resolver__is_not_recorded(self):
+        ResolverStats.record_cache_lookup(hit=True)
+
+        assert ResolverStats.report() == []
+
+    def test_clear__drops_stats(self):
+        ResolverStats.record("StackOutput", "dev/app", 1.0)
+        ResolverStats.clear()
+
+        assert ResolverStats.report() == []
+
+    def test_publish__logs_stats_at_debug(self, caplog):
+        ResolverStats.record("StackOutput", "dev/app", 1.0)
+
+        with caplog.at_level(logging.DEBUG, logger="sceptre.resolver_stats"):
+            ResolverStats.publish()
+
+        assert "StackOutput on dev/app: 1 calls" in caplog.text
+
+    def test_publish__report_enabled__writes_report(self, tmp_path):
+        report_path = tmp_path / "reports" / "resolvers.json"
+        ResolverStats.enable_report(str(report_path))
+        ResolverStats.record("StackOutput", "dev/app", 1.0)
+
+        ResolverStats.publish()
+
+        assert json.loads(report_path.read_text()) == {
+            "resolvers": ResolverStats.report(),
+            "imports": [],
+        }
+
+    def test_publish__imports__logs_and_writes_them(self, tmp_path, caplog):
+        report_path = tmp_path / "resolvers.json"
+        ResolverStats.enable_report(str(report_path))
+        imports = [
+            {
+                "sceptre_role_or_profile": "dev",
+                "region": "eu-west-1",
+                "export": "network-VpcId",
+                "stacks": ["dev/app", "dev/db"],
+            }
+        ]
+
+        with caplog.at_level(logging.DEBUG, logger="sceptre.resolver_stats"):
+            ResolverStats.publish(imports)
+
+        assert (
+            "Export network-VpcId in eu-west-1 is imported by dev/app, dev/db"
+            in caplog.text
+        )
+        assert json.loads(report_path.read_text())["imports"] == imports
+
+    def test_publish__report_not_writable__warns(self, tmp_path, caplog):
+        ResolverStats.enable_report(str(tmp_path))
+        ResolverStats.record("StackOutput", "dev/app", 1.0)
+
+        with caplog.at_level(logging.WARNING, logger="sceptre.resolver_stats"):
+            ResolverStats.publish()
+
+        assert "Could not write resolver report" in caplog.text
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import os
 import tempfile
 import pytest
 
+from sceptre.resolvers import Resolver
 from sceptre.resolvers.file_contents import FileContents
 
 
@@ -28,3 +30,22 @@ class TestFileContentsResolver(object):
         with pytest.raises(TypeError):
             self.file_contents_resolver.argument = None
             self.file_contents_resolver.resolve()
+
+    def test_resolve_memoised__file_changes__reads_it_again(self):
+        Resolver.clear_memo()
+        with tempfile.NamedTemporaryFile(mode="w+") as f:
+            f.write("first")
+            f.flush()
+            self.file_contents_resolver.argument = f.name
+            assert self.file_contents_resolver.resolve_memoised() == "first"
+
+            f.seek(0)
+            f.write("second")
+            f.flush()
+            os.utime(f.name, ns=(0, 0))
+            assert self.file_contents_resolver.resolve_memoised() == "second"
+        Resolver.clear_memo()
+
+    def test_memo_key__missing_file__is_none(self):
+        self.file_contents_resolver.argument = "/non_existant_file"
+        assert self.file_contents_resolver.memo_key() is None
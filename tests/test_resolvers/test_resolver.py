@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
-from unittest.mock import call, Mock, sentinel, MagicMock
+from unittest.mock import call, Mock, sentinel, MagicMock, patch
 
 import pytest
 
@@ -88,34 +90,139 @@ class TestResolver(TestCase):
             self.mock_resolver.raise_invalid_argument_error("danger")
 
 
+class CountingResolver(Resolver):
+    deterministic = True
+    resolve_count = 0
+
+    def resolve(self):
+        CountingResolver.resolve_count += 1
+        return {"value": self.argument}
+
+
+class TestResolverMemo(TestCase):
+    def setUp(self):
+        Resolver.clear_memo()
+        CountingResolver.resolve_count = 0
+
+    def tearDown(self):
+        Resolver.clear_memo()
+
+    def test_resolve_memoised__same_argument__resolves_once(self):
+        first = CountingResolver(["a", {"b": 1}], Mock()).resolve_memoised()
+        second = CountingResolver(["a", {"b": 1}], Mock()).resolve_memoised()
+
+        assert first == second == {"value": ["a", {"b": 1}]}
+        assert first is not second
+        assert CountingResolver.resolve_count == 1
+
+    def test_resolve_memoised__different_arguments__resolves_each(self):
+        CountingResolver("a", Mock()).resolve_memoised()
+        CountingResolver("b", Mock()).resolve_memoised()
+        CountingResolver(["a"], Mock()).resolve_memoised()
+
+        assert CountingResolver.resolve_count == 3
+
+    def test_resolve_memoised__different_memo_key__resolves_each(self):
+        resolver = CountingResolver("a", Mock())
+        resolver.resolve_memoised()
+        resolver.memo_key = lambda: "changed"
+        resolver.resolve_memoised()
+
+        assert CountingResolver.resolve_count == 2
+
+    def test_resolve_memoised__not_deterministic__resolves_each_time(self):
+        resolver = CountingResolver("a", Mock())
+        resolver.deterministic = False
+        resolver.resolve_memoised()
+        resolver.resolve_memoised()
+
+        assert CountingResolver.resolve_count == 2
+
+    def test_resolve_memoised__unhashable_argument__resolves_each_time(self):
+        CountingResolver({"a": {"b"}}, Mock()).resolve_memoised()
+        CountingResolver({"a": {"b"}}, Mock()).resolve_memoised()
+
+        assert CountingResolver.resolve_count == 2
+
+    def test_resolve_memoised__resolve_raises__is_not_memoised(self):
+        resolver = CountingResolver("a", Mock())
+        resolver.resolve = Mock(side_effect=[ValueError("boom"), "value"])
+
+        with pytest.raises(ValueError):
+            resolver.resolve_memoised()
+        assert resolver.resolve_memoised() == "value"
+
+    @patch("sceptre.resolvers.ResolverStats.record")
+    def test_resolve_memoised__records_stats(self, mock_record):
+        stack = Mock()
+        stack.name = "my/stack"
+        CountingResolver("a", stack).resolve_memoised()
+        CountingResolver("a", stack).resolve_memoised()
+        resolver = CountingResolver("a", stack)
+        resolver.deterministic = False
+        resolver.resolve_memoised()
+
+        assert [(c[0][0], c[0][1], c[0][3]) for c in mock_record.call_args_list] == [
+            ("CountingResolver", "my/stack", False),
+            ("CountingResolver", "my/stack", True),
+            ("CountingResolver", "my/stack", None),
+        ]
+
+    def test_clear_memo__resolves_again(self):
+        CountingResolver("a", Mock()).resolve_memoised()
+        Resolver.clear_memo()
+        CountingResolver("a", Mock()).resolve_memoised()
+
+        assert CountingResolver.resolve_count == 2
+
+
 class TestCustomYamlTagBase(TestCase):
     def setUp(self):
         self.stack = Mock()
         self.stack.name = "My Stack"
 
-    def test_clone_for_stack__dict_argument_is_cloned(self):
-        arg = {"greeting": "hello"}
+    def test_clone_for_stack__argument_without_resolvers_is_shared(self):
+        arg = {"greetings": [{"French": "bonjour"}]}
+        resolver = MockResolver(arg)
+        clone = resolver.clone_for_stack(self.stack)
+        self.assertIs(clone.argument, arg)
+
+    def test_clone_for_stack__dict_argument_with_resolvers_is_cloned(self):
+        arg = {"greeting": NestedResolver("hello"), "other": "hi"}
         resolver = MockResolver(arg)
         clone = resolver.clone_for_stack(self.stack)
         self.assertIsNot(clone.argument, arg)
+        self.assertEqual(clone.argument, {"greeting": "hello", "other": "hi"})
+        self.assertIsInstance(arg["greeting"], NestedResolver)
 
-    def test_clone_for_stack__list_argument_is_cloned(self):
-        arg = ["hello"]
+    def test_clone_for_stack__list_argument_with_resolvers_is_cloned(self):
+        arg = ["hi", NestedResolver("hello")]
         resolver = MockResolver(arg)
         clone = resolver.clone_for_stack(self.stack)
         self.assertIsNot(clone.argument, arg)
+        self.assertEqual(clone.argument, ["hi", "hello"])
+        self.assertIsInstance(arg[1], NestedResolver)
 
-    def test_clone_for_stack__nested_dict_argument_is_cloned(self):
-        arg = {"greetings": {"French": "bonjour"}}
+    def test_clone_for_stack__nested_dict_argument_is_cloned_only_on_resolver_paths(
+        self,
+    ):
+        arg = {
+            "greetings": {"French": NestedResolver("bonjour")},
+            "farewells": {"French": "au revoir"},
+        }
         resolver = MockResolver(arg)
         clone = resolver.clone_for_stack(None)
         self.assertIsNot(clone.argument["greetings"], arg["greetings"])
+        self.assertIs(clone.argument["farewells"], arg["farewells"])
 
-    def test_clone_for_stack__nested_list_argument_is_cloned(self):
-        arg = [{"French": "bonjour"}]
+    def test_clone_for_stack__nested_list_argument_is_cloned_only_on_resolver_paths(
+        self,
+    ):
+        arg = [{"French": NestedResolver("bonjour")}, {"French": "au revoir"}]
         resolver = MockResolver(arg)
         clone = resolver.clone_for_stack(None)
         self.assertIsNot(clone.argument[0], arg[0])
+        self.assertIs(clone.argument[1], arg[1])
 
     def test_clone_for_stack__nested_resolvers_are_cloned(self):
         arg = {"greetings": {"French": NestedResolver("bonjour")}}
@@ -260,13 +367,33 @@ class TestResolvableContainerPropertyDescriptor:
         expected_calls = [call(self.mock_object)] * 4
         mock_resolver.clone_for_stack.assert_has_calls(expected_calls)
 
+    def test_setting_resolvable_property__shares_values_without_resolvers(self):
+        shared = {"large": ["block"] * 3}
+        value = {"shared": shared, "resolved": [NestedResolver("value")]}
+
+        self.mock_object.resolvable_container_property = value
+        other_object = MockClass()
+        other_object.resolvable_container_property = value
+
+        for obj in (self.mock_object, other_object):
+            assert obj._resolvable_container_property is not value
+            assert obj._resolvable_container_property["shared"] is shared
+        assert self.mock_object.resolvable_container_property == {
+            "shared": shared,
+            "resolved": ["value"],
+        }
+        assert isinstance(
+            other_object._resolvable_container_property["resolved"][0], NestedResolver
+        )
+        assert isinstance(value["resolved"][0], NestedResolver)
+
     def test_getting_resolvable_property_with_none(self):
         self.mock_object._resolvable_container_property = None
         assert self.mock_object.resolvable_container_property is None
 
     def test_getting_resolvable_property_with_nested_lists(self):
         mock_resolver = MagicMock(spec=MockResolver)
-        mock_resolver.resolve.return_value = "Resolved"
+        mock_resolver.resolve_memoised.return_value = "Resolved"
 
         complex_data_structure = [
             "String",
@@ -298,7 +425,7 @@ class TestResolvableContainerPropertyDescriptor:
 
     def test_getting_resolvable_property_with_nested_dictionaries_and_lists(self):
         mock_resolver = MagicMock(spec=MockResolver)
-        mock_resolver.resolve.return_value = "Resolved"
+        mock_resolver.resolve_memoised.return_value = "Resolved"
 
         complex_data_structure = {
             "String": "String",
@@ -364,7 +491,7 @@ class TestResolvableContainerPropertyDescriptor:
 
     def test_getting_resolvable_property_with_nested_dictionaries(self):
         mock_resolver = MagicMock(spec=MockResolver)
-        mock_resolver.resolve.return_value = "Resolved"
+        mock_resolver.resolve_memoised.return_value = "Resolved"
 
         complex_data_structure = {
             "String": "String",
@@ -607,6 +734,98 @@ class TestResolvableContainerPropertyDescriptor:
             "resolver": create_placeholder_value(resolver, PlaceholderType.alphanum)
         }
 
+    def test_get__different_stacks__resolve_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        class WaitingResolver(Resolver):
+            def resolve(self):
+                # Both Stacks have to be resolving at once for the barrier to be passed.
+                barrier.wait()
+                return "resolved"
+
+        other_object = MockClass()
+        for obj in (self.mock_object, other_object):
+            obj.resolvable_container_property = {"resolver": WaitingResolver()}
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(getattr, obj, "resolvable_container_property")
+                for obj in (self.mock_object, other_object)
+            ]
+            results = [future.result() for future in futures]
+
+        assert results == [{"resolver": "resolved"}] * 2
+
+    def test_get__io_bound_resolvers__resolve_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        class WaitingResolver(Resolver):
+            io_bound = True
+
+            def resolve(self):
+                barrier.wait()
+                return self.argument
+
+        self.mock_object.resolvable_container_property = {
+            "a": WaitingResolver("a"),
+            "b": [WaitingResolver(None), WaitingResolver("b")],
+        }
+
+        assert self.mock_object.resolvable_container_property == {
+            "a": "a",
+            "b": ["b"],
+        }
+
+    def test_get__resolver_with_io_bound_argument__is_io_bound(self):
+        class IoBoundResolver(Resolver):
+            io_bound = True
+
+            def resolve(self):
+                pass
+
+        assert ResolvableContainerProperty._is_io_bound(
+            NestedResolver({"nested": [IoBoundResolver()]})
+        )
+        assert not ResolvableContainerProperty._is_io_bound(
+            NestedResolver({"nested": [NestedResolver()]})
+        )
+
+    def test_get__io_bound_resolver_references_same_property__resolves_it_later(self):
+        class MyResolver(Resolver):
+            io_bound = True
+
+            def resolve(self):
+                if self.argument is None:
+                    return self.stack.resolvable_container_property["other"]
+                return self.argument
+
+        self.mock_object.resolvable_container_property = {
+            "other": MyResolver("abc"),
+            "resolver": MyResolver(None),
+        }
+
+        assert self.mock_object.resolvable_container_property == {
+            "other": "abc",
+            "resolver": "abc",
+        }
+
+    def test_get__io_bound_resolver_raises__raises_error(self):
+        class ErroringResolver(Resolver):
+            io_bound = True
+
+            def resolve(self):
+                if self.argument:
+                    raise ValueError(self.argument)
+                return "value"
+
+        self.mock_object.resolvable_container_property = {
+            "a": ErroringResolver(None),
+            "b": ErroringResolver("error"),
+        }
+
+        with pytest.raises(ValueError, match="error"):
+            self.mock_object.resolvable_container_property
+
 
 class TestResolvableValueProperty:
     def setup_method(self, test_method):
@@ -636,7 +855,8 @@ class TestResolvableValueProperty:
         resolver = Mock(spec=MockResolver)
         self.mock_object._resolvable_value_property = resolver
         assert (
-            self.mock_object.resolvable_value_property == resolver.resolve.return_value
+            self.mock_object.resolvable_value_property
+            == resolver.resolve_memoised.return_value
         )
 
     def test_get__resolver__updates_set_value_with_resolved_value(self):
@@ -644,7 +864,8 @@ class TestResolvableValueProperty:
         self.mock_object._resolvable_value_property = resolver
         self.mock_object.resolvable_value_property
         assert (
-            self.mock_object._resolvable_value_property == resolver.resolve.return_value
+            self.mock_object._resolvable_value_property
+            == resolver.resolve_memoised.return_value
         )
 
     def test_get__resolver__resolver_attempts_to_access_resolver__raises_recursive_resolve(
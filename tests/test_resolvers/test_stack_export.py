@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from unittest.mock import MagicMock
+
+from sceptre.connection_manager import ConnectionManager
+from sceptre.exceptions import ExportDoesNotExistError, SceptreException
+from sceptre.export_cache import StackExportCache
+from sceptre.resolvers.stack_export import StackExport
+from sceptre.stack import Stack
+
+
+class TestStackExportResolver(object):
+    def setup_method(self, test_method):
+        StackExportCache.clear()
+        self.stack = MagicMock(spec=Stack)
+        self.stack.name = "my/stack"
+        self.connection_manager = MagicMock(spec=ConnectionManager)
+        self.connection_manager.get_call_settings.side_effect = (
+            lambda profile, region, sceptre_role: (
+                profile or "default_profile",
+                region or "default_region",
+                sceptre_role,
+            )
+        )
+        self.connection_manager.call.return_value = {
+            "Exports": [
+                {"Name": "network-VpcId", "Value": "vpc-123"},
+                {"Name": "network-SubnetId", "Value": "subnet-123"},
+            ]
+        }
+        self.stack.connection_manager = self.connection_manager
+
+    def teardown_method(self, test_method):
+        StackExportCache.clear()
+
+    def test_resolve(self):
+        resolver = StackExport("network-VpcId", self.stack)
+
+        assert resolver.resolve() == "vpc-123"
+        self.connection_manager.call.assert_called_once_with(
+            service="cloudformation",
+            command="list_exports",
+            kwargs={},
+            profile="default_profile",
+            region="default_region",
+            sceptre_role=None,
+        )
+
+    def test_resolve__many_exports__lists_them_once(self):
+        assert StackExport("network-VpcId", self.stack).resolve() == "vpc-123"
+        assert StackExport("network-SubnetId", self.stack).resolve() == "subnet-123"
+
+        assert self.connection_manager.call.call_count == 1
+
+    def test_resolve__paginated__follows_next_token(self):
+        self.connection_manager.call.side_effect = [
+            {
+                "Exports": [{"Name": "first", "Value": "1"}],
+                "NextToken": "token",
+            },
+            {"Exports": [{"Name": "second", "Value": "2"}]},
+        ]
+
+        assert StackExport("second", self.stack).resolve() == "2"
+        kwargs = [
+            call[1]["kwargs"] for call in self.connection_manager.call.call_args_list
+        ]
+        assert kwargs == [{"NextToken": "token"}, {"NextToken": "token"}]
+
+    def test_resolve_with_args(self):
+        resolver = StackExport("network-VpcId profile::region::role", self.stack)
+
+        resolver.resolve()
+
+        self.connection_manager.get_call_settings.assert_called_once_with(
+            "profile", "region", sceptre_role="role"
+        )
+        self.connection_manager.call.assert_called_once_with(
+            service="cloudformation",
+            command="list_exports",
+            kwargs={},
+            profile="profile",
+            region="region",
+            sceptre_role="role",
+        )
+
+    def test_resolve__different_region__lists_again(self):
+        StackExport("network-VpcId", self.stack).resolve()
+        StackExport("network-VpcId profile::us-east-1", self.stack).resolve()
+
+        assert self.connection_manager.call.call_count == 2
+
+    def test_resolve__records_importing_stack(self):
+        StackExport("network-VpcId", self.stack).resolve()
+
+        key = StackExportCache.key("default_profile", "default_region", None)
+        assert StackExportCache.get_importers(key, "network-VpcId") == {"my/stack"}
+        other_region = StackExportCache.key("default_profile", "us-east-1", None)
+        assert StackExportCache.get_importers(other_region, "network-VpcId") == set()
+
+    def test_resolve__missing_export__raises(self):
+        with pytest.raises(ExportDoesNotExistError, match="missing"):
+            StackExport("missing", self.stack).resolve()
+
+    @pytest.mark.parametrize(
+        "argument",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("name profile extra", id="too many args"),
+            pytest.param("name a::b::c::d", id="too many settings"),
+        ],
+    )
+    def test_resolve__badly_formatted__raises(self, argument):
+        with pytest.raises(SceptreException):
+            StackExport(argument, self.stack).resolve()
@@ -10,6 +10,7 @@ from sceptre.exceptions import SceptreException
 from botocore.exceptions import ClientError
 
 from sceptre.connection_manager import ConnectionManager
+from sceptre.output_cache import StackOutputCache
 from sceptre.resolvers.stack_output import (
     StackOutput,
     StackOutputExternal,
@@ -168,6 +169,40 @@ class TestStackOutputResolver(object):
             sceptre_role="dependency_sceptre_role",
         )
 
+    @pytest.mark.parametrize(
+        "sceptre_role, expected_role",
+        [
+            ("dependency_sceptre_role", "dependency_sceptre_role"),
+            (StackOutputExternal("role-stack::Arn"), None),
+        ],
+    )
+    def test_prefetch_target(self, sceptre_role, expected_role):
+        stack = MagicMock(spec=Stack)
+        stack.name = "my/stack"
+        stack.dependencies = []
+
+        dependency = MagicMock()
+        dependency.project_code = "meh"
+        dependency.name = "account/dev/vpc"
+        dependency.profile = "dependency_profile"
+        dependency.region = "dependency_region"
+        dependency._sceptre_role = sceptre_role
+
+        stack_output_resolver = StackOutput("account/dev/vpc.yaml::VpcId", stack)
+        stack_output_resolver.setup()
+        stack.dependencies = [dependency]
+
+        target = stack_output_resolver.prefetch_target()
+        if expected_role is None:
+            assert target is None
+        else:
+            assert target == (
+                "meh-account-dev-vpc",
+                "dependency_profile",
+                "dependency_region",
+                "dependency_sceptre_role",
+            )
+
 
 class TestStackOutputExternalResolver(object):
     @patch("sceptre.resolvers.stack_output.StackOutputExternal._get_output_value")
@@ -217,6 +252,29 @@ class TestStackOutputExternalResolver(object):
         )
         assert stack.dependencies == []
 
+    def test_prefetch_target(self):
+        stack = MagicMock(spec=Stack)
+        stack.name = "my/stack"
+        stack_output_external_resolver = StackOutputExternal(
+            "another/account-vpc::VpcId profile::region", stack
+        )
+
+        assert stack_output_external_resolver.prefetch_target() == (
+            "another/account-vpc",
+            "profile",
+            "region",
+            None,
+        )
+
+    def test_prefetch_target__argument_with_resolvers__returns_none(self):
+        stack = MagicMock(spec=Stack)
+        stack.name = "my/stack"
+        stack_output_external_resolver = StackOutputExternal(
+            [StackOutputExternal("another/stack::Name")], stack
+        )
+
+        assert stack_output_external_resolver.prefetch_target() is None
+
 
 class MockStackOutputBase(StackOutputBase):
     """
@@ -239,6 +297,10 @@ class TestStackOutputBaseResolver(object):
         self.stack.name = "my/stack.yaml"
         self.stack._connection_manager = MagicMock(spec=ConnectionManager)
         self.base_stack_output_resolver = MockStackOutputBase(None, self.stack)
+        StackOutputCache.clear()
+
+    def teardown_method(self, test_method):
+        StackOutputCache.clear()
 
     @patch("sceptre.resolvers.stack_output.StackOutputBase._get_stack_outputs")
     def test_get_output_value_with_valid_key(self, mock_get_stack_outputs):
@@ -259,6 +321,41 @@ class TestStackOutputBaseResolver(object):
                 sentinel.stack_name, "invalid_key"
             )
 
+    @patch("sceptre.resolvers.stack_output.StackOutputBase._fetch_stack_outputs")
+    def test_get_stack_outputs__shared_between_resolvers(
+        self, mock_fetch_stack_outputs
+    ):
+        mock_fetch_stack_outputs.return_value = {"key": "value"}
+        self.stack.connection_manager.get_call_settings.return_value = (
+            "profile",
+            "eu-west-1",
+            None,
+        )
+        other_resolver = MockStackOutputBase(None, self.stack)
+
+        first = self.base_stack_output_resolver._get_stack_outputs("prj-vpc")
+        second = other_resolver._get_stack_outputs("prj-vpc")
+
+        assert first == second == {"key": "value"}
+        mock_fetch_stack_outputs.assert_called_once_with("prj-vpc", None, None, None)
+
+    @patch("sceptre.resolvers.stack_output.StackOutputBase._fetch_stack_outputs")
+    def test_get_stack_outputs__different_region__fetches_again(
+        self, mock_fetch_stack_outputs
+    ):
+        mock_fetch_stack_outputs.return_value = {"key": "value"}
+        self.stack.connection_manager.get_call_settings.side_effect = [
+            ("profile", "eu-west-1", None),
+            ("profile", "us-east-1", None),
+        ]
+
+        self.base_stack_output_resolver._get_stack_outputs("prj-vpc")
+        self.base_stack_output_resolver._get_stack_outputs(
+            "prj-vpc", region="us-east-1"
+        )
+
+        assert mock_fetch_stack_outputs.call_count == 2
+
     def test_get_stack_outputs_with_valid_stack(self):
         self.stack.connection_manager.call.return_value = {
             "Stacks": [
@@ -279,7 +376,7 @@ class TestStackOutputBaseResolver(object):
             ]
         }
 
-        response = self.base_stack_output_resolver._get_stack_outputs(
+        response = self.base_stack_output_resolver._fetch_stack_outputs(
             sentinel.stack_name
         )
 
@@ -288,7 +385,7 @@ class TestStackOutputBaseResolver(object):
     def test_get_stack_outputs_with_valid_stack_without_outputs(self):
         self.stack.connection_manager.call.return_value = {"Stacks": [{}]}
 
-        response = self.base_stack_output_resolver._get_stack_outputs(
+        response = self.base_stack_output_resolver._fetch_stack_outputs(
             sentinel.stack_name
         )
         assert response == {}
@@ -300,7 +397,7 @@ class TestStackOutputBaseResolver(object):
         )
 
         with pytest.raises(StackDoesNotExistError):
-            self.base_stack_output_resolver._get_stack_outputs(sentinel.stack_name)
+            self.base_stack_output_resolver._fetch_stack_outputs(sentinel.stack_name)
 
     def test_get_stack_outputs_with_unkown_boto_error(self):
         self.stack.connection_manager.call.side_effect = ClientError(
@@ -308,4 +405,4 @@ class TestStackOutputBaseResolver(object):
         )
 
         with pytest.raises(ClientError):
-            self.base_stack_output_resolver._get_stack_outputs(sentinel.stack_name)
+            self.base_stack_output_resolver._fetch_stack_outputs(sentinel.stack_name)
@@ -260,6 +260,60 @@ class TestStack(object):
             ")"
         )
 
+    def test_eq__same_name__is_equal_with_same_hash(self):
+        first = stack_factory(region="eu-west-1")
+        second = stack_factory(name="dev\\app\\stack", region="us-east-1")
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    def test_eq__different_name__is_not_equal(self):
+        assert stack_factory() != stack_factory(name="dev/app/other")
+        assert hash(stack_factory()) != hash(stack_factory(name="dev/app/other"))
+
+    def test_eq__not_a_stack__is_not_equal(self):
+        assert stack_factory() != "dev/app/stack"
+
+    def test_eq__long_dependency_chains__does_not_compare_dependencies(self):
+        def chain(length):
+            stack = None
+            for index in range(length):
+                stack = Stack(
+                    name=str(index),
+                    project_code="project",
+                    region="eu-west-1",
+                    template_handler_config={"type": "file", "path": "template.yaml"},
+                    dependencies=[stack] if stack else [],
+                )
+            return stack
+
+        assert chain(5000) == chain(5000)
+
+    def test_structurally_equal__same_config__is_true(self):
+        dependency = stack_factory(name="dev/vpc")
+
+        assert stack_factory(dependencies=[dependency]).structurally_equal(
+            stack_factory(dependencies=[stack_factory(name="dev/vpc")])
+        )
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            pytest.param({"region": sentinel.other_region}, id="region"),
+            pytest.param({"protected": True}, id="protected"),
+            pytest.param(
+                {"dependencies": [stack_factory(name="dev/other")]}, id="dependencies"
+            ),
+        ],
+    )
+    def test_structurally_equal__different_config__is_false(self, changes):
+        stack = stack_factory()
+        other = stack_factory(**changes)
+
+        assert stack == other
+        assert not stack.structurally_equal(other)
+
     def test_configuration_manager__sceptre_role_raises_recursive_resolve__returns_connection_manager_with_no_role(
         self,
     ):
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import Mock
+
+import pytest
+
+from sceptre.plan.status_poller import IN_PROGRESS_STATUSES, StackStatusPoller
+
+
+class TestStackStatusPoller(object):
+    def setup_method(self, test_method):
+        self.connection_manager = Mock(
+            region="eu-west-1", profile="dev", sceptre_role=None
+        )
+        self.connection_manager.call.return_value = {
+            "StackSummaries": [
+                {"StackName": "prj-vpc", "StackStatus": "CREATE_IN_PROGRESS"},
+                {"StackName": "prj-app", "StackStatus": "UPDATE_IN_PROGRESS"},
+            ]
+        }
+
+    def teardown_method(self, test_method):
+        assert StackStatusPoller._pollers == {}
+
+    def test_watch__same_connection_settings__shares_poller(self):
+        other_connection_manager = Mock(
+            region="eu-west-1", profile="dev", sceptre_role=None
+        )
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as first:
+            with StackStatusPoller.watch(other_connection_manager, "prj-app") as second:
+                assert first is second
+
+    def test_watch__different_region__uses_separate_poller(self):
+        other_connection_manager = Mock(
+            region="us-east-1", profile="dev", sceptre_role=None
+        )
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as first:
+            with StackStatusPoller.watch(other_connection_manager, "prj-app") as second:
+                assert first is not second
+
+    def test_get_status__single_watched_stack__returns_none(self):
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as poller:
+            assert poller.get_status("prj-vpc") is None
+
+        self.connection_manager.call.assert_not_called()
+
+    def test_get_status__shares_one_listing_between_stacks(self):
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as poller:
+            with StackStatusPoller.watch(self.connection_manager, "prj-app"):
+                assert poller.get_status("prj-vpc") == "CREATE_IN_PROGRESS"
+                assert poller.get_status("prj-app") == "UPDATE_IN_PROGRESS"
+
+        self.connection_manager.call.assert_called_once_with(
+            service="cloudformation",
+            command="list_stacks",
+            kwargs={"StackStatusFilter": IN_PROGRESS_STATUSES},
+        )
+
+    def test_get_status__stack_not_in_progress__returns_none(self):
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as poller:
+            with StackStatusPoller.watch(self.connection_manager, "prj-db"):
+                assert poller.get_status("prj-db") is None
+
+    def test_get_status__stale_snapshot__lists_again(self):
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as poller:
+            with StackStatusPoller.watch(self.connection_manager, "prj-app"):
+                poller.max_age = 0
+                poller.get_status("prj-vpc")
+                poller.get_status("prj-app")
+
+        assert self.connection_manager.call.call_count == 2
+
+    def test_get_status__follows_pagination(self):
+        self.connection_manager.call.side_effect = [
+            {
+                "StackSummaries": [
+                    {"StackName": "prj-vpc", "StackStatus": "CREATE_IN_PROGRESS"}
+                ],
+                "NextToken": "token",
+            },
+            {
+                "StackSummaries": [
+                    {"StackName": "prj-app", "StackStatus": "DELETE_IN_PROGRESS"}
+                ]
+            },
+        ]
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as poller:
+            with StackStatusPoller.watch(self.connection_manager, "prj-app"):
+                assert poller.get_status("prj-app") == "DELETE_IN_PROGRESS"
+
+        assert self.connection_manager.call.call_args.kwargs["kwargs"] == {
+            "StackStatusFilter": IN_PROGRESS_STATUSES,
+            "NextToken": "token",
+        }
+
+    def test_get_status__listing_fails__next_call_retries(self):
+        self.connection_manager.call.side_effect = [
+            ValueError("boom"),
+            self.connection_manager.call.return_value,
+        ]
+        with StackStatusPoller.watch(self.connection_manager, "prj-vpc") as poller:
+            with StackStatusPoller.watch(self.connection_manager, "prj-app"):
+                with pytest.raises(ValueError):
+                    poller.get_status("prj-vpc")
+                assert poller.get_status("prj-vpc") == "CREATE_IN_PROGRESS"